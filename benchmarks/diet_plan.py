@@ -0,0 +1,94 @@
+"""
+Benchmark for the diet plan solvers: the greedy fallback versus the integer program (with SciPy
+installed), comparing solve time and how far the plans are from their targets.
+
+Usage:
+    python -m benchmarks.diet_plan [candidate foods] [profiles]
+"""
+import os
+import random
+import sys
+from time import perf_counter
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DB_URL", "sqlite+aiosqlite:///:memory:")
+
+from src.core import settings  # noqa: E402
+from src.core.enums import DietGoal  # noqa: E402
+from src.core.planner import (  # noqa: E402
+    MILP_AVAILABLE,
+    PlanProblem,
+    compute_targets,
+    plan_deviation,
+    solve_plan
+)
+
+FOODS = 300
+PROFILES = 10
+
+
+def make_food() -> tuple[float, ...]:
+    proteins, fats, carbohydrates = (random.uniform(0, 30), random.uniform(0, 20), random.uniform(0, 60))
+    return (proteins * 4 + fats * 9 + carbohydrates * 4, proteins, fats, carbohydrates)
+
+
+def make_problem(foods: int, budget: float | None) -> PlanProblem:
+    targets = compute_targets(
+        weight=random.uniform(50, 110),
+        height=random.uniform(150, 195),
+        age=random.randint(18, 70),
+        gender=random.choice(["M", "F", None]),
+        goal=random.choice(list(DietGoal)),
+    )
+    return PlanProblem(
+        targets=targets,
+        foods=tuple(make_food() for _ in range(foods)),
+        prices=tuple(random.uniform(0.3, 5) for _ in range(foods)),
+        budget=budget,
+        max_portions=settings.DIET_PLAN_MAX_PORTIONS,
+        max_foods=settings.DIET_PLAN_MAX_FOODS,
+        time_limit=settings.DIET_PLAN_TIME_LIMIT,
+    )
+
+
+def measure(label: str, problems: list[PlanProblem], use_milp: bool) -> None:
+    elapsed = 0.0
+    deviations = []
+
+    for problem in problems:
+        started = perf_counter()
+        solution = solve_plan(problem, use_milp=use_milp)
+        elapsed += perf_counter() - started
+
+        totals = [
+            sum(portions * food[index] for portions, food in zip(solution.portions, problem.foods))
+            for index in range(len(problem.targets))
+        ]
+        deviations.append(plan_deviation(problem.targets, totals))
+
+    print(
+        f"{label:<24} {elapsed / len(problems) * 1000:>9.1f} ms/plan"
+        f"  mean deviation {sum(deviations) / len(deviations):.3f}  worst {max(deviations):.3f}"
+    )
+
+
+def main(foods: int, profiles: int) -> None:
+    random.seed(1)
+
+    for budget in (None, 15.0):
+        problems = [make_problem(foods, budget) for _ in range(profiles)]
+        print(f"{foods} foods, {profiles} profiles, budget {budget}")
+        measure("greedy", problems, use_milp=False)
+
+        if MILP_AVAILABLE:
+            measure("integer program", problems, use_milp=True)
+        else:
+            print("SciPy is not installed, install the 'nutrition' extra to measure the integer program")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else FOODS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else PROFILES,
+    )
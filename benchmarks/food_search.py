@@ -0,0 +1,102 @@
+"""
+Benchmark for the food search: a LIKE '%...%' scan of foods.name versus the FTS5 index
+(cold cache), the fuzzy fallback and the hot query cache.
+
+Usage:
+    python -m benchmarks.food_search [foods]
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime
+from time import perf_counter
+
+DB_DIRECTORY = tempfile.TemporaryDirectory(prefix="food-search-benchmark-")
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DB_URL", f"sqlite+aiosqlite:///{DB_DIRECTORY.name}/benchmark.db")
+os.environ.setdefault("SLOW_QUERY_THRESHOLD", "0")
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from src.core import id_generator  # noqa: E402
+from src.db import db, food_search_cache  # noqa: E402
+from src.db.migrations import MIGRATIONS, Migrator  # noqa: E402
+from src.db.models import FoodModel  # noqa: E402
+from src.services import FoodSearchService  # noqa: E402
+
+FOODS = 20000
+BASES = [
+    "Arroz", "Feijão", "Pão", "Maçã", "Banana", "Frango", "Carne", "Peixe", "Ovo", "Leite", "Queijo",
+    "Iogurte", "Batata", "Mandioca", "Açúcar", "Café", "Milho", "Aveia", "Tomate", "Alface", "Cenoura",
+]
+QUALIFIERS = [
+    "Branco", "Integral", "Cozido", "Grelhado", "Assado", "Frito", "Cru", "Doce", "Light", "Orgânico",
+    "Francês", "de Forma", "Desnatado", "Integral", "Caseiro", "Temperado", "com Sal", "sem Açúcar",
+]
+PREFIX_QUERIES = ["ar", "arr", "arroz int", "fei", "feijao", "pao", "pao de", "maca", "acucar", "frango gre"]
+FUZZY_QUERIES = ["arros", "fejao", "frnago", "batatta", "mandioka"]
+
+
+def make_name(index: int) -> str:
+    return f"{random.choice(BASES)} {random.choice(QUALIFIERS)} {random.choice(QUALIFIERS)} {index}"
+
+
+async def seed(foods: int) -> None:
+    now = datetime.now()
+    rows = [
+        {"id": id_generator(), "name": make_name(index), "quantity": 100, "calories": 100, "proteins": 5,
+         "fats": 2, "carbohydrates": 10, "consumption_date": now, "type": "lunch"}
+        for index in range(foods)
+    ]
+
+    async with db.engine.begin() as conn:
+        await conn.execute(insert(FoodModel), rows)
+
+
+async def like_scan(session, query: str) -> list:
+    result = await session.execute(
+        select(FoodModel.id, FoodModel.name).where(FoodModel.name.ilike(f"%{query}%")).limit(10)
+    )
+    return result.all()
+
+
+async def measure(label: str, search, queries: list[str], rounds: int, clear_cache: bool = False) -> None:
+    elapsed = 0.0
+    number = 0
+
+    for _ in range(rounds):
+        for query in queries:
+            if clear_cache:
+                await food_search_cache.clear()
+
+            started = perf_counter()
+            await search(query)
+            elapsed += perf_counter() - started
+            number += 1
+
+    print(f"{label:<24} {elapsed / number * 1000:>8.3f} ms/search  {number / elapsed:>10.1f} searches/s")
+
+
+async def main(foods: int) -> None:
+    random.seed(1)
+    await Migrator(db, MIGRATIONS).upgrade()
+    await seed(foods)
+    print(f"{foods} foods")
+
+    async with db.async_session() as session:
+        service = FoodSearchService(session)
+
+        await measure("LIKE '%...%' scan", lambda query: like_scan(session, query), PREFIX_QUERIES, 5)
+        await measure("FTS5 prefix (cold)", service.search, PREFIX_QUERIES, 5, clear_cache=True)
+        await measure("FTS5 fuzzy (cold)", service.search, FUZZY_QUERIES, 5, clear_cache=True)
+        await measure("hot query cache", service.search, PREFIX_QUERIES + FUZZY_QUERIES, 200)
+
+    await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else FOODS))
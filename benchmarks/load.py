@@ -0,0 +1,358 @@
+"""
+Load test harness: boots the application in-process against a fresh local database, seeds it,
+replays a weighted traffic mix and reports throughput and latency percentiles per endpoint.
+
+Requests go through httpx's ASGI transport, so the numbers cover the application, its
+middleware and the database, without network or server overhead. Set DB_URL to another
+database (e.g. a local Postgres) to benchmark it instead of a temporary SQLite file; its tables
+are migrated but not emptied.
+
+Usage:
+    python -m benchmarks.load [--requests N] [--concurrency N] [--mix signup=5,login=10,me=60,list=25]
+                              [--users N] [--diets N] [--meals N] [--trains N]
+                              [--save FILE] [--baseline FILE] [--tolerance 0.25]
+
+--save writes the results as a JSON baseline. --baseline compares against one and exits with
+status 1 when an endpoint's p95 latency grew, or its throughput dropped, by more than the tolerance.
+
+Latencies depend on the machine, so baselines are not versioned: record one on the machine that
+runs the comparison, from the commit being compared against, e.g.
+
+    git switch main && make benchmark-baseline
+    git switch - && make benchmark
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+
+# Removed when the interpreter exits.
+DB_DIRECTORY = tempfile.TemporaryDirectory(prefix="load-benchmark-")
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DB_URL", f"sqlite+aiosqlite:///{DB_DIRECTORY.name}/benchmark.db")
+# Cheap hashes and no login limits: every request comes from the same client address.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("LOGIN_RATE_LIMIT_PER_IP", "0")
+os.environ.setdefault("LOGIN_RATE_LIMIT_PER_EMAIL", "0")
+os.environ.setdefault("SLOW_QUERY_THRESHOLD", "0")
+# The first seeded user lists the users, an endpoint restricted to administrators.
+os.environ.setdefault("ADMIN_EMAILS", '["seed0@example.com"]')
+
+import httpx  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from src.api import app  # noqa: E402
+from src.core import SecurityHandler, id_generator, settings  # noqa: E402
+from src.db import db  # noqa: E402
+from src.db.migrations import MIGRATIONS, Migrator  # noqa: E402
+from src.db.models import (  # noqa: E402
+    DietModel,
+    ExerciseModel,
+    FoodModel,
+    MealModel,
+    TrainModel,
+    UserModel,
+)
+
+PASSWORD = "benchmark-password"
+SEED_BATCH_SIZE = 1000
+DEFAULT_MIX = "signup=5,login=10,me=60,list=25"
+
+
+def batches(rows: list[dict]):
+    for start in range(0, len(rows), SEED_BATCH_SIZE):
+        yield rows[start:start + SEED_BATCH_SIZE]
+
+
+async def seed(users: int, diets: int, meals: int, trains: int) -> list[dict]:
+    """
+    Inserts the benchmark data with batched executemany statements.
+
+    Args:
+        users (int): The number of users.
+        diets (int): The number of diets per user.
+        meals (int): The number of meals per diet.
+        trains (int): The number of trains per user.
+
+    Returns:
+        list[dict]: The id and email of every seeded user.
+    """
+    password = SecurityHandler.hash_password(PASSWORD, settings.BCRYPT_ROUNDS)
+    now = datetime.now()
+
+    user_rows = [
+        {"id": id_generator(), "name": f"Usuário {index}", "email": f"seed{index}@example.com",
+         "password": password, "created_at": now - timedelta(seconds=index)}
+        for index in range(users)
+    ]
+    food_rows = [
+        {"id": id_generator(), "name": f"Alimento {index}", "quantity": 100, "calories": 50 + index,
+         "proteins": 5, "fats": 2, "carbohydrates": 10, "consumption_date": now, "type": "lunch"}
+        for index in range(50)
+    ]
+    exercise_rows = [
+        {"id": id_generator(), "name": f"Exercício {index}", "series": 3, "repetitions": "12",
+         "muscle_group": "legs"}
+        for index in range(20)
+    ]
+    diet_rows = [
+        {"id": id_generator(), "user_id": user["id"], "date": now - timedelta(days=day),
+         "total_calories": 2000, "total_proteins": 100, "total_fats": 70,
+         "total_carbohydrates": 250, "total_water": 2}
+        for user in user_rows for day in range(diets)
+    ]
+    meal_rows = [
+        {"id": id_generator(), "diet_id": diet["id"], "food_id": random.choice(food_rows)["id"],
+         "type": "lunch"}
+        for diet in diet_rows for _ in range(meals)
+    ]
+    train_rows = [
+        {"id": id_generator(), "user_id": user["id"], "exercise_id": random.choice(exercise_rows)["id"],
+         "date": now - timedelta(days=day), "duration": 45}
+        for user in user_rows for day in range(trains)
+    ]
+
+    async with db.engine.begin() as conn:
+        for model, rows in (
+            (UserModel, user_rows),
+            (FoodModel, food_rows),
+            (ExerciseModel, exercise_rows),
+            (DietModel, diet_rows),
+            (MealModel, meal_rows),
+            (TrainModel, train_rows),
+        ):
+            for batch in batches(rows):
+                await conn.execute(insert(model), batch)
+
+    print(
+        f"seeded {len(user_rows)} users, {len(diet_rows)} diets, {len(meal_rows)} meals, "
+        f"{len(train_rows)} trains"
+    )
+    return [{"id": row["id"], "email": row["email"]} for row in user_rows]
+
+
+class Traffic:
+    """
+    Traffic holds the state shared by the scenarios: the seeded users and their tokens.
+
+    The list scenario is sent by the users of settings.ADMIN_EMAILS, so at least one of them must be seeded.
+    """
+    def __init__(self, users: list[dict]) -> None:
+        self.users = users
+        self.tokens = [SecurityHandler.create_jwt_token({"sub": user["id"]}) for user in users]
+        self.admin_tokens = [
+            token for user, token in zip(users, self.tokens) if user["email"] in settings.ADMIN_EMAILS
+        ]
+        self.signups = 0
+
+    def auth_headers(self) -> dict:
+        return {"Authorization": f"Bearer {random.choice(self.tokens)}"}
+
+    def admin_headers(self) -> dict:
+        return {"Authorization": f"Bearer {random.choice(self.admin_tokens)}"}
+
+    async def signup(self, client: httpx.AsyncClient) -> httpx.Response:
+        self.signups += 1
+        email = f"load{self.signups}-{id_generator()[:8]}@example.com"
+        return await client.post("/user/", json={"name": "Load", "email": email, "password": PASSWORD})
+
+    async def login(self, client: httpx.AsyncClient) -> httpx.Response:
+        user = random.choice(self.users)
+        return await client.post("/user/login", json={"email": user["email"], "password": PASSWORD})
+
+    async def me(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get("/user/", headers=self.auth_headers())
+
+    async def list_users(self, client: httpx.AsyncClient) -> httpx.Response:
+        return await client.get("/user/list", params={"limit": 50}, headers=self.admin_headers())
+
+
+SCENARIOS = {
+    "signup": Traffic.signup,
+    "login": Traffic.login,
+    "me": Traffic.me,
+    "list": Traffic.list_users,
+}
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    weights = {}
+
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+
+        if name not in SCENARIOS:
+            raise SystemExit(f"Unknown scenario {name!r}, expected one of {sorted(SCENARIOS)}")
+
+        weights[name] = float(weight)
+
+    return weights
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(fraction * (len(values) - 1))))]
+
+
+async def replay(traffic: Traffic, weights: dict[str, float], requests: int, concurrency: int) -> dict:
+    """
+    Sends the weighted traffic mix with a fixed number of concurrent clients.
+
+    Args:
+        traffic (Traffic): The scenarios and their state.
+        weights (dict[str, float]): The relative weight of each scenario.
+        requests (int): The total number of requests.
+        concurrency (int): The number of requests in flight at a time.
+
+    Returns:
+        dict: Per scenario: count, errors, throughput and p50/p95/p99 latencies in milliseconds.
+    """
+    plan = random.choices(list(weights), weights=list(weights.values()), k=requests)
+    latencies: dict[str, list[float]] = {name: [] for name in weights}
+    errors: dict[str, int] = {name: 0 for name in weights}
+    position = 0
+
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        async def worker() -> None:
+            nonlocal position
+
+            while position < len(plan):
+                name = plan[position]
+                position += 1
+
+                started_at = perf_counter()
+                response = await SCENARIOS[name](traffic, client)
+                latencies[name].append(perf_counter() - started_at)
+
+                if response.status_code >= 400:
+                    errors[name] += 1
+
+        started_at = perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = perf_counter() - started_at
+
+    results = {
+        name: {
+            "count": len(values),
+            "errors": errors[name],
+            "throughput": len(values) / elapsed,
+            "p50_ms": percentile(values, 0.50) * 1000,
+            "p95_ms": percentile(values, 0.95) * 1000,
+            "p99_ms": percentile(values, 0.99) * 1000,
+        }
+        for name, values in latencies.items()
+    }
+    results["total"] = {
+        "count": requests,
+        "errors": sum(errors.values()),
+        "throughput": requests / elapsed,
+        "p50_ms": percentile([v for values in latencies.values() for v in values], 0.50) * 1000,
+        "p95_ms": percentile([v for values in latencies.values() for v in values], 0.95) * 1000,
+        "p99_ms": percentile([v for values in latencies.values() for v in values], 0.99) * 1000,
+    }
+    return results
+
+
+def report(results: dict) -> None:
+    print(f"{'endpoint':<10} {'count':>7} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+
+    for name, stats in results.items():
+        print(
+            f"{name:<10} {stats['count']:>7} {stats['errors']:>7} {stats['throughput']:>9.1f} "
+            f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}"
+        )
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """
+    Compares results with a baseline.
+
+    Args:
+        results (dict): The results of this run.
+        baseline (dict): The results of the baseline run.
+        tolerance (float): The accepted relative regression, e.g. 0.25 for 25%.
+
+    Returns:
+        list[str]: A description of every regression found.
+    """
+    regressions = []
+
+    for name, stats in results.items():
+        expected = baseline.get(name)
+
+        if expected is None:
+            continue
+
+        if stats["p95_ms"] > expected["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {expected['p95_ms']:.2f} ms -> {stats['p95_ms']:.2f} ms")
+
+        if stats["throughput"] < expected["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {expected['throughput']:.1f} -> {stats['throughput']:.1f} req/s"
+            )
+
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> int:
+    random.seed(args.seed)
+    await Migrator(db, MIGRATIONS).upgrade()
+    users = await seed(args.users, args.diets, args.meals, args.trains)
+    traffic = Traffic(users)
+
+    if "list" in parse_mix(args.mix) and not traffic.admin_tokens:
+        raise SystemExit("The list scenario needs a seeded user in ADMIN_EMAILS, e.g. seed0@example.com")
+
+    async with app.router.lifespan_context(app):
+        # A short unmeasured round fills the caches and the connection pool.
+        await replay(traffic, parse_mix(args.mix), min(200, args.requests), args.concurrency)
+        results = await replay(traffic, parse_mix(args.mix), args.requests, args.concurrency)
+
+    report(results)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"baseline saved to {args.save}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--diets", type=int, default=7)
+    parser.add_argument("--meals", type=int, default=4)
+    parser.add_argument("--trains", type=int, default=7)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save")
+    parser.add_argument("--baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    sys.exit(asyncio.run(main(parser.parse_args())))
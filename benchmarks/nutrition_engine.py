@@ -0,0 +1,179 @@
+"""
+Benchmark for the diet summaries: a per-row Decimal baseline versus the nutrition engine, with
+plain floats and, when installed, NumPy.
+
+Every variant reads the diets and meals of one user from SQLite and builds the same
+DietSummaryResponse list: planned and completed totals, energy distribution and breakdown per
+type of meal of every diet. The baseline reads the DECIMAL columns as Decimal and sums one meal
+at a time.
+
+Usage:
+    python -m benchmarks.nutrition_engine [diets] [meals per diet]
+"""
+import asyncio
+import os
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from decimal import Decimal
+from time import perf_counter
+
+DB_DIRECTORY = tempfile.TemporaryDirectory(prefix="nutrition-engine-benchmark-")
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DB_URL", f"sqlite+aiosqlite:///{DB_DIRECTORY.name}/benchmark.db")
+os.environ.setdefault("SLOW_QUERY_THRESHOLD", "0")
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from src.core import id_generator  # noqa: E402
+from src.core.nutrition import ENERGY_NUTRIENTS, ENERGY_PER_GRAM, NutritionEngine, numpy  # noqa: E402
+from src.db import db  # noqa: E402
+from src.db.migrations import MIGRATIONS, Migrator  # noqa: E402
+from src.db.models import DietModel, FoodModel, MealModel, UserModel  # noqa: E402
+from src.db.repositories import DietRepository  # noqa: E402
+from src.db.repositories.nutrient_rollup import NUTRIENTS  # noqa: E402
+from src.schemas import DietSummaryResponse  # noqa: E402
+from src.services.diet import summarize_diets  # noqa: E402
+
+DIETS = 2000
+MEALS = 6
+FOODS = 500
+MEAL_TYPES = ["breakfast", "snack", "lunch", "snack", "dinner", "supper"]
+USER_ID = "benchmark-user"
+
+
+async def seed(diets: int, meals: int) -> None:
+    now = datetime.now()
+    start = datetime(2025, 1, 1)
+    foods = [
+        {"id": id_generator(), "name": f"Alimento {index}", "quantity": 100, "consumption_date": now,
+         "type": "lunch", **{nutrient: random.randint(0, 80000) / 100 for nutrient in NUTRIENTS}}
+        for index in range(FOODS)
+    ]
+    diet_rows = [
+        {"id": id_generator(), "user_id": USER_ID, "date": start + timedelta(days=index), "total_water": 0,
+         **{f"total_{nutrient}": 0 for nutrient in NUTRIENTS}}
+        for index in range(diets)
+    ]
+    meal_rows = [
+        {"id": id_generator(), "diet_id": diet["id"], "food_id": random.choice(foods)["id"],
+         "type": MEAL_TYPES[index % len(MEAL_TYPES)], "is_completed": random.random() < 0.7}
+        for diet in diet_rows
+        for index in range(meals)
+    ]
+
+    async with db.engine.begin() as conn:
+        await conn.execute(insert(UserModel), [{"id": USER_ID, "name": "Benchmark", "email": "b@b.com",
+                                                "password": "x"}])
+        await conn.execute(insert(FoodModel), foods)
+        await conn.execute(insert(DietModel), diet_rows)
+        await conn.execute(insert(MealModel), meal_rows)
+
+
+async def decimal_baseline(session) -> list[DietSummaryResponse]:
+    """
+    Reads the DECIMAL columns as Decimal and builds the summaries one meal at a time.
+    """
+    diets = (await session.execute(
+        select(DietModel.id, DietModel.date).where(DietModel.user_id == USER_ID).order_by(DietModel.date)
+    )).all()
+    meals = (await session.execute(
+        select(MealModel.diet_id, MealModel.type, MealModel.is_completed,
+               *(getattr(FoodModel, nutrient) for nutrient in NUTRIENTS))
+        .join(DietModel, DietModel.id == MealModel.diet_id)
+        .join(FoodModel, FoodModel.id == MealModel.food_id)
+        .where(DietModel.user_id == USER_ID)
+        .order_by(MealModel.created_at, MealModel.id)
+    )).all()
+
+    zero = Decimal(0)
+    summaries = {
+        diet.id: {"id": diet.id, "date": diet.date, "planned": [zero] * len(NUTRIENTS),
+                  "completed": [zero] * len(NUTRIENTS), "meals": {}}
+        for diet in diets
+    }
+
+    for meal in meals:
+        summary = summaries[meal.diet_id]
+        breakdown = summary["meals"].setdefault(meal.type, {
+            "type": meal.type, "meals": 0, "completed_meals": 0,
+            "planned": [zero] * len(NUTRIENTS), "completed": [zero] * len(NUTRIENTS),
+        })
+        values = [getattr(meal, nutrient) for nutrient in NUTRIENTS]
+        breakdown["meals"] += 1
+
+        for index, value in enumerate(values):
+            summary["planned"][index] += value
+            breakdown["planned"][index] += value
+
+        if meal.is_completed:
+            breakdown["completed_meals"] += 1
+
+            for index, value in enumerate(values):
+                summary["completed"][index] += value
+                breakdown["completed"][index] += value
+
+    for summary in summaries.values():
+        energy = [value * Decimal(factor) for value, factor in zip(summary["planned"][1:], ENERGY_PER_GRAM)]
+        total = sum(energy)
+        summary["energy_distribution"] = dict(zip(
+            ENERGY_NUTRIENTS, (round(value * 100 / total, 2) if total else zero for value in energy)
+        ))
+
+        for totals in (summary, *summary["meals"].values()):
+            totals["planned"] = dict(zip(NUTRIENTS, totals["planned"]))
+            totals["completed"] = dict(zip(NUTRIENTS, totals["completed"]))
+
+        summary["meals"] = list(summary["meals"].values())
+
+    return DietSummaryResponse.from_dicts(list(summaries.values()))
+
+
+async def engine_summaries(session, engine: NutritionEngine) -> list[DietSummaryResponse]:
+    diets, meals = await DietRepository(session).get_diets_with_meals(USER_ID)
+    return summarize_diets(diets, meals, engine=engine)
+
+
+async def measure(label: str, summarize, rounds: int) -> float:
+    await summarize()
+    started = perf_counter()
+
+    for _ in range(rounds):
+        await summarize()
+
+    elapsed = (perf_counter() - started) / rounds
+    print(f"{label:<24} {elapsed * 1000:>9.2f} ms/batch")
+    return elapsed
+
+
+async def main(diets: int, meals: int) -> None:
+    random.seed(1)
+    await Migrator(db, MIGRATIONS).upgrade()
+    await seed(diets, meals)
+    print(f"{diets} diets, {diets * meals} meals")
+
+    engines = [("float engine", NutritionEngine(use_numpy=False))]
+
+    if numpy is not None:
+        engines.append(("NumPy engine", NutritionEngine(use_numpy=True)))
+    else:
+        print("NumPy is not installed, install the 'nutrition' extra to measure the NumPy engine")
+
+    async with db.async_session() as session:
+        baseline = await measure("Decimal per row", lambda: decimal_baseline(session), 5)
+
+        for label, engine in engines:
+            elapsed = await measure(label, lambda: engine_summaries(session, engine), 5)
+            print(f"{'':<24} {baseline / elapsed:>9.1f}x the Decimal baseline")
+
+    await db.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else DIETS,
+        int(sys.argv[2]) if len(sys.argv) > 2 else MEALS,
+    ))
@@ -0,0 +1,102 @@
+"""
+Query plan check for the hot queries of the application.
+
+Creates the schema on a temporary SQLite database, runs EXPLAIN QUERY PLAN for every query in
+HOT_QUERIES and exits with status 1 if any of them scans a whole table instead of using an index.
+
+Usage:
+    python -m benchmarks.query_plans
+"""
+import asyncio
+import os
+import re
+import sys
+import tempfile
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DB_URL", "sqlite+aiosqlite:///:memory:")
+
+from sqlalchemy import bindparam, select, tuple_  # noqa: E402
+
+from src.core import DatabaseHandler  # noqa: E402
+from src.db.models import (  # noqa: E402
+    DietModel,
+    FoodModel,
+    MealModel,
+    MedicalHistoryModel,
+    NutritionalDataModel,
+    TrainModel,
+    UserModel,
+)
+from src.db.repositories.user import USER_RESPONSE_COLUMNS, user_row_query  # noqa: E402
+
+HOT_QUERIES = {
+    "user by id": user_row_query(USER_RESPONSE_COLUMNS, "id"),
+    "user by email": user_row_query(USER_RESPONSE_COLUMNS + (UserModel.password,), "email"),
+    "users page": (
+        select(*USER_RESPONSE_COLUMNS)
+        .where(tuple_(UserModel.created_at, UserModel.id) > tuple_(bindparam("created_at"), bindparam("id")))
+        .order_by(UserModel.created_at, UserModel.id)
+        .limit(50)
+    ),
+    "user diets in range": (
+        select(DietModel)
+        .where(DietModel.user_id == bindparam("user_id"))
+        .where(DietModel.date.between(bindparam("start"), bindparam("end")))
+        .order_by(DietModel.date)
+    ),
+    "user trains in range": (
+        select(TrainModel)
+        .where(TrainModel.user_id == bindparam("user_id"))
+        .where(TrainModel.date.between(bindparam("start"), bindparam("end")))
+        .order_by(TrainModel.date)
+    ),
+    "exercise trains": select(TrainModel).where(TrainModel.exercise_id == bindparam("exercise_id")),
+    "diet meals": select(MealModel).where(MealModel.diet_id == bindparam("diet_id")),
+    "food meals": select(MealModel).where(MealModel.food_id == bindparam("food_id")),
+    "latest nutritional data": (
+        select(NutritionalDataModel)
+        .where(NutritionalDataModel.user_id == bindparam("user_id"))
+        .order_by(NutritionalDataModel.evaluation_date.desc())
+        .limit(1)
+    ),
+    "user medical history": (
+        select(MedicalHistoryModel).where(MedicalHistoryModel.user_id == bindparam("user_id"))
+    ),
+    "foods in range": (
+        select(FoodModel)
+        .where(FoodModel.consumption_date.between(bindparam("start"), bindparam("end")))
+    ),
+}
+
+# "SCAN <table>" without "USING ... INDEX" is a full table scan.
+FULL_SCAN = re.compile(r"^SCAN (\w+)(?! USING)")
+
+
+async def main() -> int:
+    failures = 0
+
+    with tempfile.TemporaryDirectory() as directory:
+        handler = DatabaseHandler(f"sqlite+aiosqlite:///{directory}/plans.db")
+        await handler.create_tables()
+
+        async with handler.engine.connect() as conn:
+            for name, query in HOT_QUERIES.items():
+                compiled = query.compile(dialect=conn.dialect)
+                params = tuple(None for _ in compiled.positiontup)
+                result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled.string}", params)
+                details = [row[-1] for row in result]
+                scans = [detail for detail in details if FULL_SCAN.match(detail)]
+
+                failures += bool(scans)
+                status = "FULL SCAN" if scans else "ok"
+                print(f"{status:<10} {name}: {'; '.join(details)}")
+
+        await handler.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,92 @@
+"""
+Benchmark for response serialization: FastAPI's return annotation path (validate the returned
+model again, jsonable_encoder, stdlib JSON) versus rendering the validated model directly with
+each of the response classes in src.api.responses.
+
+Usage:
+    python -m benchmarks.response_serialization
+"""
+import asyncio
+import os
+from datetime import datetime
+from time import perf_counter
+from uuid import uuid4
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DB_URL", "sqlite+aiosqlite:///:memory:")
+
+from fastapi.responses import JSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+
+from src.api.responses import RESPONSE_CLASSES  # noqa: E402
+from src.schemas import UserPage, UserResponse  # noqa: E402
+
+LIST_SIZE = 1000
+
+
+def make_user(index: int) -> UserResponse:
+    now = datetime.now()
+    return UserResponse.model_construct(
+        id=str(uuid4()),
+        name=f"Usuário {index}",
+        email=f"user{index}@example.com",
+        gender=None,
+        birth_date=None,
+        state="SP",
+        city="São Paulo",
+        cep="01000-000",
+        complement=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+async def measure_annotation(label: str, model_type: type, content, number: int) -> None:
+    field = create_model_field(name="Response", type_=model_type, mode="serialization")
+    started = perf_counter()
+
+    for _ in range(number):
+        JSONResponse(await serialize_response(field=field, response_content=content))
+
+    report(label, "annotation (stdlib)", perf_counter() - started, number)
+
+
+def measure_class(label: str, name: str, response_class: type, content, number: int) -> None:
+    started = perf_counter()
+
+    for _ in range(number):
+        response_class(content)
+
+    report(label, name, perf_counter() - started, number)
+
+
+def report(label: str, name: str, seconds: float, number: int) -> None:
+    per_call = seconds / number * 1_000_000
+    print(f"{label:<12} {name:<22} {per_call:>10.1f} us/response  {number / seconds:>10.1f} responses/s")
+
+
+async def main() -> None:
+    single = make_user(0)
+    page = UserPage(items=[make_user(index) for index in range(LIST_SIZE)], next_cursor=None)
+    payloads = [
+        ("single", UserResponse, single, 20000),
+        (f"list {LIST_SIZE}", UserPage, page, 50),
+    ]
+
+    for label, model_type, content, number in payloads:
+        await measure_annotation(label, model_type, content, number)
+
+        for name, response_class in RESPONSE_CLASSES.items():
+            try:
+                response_class(content)
+            except ImportError:
+                print(f"{label:<12} {name:<22} {'skipped, not installed':>10}")
+                continue
+
+            measure_class(label, name, response_class, content, number)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
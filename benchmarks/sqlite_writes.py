@@ -0,0 +1,74 @@
+"""
+Benchmark for concurrent SQLite writes, with and without the SQLite performance mode and write queue.
+
+Usage:
+    python -m benchmarks.sqlite_writes [writes] [concurrency]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DB_URL", "sqlite+aiosqlite:///:memory:")
+
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from src.core import DatabaseHandler  # noqa: E402
+from src.db.db import sqlite_pragmas  # noqa: E402
+from src.db.models import UserModel  # noqa: E402
+
+
+async def run(label: str, writes: int, concurrency: int, **options) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        handler = DatabaseHandler(
+            f"sqlite+aiosqlite:///{directory}/benchmark.db",
+            pool_size=concurrency,
+            **options
+        )
+        await handler.create_tables()
+
+        semaphore = asyncio.Semaphore(concurrency)
+        errors = 0
+
+        async def write(index: int) -> None:
+            nonlocal errors
+
+            async def insert(session):
+                session.add(UserModel(email=f"user{index}@example.com", password="x"))
+                await session.flush()
+
+            async with semaphore:
+                async with handler.async_session() as session:
+                    try:
+                        await handler.run_write(insert, session)
+                    except OperationalError:
+                        errors += 1
+
+        start = perf_counter()
+        await asyncio.gather(*(write(index) for index in range(writes)))
+        elapsed = perf_counter() - start
+
+        await handler.close()
+
+    print(f"{label:<28} {writes / elapsed:>9.1f} writes/s  ({errors} errors)")
+
+
+async def main(writes: int, concurrency: int) -> None:
+    await run("default", writes, concurrency)
+    await run("pragmas", writes, concurrency, sqlite_pragmas=sqlite_pragmas)
+    await run(
+        "pragmas + write queue",
+        writes,
+        concurrency,
+        sqlite_pragmas=sqlite_pragmas,
+        write_queue=True,
+    )
+
+
+if __name__ == "__main__":
+    writes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    asyncio.run(main(writes, concurrency))
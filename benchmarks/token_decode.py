@@ -0,0 +1,39 @@
+"""
+Micro-benchmark for the per-request token verification done by get_current_user.
+
+Usage:
+    python -m benchmarks.token_decode
+"""
+import os
+from timeit import timeit
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DB_URL", "sqlite+aiosqlite:///:memory:")
+
+from src.core import SecurityHandler, settings  # noqa: E402
+from src.core.tokens import TOKEN_CODECS, get_token_codec  # noqa: E402
+
+NUMBER = 20000
+
+
+def measure(label: str, func) -> float:
+    seconds = timeit(func, number=NUMBER)
+    per_call = seconds / NUMBER * 1_000_000
+    print(f"{label:<32} {per_call:>8.2f} us/call")
+    return per_call
+
+
+def main() -> None:
+    token = SecurityHandler.create_jwt_token({"sub": "benchmark-user"})
+
+    for name in TOKEN_CODECS:
+        codec = get_token_codec(name, settings.SECRET_KEY, settings.ALGORITHM)
+        measure(f"{name} codec, uncached", lambda: codec.decode(token))
+
+    SecurityHandler.decode_jwt_token(token)
+    measure("decode_jwt_token, cached", lambda: SecurityHandler.decode_jwt_token(token))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark for the per-request user lookup: ORM entity + from_attributes validation versus
+column projection + row mapping.
+
+Usage:
+    python -m benchmarks.user_lookup [lookups]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from time import perf_counter, thread_time
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("DB_URL", "sqlite+aiosqlite:///:memory:")
+
+from sqlalchemy import insert, select  # noqa: E402
+
+from src.core import DatabaseHandler  # noqa: E402
+from src.db.models import UserModel  # noqa: E402
+from src.db.repositories import UserRepository  # noqa: E402
+from src.schemas import UserResponse  # noqa: E402
+
+USERS = 1000
+
+
+async def entity_lookup(repository: UserRepository, user_id: str) -> UserResponse:
+    result = await repository.db.execute(select(UserModel).where(UserModel.id == user_id))
+    model = result.unique().scalars().first()
+    return UserResponse.model_validate(model, from_attributes=True)
+
+
+async def projection_lookup(repository: UserRepository, user_id: str) -> UserResponse:
+    return await repository.get_user_response(user_id=user_id)
+
+
+async def measure(label: str, handler: DatabaseHandler, lookup, user_ids: list[str]) -> None:
+    async with handler.async_session() as session:
+        repository = UserRepository(session)
+        wall, cpu = perf_counter(), thread_time()
+
+        for user_id in user_ids:
+            await lookup(repository, user_id)
+
+        wall, cpu = perf_counter() - wall, thread_time() - cpu
+
+    per_call = cpu / len(user_ids) * 1_000_000
+    print(f"{label:<24} {per_call:>8.1f} us loop CPU/lookup  {len(user_ids) / wall:>9.1f} lookups/s")
+
+
+async def main(lookups: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        handler = DatabaseHandler(f"sqlite+aiosqlite:///{directory}/benchmark.db")
+        await handler.create_tables()
+
+        async with handler.async_session() as session:
+            result = await session.execute(
+                insert(UserModel).returning(UserModel.id),
+                [
+                    {"name": f"User {index}", "email": f"user{index}@example.com", "password": "x" * 60}
+                    for index in range(USERS)
+                ],
+            )
+            ids = list(result.scalars())
+            await session.commit()
+
+        user_ids = [ids[index % USERS] for index in range(lookups)]
+
+        await measure("entity + from_attributes", handler, entity_lookup, user_ids)
+        await measure("projection + row mapping", handler, projection_lookup, user_ids)
+
+        await handler.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
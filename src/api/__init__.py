@@ -1,4 +1,7 @@
+# Imported first so the startup timer also measures the application imports.
+from src.startup import startup_timer
+
 from .api import app
 
 
-__all__ = ["app"]
\ No newline at end of file
+__all__ = ["app", "startup_timer"]
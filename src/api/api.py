@@ -1,12 +1,84 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.api.routes import user_router
+from src.api.middleware import MetricsMiddleware, QueryProfilerMiddleware
+from src.api.responses import DefaultJSONResponse
+from src.api.routes import (
+    catalog_router,
+    consumption_router,
+    diet_router,
+    food_router,
+    health_router,
+    metrics_router,
+    nutrition_router,
+    user_router
+)
+from src.core import settings
+from src.core.metrics import metrics
+from src.core.planner import plan_pool
+from src.core.security import password_pool
+from src.db import db, food_catalog, query_profiler
+from src.db.migrations import MIGRATIONS, Migrator
+from src.db.repositories import USER_WARM_UP_QUERIES, CatalogRepository
+from src.startup import startup_timer
+
+logger = logging.getLogger("uvicorn.error")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan.
+
+    On startup: creates the database engine, warms the connection pool and the compiled statement
+    cache, verifies the schema version, loads the reference food catalog into memory and logs how
+    long each phase took. On shutdown: releases the password and diet plan worker pools and drains the database pool.
+
+    Migrations are not applied here; run `python -m src.db.migrations upgrade` before starting.
+
+    Args:
+        app (FastAPI): The FastAPI application.
+
+    Yields:
+        None
+    """
+    startup_timer.mark("imports")
+    await db.connect(warm_connections=settings.DB_POOL_WARM_SIZE)
+    startup_timer.mark("database pool")
+    await Migrator(db, MIGRATIONS).check()
+    startup_timer.mark("schema check")
+    await db.warm_up(USER_WARM_UP_QUERIES)
+    startup_timer.mark("statement cache")
+
+    async with db.async_session() as session:
+        food_catalog.replace(await CatalogRepository(session).load_catalog())
+    startup_timer.mark("food catalog")
+
+    breakdown = ", ".join(f"{phase} {seconds:.3f}s" for phase, seconds in startup_timer.phases.items())
+    logger.info("Startup finished in %.3fs (%s)", startup_timer.total, breakdown)
+
+    if settings.STARTUP_TIME_TARGET and startup_timer.total > settings.STARTUP_TIME_TARGET:
+        logger.warning(
+            "Startup took %.3fs, above the %.3fs target",
+            startup_timer.total,
+            settings.STARTUP_TIME_TARGET
+        )
+
+    yield
+    password_pool.shutdown()
+    plan_pool.shutdown()
+    await db.close(drain_timeout=settings.DB_DRAIN_TIMEOUT)
+
 
 app = FastAPI(title="FastAPI Example",
     description="A simple FastAPI application example",
     summary="FastAPI Example API",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
 )
 
 origins = [
@@ -24,7 +96,19 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
+app.add_middleware(MetricsMiddleware, registry=metrics)
+
+if settings.QUERY_PROFILER:
+    app.add_middleware(QueryProfilerMiddleware, profiler=query_profiler)
+
 app.include_router(user_router)
+app.include_router(diet_router)
+app.include_router(nutrition_router)
+app.include_router(food_router)
+app.include_router(catalog_router)
+app.include_router(consumption_router)
+app.include_router(health_router)
+app.include_router(metrics_router)
 
 @app.get("/")
 async def root():
@@ -1,7 +1,8 @@
-from .auth import get_current_user
+from .auth import get_admin_user, get_current_user
 from .database import get_db_session
 
 __all__ = [
+    "get_admin_user",
     "get_current_user",
     "get_db_session",
 ]
\ No newline at end of file
@@ -1,9 +1,10 @@
-from fastapi import Depends
+from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.api.dependencies.database import get_db_session
-from src.core import SecurityHandler
+from src.core import SecurityHandler, messages, settings
+from src.db import user_cache
 from src.schemas import TokenData, UserResponse
 from src.services import UserService
 
@@ -16,17 +17,56 @@ async def get_current_user(
     """
     Dependency to get the current user based on the provided OAuth2 token.
 
+    The user is served from the authenticated user cache when available, so hot
+    endpoints skip the users table lookup. Updates and deletions evict the user only in
+    the worker process that made them, so other workers may serve the previous user for
+    up to settings.USER_CACHE_TTL seconds.
+
     Args:
         token (str): The OAuth2 token provided by the user.
 
     Returns:
-        str: The user identifier extracted from the token.
+        UserResponse: The user identified by the token.
     """
     payload = SecurityHandler.decode_jwt_token(token)
     data = TokenData(**payload)
 
+    user = await user_cache.get(data.sub)
+
+    if user is not None:
+        return user
+
+    evictions = user_cache.evictions
     service = UserService(db_session)
 
     user = await service.get_user_by_id(user_id=data.sub)
 
+    # A user updated or deleted while it was being read must not be cached again.
+    if user_cache.evictions == evictions:
+        await user_cache.set(data.sub, user)
+
+    return user
+
+
+async def get_admin_user(
+        user: UserResponse = Depends(get_current_user),
+    ) -> UserResponse:
+    """
+    Dependency to get the current user, only if it is an administrator (one of settings.ADMIN_EMAILS).
+
+    Args:
+        user (UserResponse): The authenticated user.
+
+    Returns:
+        UserResponse: The authenticated administrator.
+
+    Raises:
+        HTTPException: If the user is not an administrator (403).
+    """
+    if user.email.lower() not in {email.lower() for email in settings.ADMIN_EMAILS}:
+        raise HTTPException(
+            status_code=403,
+            detail=messages.USER_NOT_ADMIN
+        )
+
     return user
@@ -0,0 +1,85 @@
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import MetricsRegistry, RequestTimings, request_timings
+from src.core.profiler import QueryProfiler
+
+
+class MetricsMiddleware:
+    """
+    MetricsMiddleware records the latency, status code and per-phase timings of every HTTP request.
+
+    Written as a plain ASGI middleware, so it adds a few function calls per request and does not
+    wrap the response body like BaseHTTPMiddleware does. Requests are labelled with their route
+    template (e.g. "/user/list") to keep the number of series bounded; unmatched paths share one label.
+
+    Attributes:
+        app (ASGIApp): The wrapped application.
+        registry (MetricsRegistry): The registry the measurements are recorded in.
+    """
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        timings = RequestTimings()
+        token = request_timings.set(timings)
+        in_flight = self.registry.in_flight
+        in_flight.inc()
+        started_at = perf_counter()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            seconds = perf_counter() - started_at
+            in_flight.dec()
+            request_timings.reset(token)
+
+            route = scope.get("route")
+            self.registry.observe_request(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                status,
+                seconds,
+                timings
+            )
+
+
+class QueryProfilerMiddleware:
+    """
+    QueryProfilerMiddleware opens a query profile for every HTTP request and closes it when the
+    response is sent, so the profiler can flag requests repeating the same statement (N+1 queries).
+
+    Attributes:
+        app (ASGIApp): The wrapped application.
+        profiler (QueryProfiler): The profiler the statements are recorded by.
+    """
+    def __init__(self, app: ASGIApp, profiler: QueryProfiler) -> None:
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = self.profiler.start_request()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            self.profiler.finish_request(token, f'{scope["method"]} {getattr(route, "path", scope["path"])}')
@@ -0,0 +1,112 @@
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.types import Receive, Scope, Send
+from pydantic_core import to_json, to_jsonable_python
+
+from src.core import settings
+from src.core.metrics import timed_phase
+
+
+class StandardJSONResponse(JSONResponse):
+    """
+    StandardJSONResponse encodes the content with the standard library json module.
+
+    Pydantic models (or lists/dicts of them) are converted to plain Python values first, so routes
+    can return already validated schemas without FastAPI validating them again.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with timed_phase("serialization"):
+            return json.dumps(
+                to_jsonable_python(content),
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":"),
+            ).encode("utf-8")
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    PydanticJSONResponse encodes the content with pydantic-core's serializer.
+
+    Models are written straight to JSON bytes by their compiled serializers, without the
+    intermediate dicts built by jsonable_encoder and the stdlib encoder.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with timed_phase("serialization"):
+            return to_json(content)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    ORJSONResponse encodes the content with orjson.
+
+    orjson is an optional dependency, installed by the server extra, and is imported when the class
+    is first used. Pydantic models are converted through pydantic-core, every other value is encoded
+    natively by orjson.
+    """
+    _dumps = None
+
+    def render(self, content: Any) -> bytes:
+        if ORJSONResponse._dumps is None:
+            import orjson
+
+            ORJSONResponse._dumps = orjson.dumps
+
+        with timed_phase("serialization"):
+            return ORJSONResponse._dumps(content, default=to_jsonable_python)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    DuplexStreamingResponse streams a body that is produced while the request body is still being read.
+
+    StreamingResponse listens for the client disconnect message while streaming, which would consume
+    the request body messages. This response leaves the receive channel to the body generator; a
+    client disconnect surfaces there as starlette.requests.ClientDisconnect.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+
+        if self.background is not None:
+            await self.background()
+
+
+RESPONSE_CLASSES: dict[str, type[JSONResponse]] = {
+    "json": StandardJSONResponse,
+    "pydantic": PydanticJSONResponse,
+    "orjson": ORJSONResponse,
+}
+
+
+def get_response_class(name: str) -> type[JSONResponse]:
+    """
+    Returns the JSON response class registered under the given name.
+
+    Args:
+        name (str): The response class name, one of RESPONSE_CLASSES.
+
+    Returns:
+        type[JSONResponse]: The response class.
+
+    Raises:
+        ValueError: If the name is unknown, or if "orjson" is selected without orjson installed.
+    """
+    if name not in RESPONSE_CLASSES:
+        raise ValueError(f"Unknown response class {name!r}, expected one of {sorted(RESPONSE_CLASSES)}")
+
+    if name == "orjson":
+        try:
+            import orjson  # noqa: F401
+        except ImportError as error:
+            raise ValueError("The orjson response class requires the orjson package") from error
+
+    return RESPONSE_CLASSES[name]
+
+
+# The response class used by the application, selected with the JSON_RESPONSE_CLASS setting.
+DefaultJSONResponse = get_response_class(settings.JSON_RESPONSE_CLASS)
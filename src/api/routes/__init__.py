@@ -1,6 +1,20 @@
+from .catalog import router as catalog_router
+from .consumption import router as consumption_router
+from .diet import router as diet_router
+from .food import router as food_router
+from .health import router as health_router
+from .metrics import router as metrics_router
+from .nutrition import router as nutrition_router
 from .user import router as user_router
 
 
 __all__ = [
+    "catalog_router",
+    "consumption_router",
+    "diet_router",
+    "food_router",
+    "health_router",
+    "metrics_router",
+    "nutrition_router",
     "user_router",
-]
\ No newline at end of file
+]
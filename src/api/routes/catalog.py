@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies import get_current_user, get_db_session
+from src.api.responses import DefaultJSONResponse
+from src.schemas import CatalogFoodResponse, UserResponse
+from src.services import ConsumptionService
+
+router = APIRouter(prefix="/catalog", tags=["Catalog"])
+
+@router.get("/foods/{food_id}", response_model=CatalogFoodResponse)
+async def get_catalog_food(
+    food_id: str,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to get a food of the reference catalog.
+
+    Args:
+        food_id (str): The ID of the food.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The CatalogFoodResponse, with the nutrients per 100 g.
+    """
+
+    consumption_service = ConsumptionService(db_session)
+    return DefaultJSONResponse(await consumption_service.get_catalog_food(food_id))
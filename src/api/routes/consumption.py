@@ -0,0 +1,56 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies import get_current_user, get_db_session
+from src.api.responses import DefaultJSONResponse
+from src.schemas import ConsumptionCreate, ConsumptionResponse, ConsumptionTotalsResponse, UserResponse
+from src.services import ConsumptionService
+
+router = APIRouter(prefix="/consumption", tags=["Consumption"])
+
+@router.post("/", response_model=ConsumptionResponse)
+async def add_consumption(
+    request: ConsumptionCreate,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to log a quantity of a catalog food eaten by the authenticated user.
+
+    Args:
+        request (ConsumptionCreate): The consumption entry.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The logged ConsumptionResponse.
+    """
+
+    consumption_service = ConsumptionService(db_session)
+    return DefaultJSONResponse(await consumption_service.add_consumption(user.id, request))
+
+
+@router.get("/totals", response_model=ConsumptionTotalsResponse)
+async def get_consumption_totals(
+    start: date | None = None,
+    end: date | None = None,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to get the nutrients the authenticated user logged in a date range.
+
+    Args:
+        start (date | None): The first day, defaults to 90 days before the end.
+        end (date | None): The last day, defaults to today.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The ConsumptionTotalsResponse of the range.
+    """
+
+    consumption_service = ConsumptionService(db_session)
+    return DefaultJSONResponse(await consumption_service.get_totals(user.id, start, end))
@@ -0,0 +1,207 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies import get_current_user, get_db_session
+from src.api.responses import DefaultJSONResponse
+from src.schemas import (
+    DietCreate,
+    DietPlanResponse,
+    DietResponse,
+    DietSummaryResponse,
+    MealCreate,
+    MealResponse,
+    MealUpdate,
+    MessageResponse,
+    UserResponse
+)
+from src.services import DietPlanService, DietService
+
+router = APIRouter(prefix="/diet", tags=["Diet"])
+
+@router.post("/", response_model=DietResponse)
+async def add_diet(
+    request: DietCreate,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to add a diet to the authenticated user.
+
+    Args:
+        request (DietCreate): The diet creation request data.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The created DietResponse.
+    """
+
+    diet_service = DietService(db_session)
+    return DefaultJSONResponse(await diet_service.add_diet(user.id, request))
+
+
+@router.get("/summary", response_model=list[DietSummaryResponse])
+async def get_diet_summaries(
+    start: date | None = None,
+    end: date | None = None,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to summarize the diets of the authenticated user in a date range.
+
+    Args:
+        start (date | None): The first day, defaults to 90 days before the end.
+        end (date | None): The last day, defaults to today.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The DietSummaryResponse of each diet, ordered by date.
+    """
+
+    diet_service = DietService(db_session)
+    return DefaultJSONResponse(await diet_service.get_summaries(user.id, start, end))
+
+
+@router.get("/plan", response_model=DietPlanResponse)
+async def generate_diet_plan(
+    exclude: list[str] = Query(default=[]),
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to generate a daily diet plan from the latest nutritional evaluation of the authenticated user.
+
+    Args:
+        exclude (list[str]): Foods to leave out besides the allergies of the user.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The DietPlanResponse.
+    """
+
+    diet_plan_service = DietPlanService(db_session)
+    return DefaultJSONResponse(await diet_plan_service.generate(user.id, exclude))
+
+
+@router.get("/{diet_id}", response_model=DietResponse)
+async def get_diet(
+    diet_id: str,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to get a diet of the authenticated user.
+
+    Args:
+        diet_id (str): The ID of the diet.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The DietResponse, with the totals of its completed meals.
+    """
+
+    diet_service = DietService(db_session)
+    return DefaultJSONResponse(await diet_service.get_diet(user.id, diet_id))
+
+
+@router.get("/{diet_id}/summary", response_model=DietSummaryResponse)
+async def get_diet_summary(
+    diet_id: str,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to summarize the planned and eaten nutrients of a diet of the authenticated user.
+
+    Args:
+        diet_id (str): The ID of the diet.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The DietSummaryResponse, with the breakdown per type of meal.
+    """
+
+    diet_service = DietService(db_session)
+    return DefaultJSONResponse(await diet_service.get_summary(user.id, diet_id))
+
+
+@router.post("/{diet_id}/meals", response_model=MealResponse)
+async def add_meal(
+    diet_id: str,
+    request: MealCreate,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to add a meal to a diet of the authenticated user.
+
+    Args:
+        diet_id (str): The ID of the diet.
+        request (MealCreate): The meal creation request data.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The created MealResponse.
+    """
+
+    diet_service = DietService(db_session)
+    return DefaultJSONResponse(await diet_service.add_meal(user.id, diet_id, request))
+
+
+@router.patch("/{diet_id}/meals/{meal_id}", response_model=MealResponse)
+async def update_meal(
+    diet_id: str,
+    meal_id: str,
+    request: MealUpdate,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to mark a meal of a diet of the authenticated user as completed or not.
+
+    Args:
+        diet_id (str): The ID of the diet.
+        meal_id (str): The ID of the meal.
+        request (MealUpdate): The new completion state.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The updated MealResponse.
+    """
+
+    diet_service = DietService(db_session)
+    meal = await diet_service.set_meal_completed(user.id, diet_id, meal_id, request.is_completed)
+    return DefaultJSONResponse(meal)
+
+
+@router.delete("/{diet_id}/meals/{meal_id}", response_model=MessageResponse)
+async def delete_meal(
+    diet_id: str,
+    meal_id: str,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to delete a meal of a diet of the authenticated user.
+
+    Args:
+        diet_id (str): The ID of the diet.
+        meal_id (str): The ID of the meal.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The MessageResponse confirming the deletion.
+    """
+
+    diet_service = DietService(db_session)
+    return DefaultJSONResponse(await diet_service.delete_meal(user.id, diet_id, meal_id))
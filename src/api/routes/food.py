@@ -0,0 +1,33 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies import get_current_user, get_db_session
+from src.api.responses import DefaultJSONResponse
+from src.core import settings
+from src.schemas import FoodSearchResponse, UserResponse
+from src.services import FoodSearchService
+
+router = APIRouter(prefix="/food", tags=["Food"])
+
+@router.get("/search", response_model=list[FoodSearchResponse])
+async def search_foods(
+    q: str,
+    limit: int = settings.FOOD_SEARCH_LIMIT,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to search foods by name, for autocomplete.
+
+    Args:
+        q (str): The text typed by the user; accents and case are ignored and every word is prefix matched.
+        limit (int): The maximum number of foods.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The FoodSearchResponse of the matching foods, best matches first.
+    """
+
+    food_search_service = FoodSearchService(db_session)
+    return DefaultJSONResponse(await food_search_service.search(q, limit))
@@ -0,0 +1,87 @@
+from fastapi import APIRouter, Depends
+
+from src.api.dependencies import get_admin_user
+from src.db import db, query_profiler, user_cache
+from src.schemas import (
+    CacheStatsResponse,
+    DatabasePoolStatsResponse,
+    QueryStatsResponse,
+    StartupStatsResponse,
+    UserResponse
+)
+from src.startup import startup_timer
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+@router.get("/cache")
+async def get_cache_stats(
+    user: UserResponse = Depends(get_admin_user),
+) -> CacheStatsResponse:
+    """
+    Endpoint to get the authenticated user cache counters, restricted to administrators.
+
+    Args:
+        user (UserResponse): The authenticated administrator.
+
+    Returns:
+        CacheStatsResponse: The hits, misses, hit ratio and size of the cache.
+    """
+
+    return CacheStatsResponse(**user_cache.stats())
+
+
+
+@router.get("/database")
+async def get_database_pool_stats(
+    user: UserResponse = Depends(get_admin_user),
+) -> DatabasePoolStatsResponse:
+    """
+    Endpoint to get the database connection pool statistics, restricted to administrators.
+
+    Args:
+        user (UserResponse): The authenticated administrator.
+
+    Returns:
+        DatabasePoolStatsResponse: The pool size, connections in use, overflow and checkout wait times.
+    """
+
+    return DatabasePoolStatsResponse(**db.pool_stats())
+
+
+
+@router.get("/startup")
+async def get_startup_stats(
+    user: UserResponse = Depends(get_admin_user),
+) -> StartupStatsResponse:
+    """
+    Endpoint to get how long each phase of the application startup took, restricted to administrators.
+
+    Args:
+        user (UserResponse): The authenticated administrator.
+
+    Returns:
+        StartupStatsResponse: The phase durations and the total, in seconds.
+    """
+
+    return StartupStatsResponse(**startup_timer.report())
+
+
+
+@router.get("/queries")
+async def get_query_stats(
+    limit: int = 20,
+    user: UserResponse = Depends(get_admin_user),
+) -> list[QueryStatsResponse]:
+    """
+    Endpoint to get the SQL statements with the highest total duration since the worker started,
+    restricted to administrators.
+
+    Args:
+        limit (int): The maximum number of statements returned.
+        user (UserResponse): The authenticated administrator.
+
+    Returns:
+        list[QueryStatsResponse]: The fingerprint, count, total and max duration of each statement.
+    """
+
+    return [QueryStatsResponse(**stats) for stats in query_profiler.top(limit)]
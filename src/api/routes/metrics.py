@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.api.dependencies import get_admin_user
+from src.core.metrics import metrics
+from src.schemas import UserResponse
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(
+    user: UserResponse = Depends(get_admin_user),
+) -> PlainTextResponse:
+    """
+    Endpoint to get the request metrics in the Prometheus text exposition format, restricted to administrators.
+
+    Args:
+        user (UserResponse): The authenticated administrator.
+
+    Returns:
+        PlainTextResponse: The request counters, in-flight gauge and latency histograms.
+    """
+
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,58 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.dependencies import get_current_user, get_db_session
+from src.api.responses import DefaultJSONResponse
+from src.schemas import DailyNutrientsResponse, UserResponse, WeeklyNutrientsResponse
+from src.services import NutritionService
+
+router = APIRouter(prefix="/nutrition", tags=["Nutrition"])
+
+@router.get("/daily", response_model=list[DailyNutrientsResponse])
+async def get_daily_nutrients(
+    start: date | None = None,
+    end: date | None = None,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to get the nutrients the authenticated user consumed per day.
+
+    Args:
+        start (date | None): The first day, defaults to 90 days before the end.
+        end (date | None): The last day, defaults to today.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The DailyNutrientsResponse of each day with diets.
+    """
+
+    nutrition_service = NutritionService(db_session)
+    return DefaultJSONResponse(await nutrition_service.get_daily(user.id, start, end))
+
+
+@router.get("/weekly", response_model=list[WeeklyNutrientsResponse])
+async def get_weekly_nutrients(
+    start: date | None = None,
+    end: date | None = None,
+    user: UserResponse = Depends(get_current_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to get the nutrients the authenticated user consumed per week, weeks starting on Monday.
+
+    Args:
+        start (date | None): The first day, defaults to 90 days before the end.
+        end (date | None): The last day, defaults to today.
+        user (UserResponse): The authenticated user.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The WeeklyNutrientsResponse of each week with diets overlapping the range.
+    """
+
+    nutrition_service = NutritionService(db_session)
+    return DefaultJSONResponse(await nutrition_service.get_weekly(user.id, start, end))
@@ -1,18 +1,22 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user, get_db_session
-from src.schemas import TokenResponse, UserCreate, UserLogin, UserResponse
-from src.services import UserService
+from src.api.dependencies import get_admin_user, get_current_user, get_db_session
+from src.api.responses import DefaultJSONResponse, DuplexStreamingResponse
+from src.core import messages, settings
+from src.db import db
+from src.schemas import TokenResponse, UserCreate, UserLogin, UserPage, UserResponse
+from src.services import IMPORT_FORMATS, UserImportService, UserService
 
 router = APIRouter(prefix="/user", tags=["User"])
 
-@router.post("/")
+@router.post("/", response_model=UserResponse)
 async def add_user(
     request: UserCreate,
     db_session: AsyncSession = Depends(get_db_session),
-) -> UserResponse:
+) -> DefaultJSONResponse:
     """
     Endpoint to add a new user.
 
@@ -21,17 +25,17 @@ async def add_user(
         user_service (UserService): The user service dependency.
 
     Returns:
-        UserResponse: The created user response.
+        DefaultJSONResponse: The created UserResponse, serialized without being validated again.
     """
 
     user_service = UserService(db_session)
-    return await user_service.add_user(request)
+    return DefaultJSONResponse(await user_service.add_user(request))
 
 
-@router.get("/")
+@router.get("/", response_model=UserResponse)
 async def get_user_by_token(
     user: UserResponse = Depends(get_current_user),
-) -> UserResponse:
+) -> DefaultJSONResponse:
     """
     Endpoint to get a user by ID.
 
@@ -40,46 +44,142 @@ async def get_user_by_token(
         db_session (AsyncSession): The database session dependency.
 
     Returns:
-        UserResponse: The retrieved user response.
+        DefaultJSONResponse: The retrieved UserResponse.
     """
 
-    return user
+    return DefaultJSONResponse(user)
 
 
-@router.post("/login")
+@router.get("/list", response_model=UserPage)
+async def list_users(
+    limit: int = settings.USER_PAGE_SIZE,
+    cursor: str | None = None,
+    user: UserResponse = Depends(get_admin_user),
+    db_session: AsyncSession = Depends(get_db_session),
+) -> DefaultJSONResponse:
+    """
+    Endpoint to list users page by page, restricted to administrators.
+
+    Args:
+        limit (int): The number of users per page.
+        cursor (str | None): The next_cursor returned by the previous page.
+        user (UserResponse): The authenticated administrator.
+        db_session (AsyncSession): The database session dependency.
+
+    Returns:
+        DefaultJSONResponse: The UserPage with the users of the page and the cursor of the next one.
+    """
+
+    user_service = UserService(db_session)
+    return DefaultJSONResponse(await user_service.list_users(limit=limit, cursor=cursor))
+
+
+@router.get("/export")
+async def export_users(
+    user: UserResponse = Depends(get_admin_user),
+) -> StreamingResponse:
+    """
+    Endpoint to export every user as newline delimited JSON, restricted to administrators.
+
+    The export opens its own database session, since the response body is produced
+    after the request dependencies are closed.
+
+    Args:
+        user (UserResponse): The authenticated administrator.
+
+    Returns:
+        StreamingResponse: The application/x-ndjson stream of users.
+    """
+
+    async def generate():
+        async for db_session in db.get_session():
+            async for line in UserService(db_session).export_users():
+                yield line
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.post("/import")
+async def import_users(
+    http_request: Request,
+    user: UserResponse = Depends(get_admin_user),
+) -> DuplexStreamingResponse:
+    """
+    Endpoint to create users in bulk from a CSV (text/csv, with a name,email,password header)
+    or NDJSON (application/x-ndjson) body, restricted to administrators.
+
+    The body is read while the report is written, so the file is never held in memory. The
+    import opens its own database session, since the response body is produced after the
+    request dependencies are closed.
+
+    Args:
+        http_request (Request): The HTTP request holding the streamed body.
+        user (UserResponse): The authenticated administrator.
+
+    Returns:
+        DuplexStreamingResponse: The application/x-ndjson report, one line per row and a final summary.
+
+    Raises:
+        HTTPException: If the content type is not supported (415).
+    """
+
+    content_type = http_request.headers.get("content-type", "").split(";")[0].strip().lower()
+    import_format = IMPORT_FORMATS.get(content_type)
+
+    if import_format is None:
+        raise HTTPException(
+            status_code=415,
+            detail=messages.UNSUPPORTED_IMPORT_FORMAT
+        )
+
+    async def generate():
+        async for db_session in db.get_session():
+            service = UserImportService(db_session)
+            async for line in service.import_users(http_request.stream(), import_format):
+                yield line
+
+    return DuplexStreamingResponse(generate(), media_type="application/x-ndjson")
+
+
+@router.post("/login", response_model=TokenResponse)
 async def login_user(
     request: UserLogin,
+    http_request: Request,
     db_session: AsyncSession = Depends(get_db_session),
-) -> TokenResponse:
+) -> DefaultJSONResponse:
     """
     Endpoint to login a user.
 
     Args:
         request (UserLogin): The user login request data.
+        http_request (Request): The HTTP request, used to rate limit by client address.
         db_session (AsyncSession): The database session dependency.
 
     Returns:
-        UserResponse: The logged-in user response.
+        DefaultJSONResponse: The TokenResponse of the logged-in user.
     """
 
     user_service = UserService(db_session)
-    return await user_service.login(request)
+    client_ip = http_request.client.host if http_request.client else None
+    return DefaultJSONResponse(await user_service.login(request, client_ip=client_ip))
 
 
-@router.post("/auth")
+@router.post("/auth", response_model=TokenResponse)
 async def authenticate_user(
+    http_request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db_session: AsyncSession = Depends(get_db_session),
-) -> TokenResponse:
+) -> DefaultJSONResponse:
     """
     Endpoint to authenticate a user by ID.
 
     Args:
-        user_id (str): The ID of the user to authenticate.
+        http_request (Request): The HTTP request, used to rate limit by client address.
+        form_data (OAuth2PasswordRequestForm): The username (email) and password form.
         db_session (AsyncSession): The database session dependency.
 
     Returns:
-        UserResponse: The authenticated user response.
+        DefaultJSONResponse: The TokenResponse of the authenticated user.
     """
 
     service = UserService(db_session)
@@ -87,6 +187,7 @@ async def authenticate_user(
     login_data = UserLogin(
         email=form_data.username, password=form_data.password
     )
-    token_response = await service.login(login_data)
+    client_ip = http_request.client.host if http_request.client else None
+    token_response = await service.login(login_data, client_ip=client_ip)
 
-    return token_response
\ No newline at end of file
+    return DefaultJSONResponse(token_response)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from .cache import CacheBackend, MemoryCache
 from .database import BaseModel, DatabaseHandler
 from .generators import get_current_time, id_generator
 from .schemas import BaseSchema
@@ -7,9 +8,11 @@ from .settings import settings
 __all__ = [
     "BaseModel",
     "BaseSchema",
+    "CacheBackend",
     "DatabaseHandler",
     "get_current_time",
     "id_generator",
+    "MemoryCache",
     "SecurityHandler",
     "settings"
 ]
\ No newline at end of file
@@ -0,0 +1,161 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Any
+
+
+class CacheBackend(ABC):
+    """
+    CacheBackend is the base class for key/value caches used by the application.
+
+    Subclasses implement the storage methods (_get, set, delete, clear). Shared backends
+    (e.g. Redis) are responsible for serializing the values they receive.
+
+    Attributes:
+        hits (int): The number of lookups that found a value.
+        misses (int): The number of lookups that did not find a value.
+        evictions (int): The number of delete and clear calls. A caller loading a value compares it
+            before and after the load and skips the set when it changed, so a value read before a
+            concurrent eviction is not cached again.
+
+    Methods:
+        get: Returns the cached value for a key, or None, updating the hit/miss counters.
+        set: Stores a value for a key.
+        delete: Removes a key from the cache.
+        clear: Removes every key from the cache.
+        stats: Returns the cache counters.
+    """
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get(self, key: str) -> Any | None:
+        """
+        Returns the cached value for a key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Any | None: The cached value, or None if the key is missing or expired.
+        """
+        value = await self._get(key)
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return value
+
+    @abstractmethod
+    async def _get(self, key: str) -> Any | None:
+        """
+        Reads a key from the storage, without touching the counters.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Any | None: The stored value, or None if the key is missing or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        """
+        Stores a value for a key.
+
+        Args:
+            key (str): The cache key.
+            value (Any): The value to cache.
+
+        Returns:
+            None
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Removes a key from the cache.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            None
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Removes every key from the cache.
+
+        Returns:
+            None
+        """
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: The hits, misses and hit ratio of the cache.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+class MemoryCache(CacheBackend):
+    """
+    MemoryCache is an in-process cache with a time to live and least recently used eviction.
+
+    Attributes:
+        max_size (int): The maximum number of keys kept in memory.
+        ttl (float): The number of seconds a value stays valid after being set.
+    """
+    def __init__(self, max_size: int, ttl: float) -> None:
+        super().__init__()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def _get(self, key: str) -> Any | None:
+        item = self._data.get(key)
+
+        if item is None:
+            return None
+
+        expires_at, value = item
+
+        if expires_at <= monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        if self.max_size <= 0 or self.ttl <= 0:
+            return
+
+        self._data[key] = (monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self.evictions += 1
+        self._data.pop(key, None)
+
+    async def clear(self) -> None:
+        self.evictions += 1
+        self._data.clear()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "size": len(self._data)}
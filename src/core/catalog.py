@@ -0,0 +1,131 @@
+from array import array
+from math import fsum
+from operator import mul
+from types import MappingProxyType
+from typing import Iterable, NamedTuple
+
+# The nutrients of the catalog, per 100 g, in vector order.
+CATALOG_NUTRIENTS = ("calories", "proteins", "fats", "carbohydrates")
+
+
+class CatalogEntry(NamedTuple):
+    """
+    CatalogEntry is a food of the reference catalog.
+
+    Attributes:
+        id (str): The unique identifier of the food.
+        name (str): The name of the food.
+        calories (float): The calories per 100 g.
+        proteins (float): The proteins per 100 g.
+        fats (float): The fats per 100 g.
+        carbohydrates (float): The carbohydrates per 100 g.
+    """
+    id: str
+    name: str
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
+
+
+class FoodCatalog:
+    """
+    FoodCatalog is an immutable in-memory snapshot of the reference food catalog.
+
+    The nutrients are kept as one array of doubles per nutrient (8 bytes per food and nutrient)
+    indexed by the position of the food, so totals multiply a vector of quantities against each
+    column instead of building an object per food. A new snapshot replaces the old one on reload;
+    readers holding the old one are unaffected.
+
+    Args:
+        rows (Iterable[tuple]): The id, name, calories, proteins, fats and carbohydrates per 100 g of each food.
+
+    Attributes:
+        ids (tuple[str, ...]): The food IDs, in vector order.
+        names (tuple[str, ...]): The food names, in vector order.
+        columns (dict[str, array]): The per 100 g values of each nutrient, in vector order.
+
+    Methods:
+        get: Returns a food of the catalog.
+        totals: Sums the nutrients of quantities of foods.
+    """
+    __slots__ = ("ids", "names", "columns", "_positions")
+
+    def __init__(self, rows: Iterable[tuple]) -> None:
+        ids, names = [], []
+        columns = {nutrient: array("d") for nutrient in CATALOG_NUTRIENTS}
+
+        for food_id, name, *values in rows:
+            ids.append(food_id)
+            names.append(name)
+
+            for nutrient, value in zip(CATALOG_NUTRIENTS, values):
+                columns[nutrient].append(float(value))
+
+        self.ids = tuple(ids)
+        self.names = tuple(names)
+        self.columns = MappingProxyType(columns)
+        self._positions = MappingProxyType({food_id: position for position, food_id in enumerate(ids)})
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, food_id: str) -> bool:
+        return food_id in self._positions
+
+    def get(self, food_id: str) -> CatalogEntry | None:
+        """
+        Returns a food of the catalog.
+
+        Args:
+            food_id (str): The ID of the food.
+
+        Returns:
+            CatalogEntry | None: The food and its nutrients per 100 g, or None if it is not in the catalog.
+        """
+        position = self._positions.get(food_id)
+
+        if position is None:
+            return None
+
+        values = (self.columns[nutrient][position] for nutrient in CATALOG_NUTRIENTS)
+        return CatalogEntry(self.ids[position], self.names[position], *values)
+
+    def totals(self, food_ids: Iterable[str], grams: Iterable[float]) -> dict[str, float]:
+        """
+        Sums the nutrients of quantities of foods.
+
+        Args:
+            food_ids (Iterable[str]): The ID of each food.
+            grams (Iterable[float]): The quantity of each food, in grams, in the same order.
+
+        Returns:
+            dict[str, float]: The total of each nutrient.
+
+        Raises:
+            KeyError: If a food is not in the catalog.
+        """
+        positions = [self._positions[food_id] for food_id in food_ids]
+        factors = [float(quantity) / 100 for quantity in grams]
+
+        return {
+            nutrient: fsum(map(mul, factors, map(column.__getitem__, positions)))
+            for nutrient, column in self.columns.items()
+        }
+
+
+class CatalogHolder:
+    """
+    CatalogHolder holds the current FoodCatalog snapshot of the process.
+
+    Attributes:
+        catalog (FoodCatalog): The current snapshot, empty until loaded.
+
+    Methods:
+        replace: Swaps in a new snapshot.
+    """
+    def __init__(self) -> None:
+        self.catalog = FoodCatalog(())
+
+    def replace(self, catalog: FoodCatalog) -> None:
+        self.catalog = catalog
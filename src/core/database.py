@@ -1,53 +1,299 @@
-from sqlalchemy.ext.asyncio import AsyncAttrs, AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+from time import perf_counter
+from typing import Any, Callable, Iterable, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncAttrs,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from sqlalchemy.sql import Executable
+
+from src.core.write_queue import WriteJob, WriteQueue
+
+StatementObserver = Callable[[str, Any, float], None]
 
 class BaseModel(AsyncAttrs, DeclarativeBase):
     __abstract__ = True
     #__sa_dataclass_metadata_key__ = "sa"
     # Adicione campos/métodos comuns aqui, se necessário
 
-    def to_dict(self, exclude: list[str] = [], include: dict = {}) -> dict:
+    @classmethod
+    def column_keys(cls) -> tuple[str, ...]:
+        """
+        Returns the attribute names of the mapped columns, computed once per class.
+
+        Returns:
+            tuple[str, ...]: The column attribute names, in table order.
+        """
+        keys = cls.__dict__.get("_column_keys")
+
+        if keys is None:
+            keys = tuple(attribute.key for attribute in cls.__mapper__.column_attrs)
+            cls._column_keys = keys
+
+        return keys
+
+    def to_dict(
+        self,
+        exclude: Iterable[str] = (),
+        include: dict | None = None,
+        exclude_none: bool = False
+    ) -> dict:
         """
             Converts the model instance to a dictionary.
 
             Args:
-                exclude (list[str]): List of field names to exclude from the dictionary.
-                include (dict): Dictionary of additional fields to include in the output.
+                exclude (Iterable[str]): Column names to exclude from the dictionary.
+                include (dict | None): Additional fields to include in the output.
+                exclude_none (bool): If True, columns whose value is None are left out.
 
             Returns:
                 dict: A dictionary representation of the model instance, excluding specified fields and including additional fields.
         """
-        data =  {column.name: getattr(self, column.name) for column in self.__table__.columns}
+        keys = self.column_keys()
 
-        for field in exclude:
-            data.pop(field, None)
+        if exclude:
+            exclude = set(exclude)
+            keys = [key for key in keys if key not in exclude]
+
+        if exclude_none:
+            data = {key: value for key in keys if (value := getattr(self, key)) is not None}
+        else:
+            data = {key: getattr(self, key) for key in keys}
 
         if include:
             data.update(include)
 
         return data
 
+    @classmethod
+    def to_dicts(
+        cls,
+        models: Sequence["BaseModel"],
+        exclude: Iterable[str] = (),
+        exclude_none: bool = False
+    ) -> list[dict]:
+        """
+        Converts a list of instances of this model to dictionaries, resolving the column list once.
+
+        Args:
+            models (Sequence[BaseModel]): The instances to convert.
+            exclude (Iterable[str]): Column names to exclude from every dictionary.
+            exclude_none (bool): If True, columns whose value is None are left out.
+
+        Returns:
+            list[dict]: One dictionary per instance, in the same order.
+        """
+        exclude = set(exclude)
+        keys = [key for key in cls.column_keys() if key not in exclude]
+
+        if exclude_none:
+            return [
+                {key: value for key in keys if (value := getattr(model, key)) is not None}
+                for model in models
+            ]
+
+        return [{key: getattr(model, key) for key in keys} for model in models]
+
+class MonitoredQueuePool(AsyncAdaptedQueuePool):
+    """
+    MonitoredQueuePool is an AsyncAdaptedQueuePool that records how long checkouts take.
+
+    Attributes:
+        wait_count (int): The number of connection checkouts.
+        wait_time_total (float): The total seconds spent waiting for connections.
+        wait_time_max (float): The longest wait for a connection, in seconds.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.wait_count = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def connect(self):
+        start = perf_counter()
+        try:
+            return super().connect()
+        finally:
+            elapsed = perf_counter() - start
+            self.wait_count += 1
+            self.wait_time_total += elapsed
+            self.wait_time_max = max(self.wait_time_max, elapsed)
+
+
 class DatabaseHandler:
     """
     DatabaseHandler is a class that manages the connection to the database using SQLAlchemy's async capabilities.
 
+    The engine is created on first use, so importing the module that builds the handler stays cheap
+    and every worker process creates its own engine.
+
     Attributes:
         engine (AsyncEngine): The SQLAlchemy async engine for database connections.
         async_session (async_sessionmaker): A session factory for creating async sessions.
+        write_queue (WriteQueue | None): The group commit queue used by run_write, if enabled.
+        statement_observers (list[StatementObserver]): Functions called with every executed statement,
+            its parameters and its duration in seconds.
 
     Methods:
+        add_statement_observer: Registers a function called after every executed statement.
+        connect: Creates the engine and opens the first pool connections.
+        warm_up: Executes statements once so their compiled form is cached.
         get_session: An async generator that provides a session for database operations.
-        close: Closes the database engine connection.
+        run_write: Runs a write job and commits it, through the write queue if enabled.
+        pool_stats: Returns the connection pool statistics.
+        close: Drains and closes the database engine connection.
         create_tables: Creates all tables defined in the SQLAlchemy models.
+        create_indexes: Creates the model indexes missing from existing tables.
         drop_tables: Drops all tables defined in the SQLAlchemy models.
     """
-    def __init__(self, database_url: str):
-        self.engine = create_async_engine(database_url, echo=False)
-        self.async_session = async_sessionmaker(
-            self.engine,
-            expire_on_commit=False,
-            class_=AsyncSession
+    def __init__(
+        self,
+        database_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        sqlite_pragmas: dict[str, Any] | None = None,
+        write_queue: bool = False,
+        write_batch_size: int = 64,
+    ):
+        url = make_url(database_url)
+        options: dict[str, Any] = {"pool_pre_ping": pool_pre_ping}
+
+        # In-memory SQLite databases live inside a single connection, so they keep SQLAlchemy's StaticPool.
+        if not (url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")):
+            options.update(
+                poolclass=MonitoredQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+            )
+
+        self._url = url
+        self._options = options
+        self._sqlite_pragmas = sqlite_pragmas if url.get_backend_name() == "sqlite" else None
+        self._engine: AsyncEngine | None = None
+        self._async_session: async_sessionmaker | None = None
+        self.write_queue = (
+            WriteQueue(lambda: self.async_session(), write_batch_size) if write_queue else None
         )
+        self.statement_observers: list[StatementObserver] = []
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if self._engine is None:
+            self._engine = create_async_engine(self._url, echo=False, **self._options)
+
+            if self._sqlite_pragmas:
+                self._set_sqlite_pragmas(self._sqlite_pragmas)
+
+            self._time_statements()
+
+        return self._engine
+
+    @property
+    def async_session(self) -> async_sessionmaker:
+        if self._async_session is None:
+            self._async_session = async_sessionmaker(
+                self.engine,
+                expire_on_commit=False,
+                class_=AsyncSession
+            )
+
+        return self._async_session
+
+    def _set_sqlite_pragmas(self, pragmas: dict[str, Any]) -> None:
+        """
+        Registers a connect hook that applies the given PRAGMA statements to every new SQLite connection.
+
+        Args:
+            pragmas (dict[str, Any]): The pragma names and values, e.g. {"journal_mode": "WAL"}.
+
+        Returns:
+            None
+        """
+        @event.listens_for(self.engine.sync_engine, "connect")
+        def set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+    def _time_statements(self) -> None:
+        """
+        Registers cursor execute hooks that time every statement and pass it to the statement observers.
+
+        Returns:
+            None
+        """
+        @event.listens_for(self.engine.sync_engine, "before_cursor_execute")
+        def start_timer(conn, cursor, statement, parameters, context, executemany):
+            conn.info["statement_started_at"] = perf_counter()
+
+        @event.listens_for(self.engine.sync_engine, "after_cursor_execute")
+        def stop_timer(conn, cursor, statement, parameters, context, executemany):
+            seconds = perf_counter() - conn.info["statement_started_at"]
+
+            for observer in self.statement_observers:
+                observer(statement, parameters, seconds)
+
+    def add_statement_observer(self, observer: "StatementObserver") -> None:
+        """
+        Registers a function called after every executed statement, e.g. to collect metrics.
+
+        Observers run synchronously on the query path, so they must be cheap and must not raise.
+
+        Args:
+            observer (StatementObserver): Called with the SQL string, its parameters and its duration in seconds.
+
+        Returns:
+            None
+        """
+        self.statement_observers.append(observer)
+
+    async def connect(self, warm_connections: int = 0) -> None:
+        """
+        Creates the engine and opens the first pool connections, so the first requests do not pay for them.
+
+        Connections inherited from a parent process are discarded without being closed.
+
+        Args:
+            warm_connections (int): The number of connections to open and return to the pool.
+
+        Returns:
+            None
+        """
+        if self._engine is not None:
+            await self._engine.dispose(close=False)
+
+        connections = [await self.engine.connect() for _ in range(warm_connections)]
+
+        for connection in connections:
+            await connection.close()
+
+    async def warm_up(self, statements: list[tuple[Executable, dict]]) -> None:
+        """
+        Executes statements once so SQLAlchemy caches their compiled form before the first request.
+
+        Args:
+            statements (list[tuple[Executable, dict]]): Read-only statements and the parameters to run them with.
+
+        Returns:
+            None
+        """
+        async with self.engine.connect() as conn:
+            for statement, params in statements:
+                await conn.execute(statement, params)
 
     async def get_session(self) -> AsyncSession: # type: ignore
         """
@@ -62,17 +308,89 @@ class DatabaseHandler:
         async with self.async_session() as session:
             yield session
 
-    async def close(self) -> None:
+    async def run_write(self, job: WriteJob, session: AsyncSession) -> Any:
         """
-        Properly closes the database engine connection.
+        Runs a write job and commits it.
+
+        With the write queue enabled the job runs on the shared writer session and is committed
+        together with other concurrent writes; otherwise it runs and commits on the given session.
+
+        Args:
+            job (WriteJob): The async function performing the writes. It must not commit.
+            session (AsyncSession): The caller's session, used when the write queue is disabled.
+
+        Returns:
+            Any: The value returned by the job.
+        """
+        if self.write_queue is not None:
+            return await self.write_queue.submit(job)
+
+        result = await job(session)
+        await session.commit()
+        return result
+
+    def pool_stats(self) -> dict:
+        """
+        Returns the connection pool statistics.
 
         Args:
             None
 
+        Returns:
+            dict: The pool class, size, checked in/out connections, overflow and checkout wait times.
+        """
+        pool = self.engine.pool
+        stats = {
+            "pool_class": type(pool).__name__,
+            "size": 0,
+            "checked_in": 0,
+            "checked_out": 0,
+            "overflow": 0,
+            "wait_count": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+        }
+
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+            )
+
+        if isinstance(pool, MonitoredQueuePool):
+            stats.update(
+                wait_count=pool.wait_count,
+                wait_time_total=pool.wait_time_total,
+                wait_time_max=pool.wait_time_max,
+            )
+
+        return stats
+
+    async def close(self, drain_timeout: float = 0) -> None:
+        """
+        Properly closes the database engine connection.
+
+        Args:
+            drain_timeout (float): Seconds to wait for checked out connections to be returned before disposing.
+
         Returns:
             None
         """
-        await self.engine.dispose()
+        if self.write_queue is not None:
+            await self.write_queue.close()
+
+        if self._engine is None:
+            return
+
+        pool = self._engine.pool
+        deadline = perf_counter() + drain_timeout
+
+        while isinstance(pool, QueuePool) and pool.checkedout() > 0 and perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+
+        await self._engine.dispose()
 
     async def create_tables(self) -> None:
         """
@@ -92,6 +410,28 @@ class DatabaseHandler:
                 MealModel,
                 DietModel,
                 ExerciseModel,
+                NutritionalDataModel,
                 UserModel
             )
-            await conn.run_sync(BaseModel.metadata.create_all)
\ No newline at end of file
+            await conn.run_sync(BaseModel.metadata.create_all)
+
+    async def create_indexes(self) -> None:
+        """
+        Creates the indexes declared on the SQLAlchemy models that are missing from existing tables.
+
+        create_tables only creates indexes together with new tables, so this brings databases created
+        before an index was declared up to date.
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        def create_missing_indexes(conn) -> None:
+            for table in BaseModel.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(conn, checkfirst=True)
+
+        async with self.engine.begin() as conn:
+            await conn.run_sync(create_missing_indexes)
\ No newline at end of file
@@ -1,6 +1,8 @@
+from .diet import DietGoal
 from .user import UserGender
 
 
 __all__ = [
+    "DietGoal",
     "UserGender",
-]
\ No newline at end of file
+]
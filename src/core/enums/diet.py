@@ -0,0 +1,15 @@
+from src.core.enums.base import BaseEnum
+
+
+class DietGoal(BaseEnum):
+    """
+    DietGoal is an enumeration representing the nutritional goal a diet plan is built for
+
+    Attributes:
+        LOSE: 'lose'
+        MAINTAIN: 'maintain'
+        GAIN: 'gain'
+    """
+    LOSE="lose"
+    MAINTAIN="maintain"
+    GAIN="gain"
@@ -1,12 +1,37 @@
+from .bad_request import INVALID_CURSOR, INVALID_DATE_RANGE, INVALID_IMPORT_ROW
 from .conflict import USER_EMAIL_ALREADY_EXISTS
-from .not_found import USER_NOT_FOUND
-from .success import SUCCESS_DELETE_USER
+from .forbidden import USER_NOT_ADMIN
+from .not_found import (
+    DIET_NOT_FOUND,
+    FOOD_NOT_FOUND,
+    MEAL_NOT_FOUND,
+    NUTRITIONAL_DATA_NOT_FOUND,
+    USER_NOT_FOUND
+)
+from .success import SUCCESS_DELETE_MEAL, SUCCESS_DELETE_USER
 from .authorization import WRONG_USER_PASSWORD, USER_NOT_AUTHORIZED
+from .unavailable import SERVER_BUSY
+from .too_many_requests import TOO_MANY_REQUESTS
+from .unprocessable_entity import DIET_PLAN_NO_FOODS
+from .unsupported_media_type import UNSUPPORTED_IMPORT_FORMAT
 
 __all__ = [
+    "INVALID_CURSOR",
+    "INVALID_IMPORT_ROW",
+    "INVALID_DATE_RANGE",
     "USER_EMAIL_ALREADY_EXISTS",
     "USER_NOT_FOUND",
+    "DIET_NOT_FOUND",
+    "MEAL_NOT_FOUND",
+    "FOOD_NOT_FOUND",
+    "NUTRITIONAL_DATA_NOT_FOUND",
     "SUCCESS_DELETE_USER",
+    "SUCCESS_DELETE_MEAL",
     "WRONG_USER_PASSWORD",
-    "USER_NOT_AUTHORIZED"
-]
\ No newline at end of file
+    "USER_NOT_AUTHORIZED",
+    "USER_NOT_ADMIN",
+    "SERVER_BUSY",
+    "TOO_MANY_REQUESTS",
+    "DIET_PLAN_NO_FOODS",
+    "UNSUPPORTED_IMPORT_FORMAT"
+]
@@ -0,0 +1,3 @@
+INVALID_CURSOR = "Cursor de paginação inválido."
+INVALID_IMPORT_ROW = "Linha inválida."
+INVALID_DATE_RANGE = "Intervalo de datas inválido."
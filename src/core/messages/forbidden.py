@@ -0,0 +1 @@
+USER_NOT_ADMIN = "Acesso restrito a administradores."
\ No newline at end of file
@@ -1 +1,5 @@
-USER_NOT_FOUND = "Usuário não encontrado."
\ No newline at end of file
+USER_NOT_FOUND = "Usuário não encontrado."
+DIET_NOT_FOUND = "Dieta não encontrada."
+MEAL_NOT_FOUND = "Refeição não encontrada."
+FOOD_NOT_FOUND = "Alimento não encontrado."
+NUTRITIONAL_DATA_NOT_FOUND = "Dados nutricionais não encontrados."
@@ -1 +1,2 @@
-SUCCESS_DELETE_USER = "Usuário deletado com sucesso."
\ No newline at end of file
+SUCCESS_DELETE_USER = "Usuário deletado com sucesso."
+SUCCESS_DELETE_MEAL = "Refeição deletada com sucesso."
@@ -0,0 +1 @@
+TOO_MANY_REQUESTS = "Muitas tentativas, tente novamente mais tarde."
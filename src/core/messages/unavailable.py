@@ -0,0 +1 @@
+SERVER_BUSY = "Servidor ocupado, tente novamente em instantes."
\ No newline at end of file
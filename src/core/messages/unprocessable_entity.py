@@ -0,0 +1 @@
+DIET_PLAN_NO_FOODS = "Nenhum alimento disponível para montar o plano de dieta."
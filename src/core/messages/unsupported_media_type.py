@@ -0,0 +1 @@
+UNSUPPORTED_IMPORT_FORMAT = "Formato de importação não suportado, envie text/csv ou application/x-ndjson."
@@ -0,0 +1,252 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Iterator
+
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+
+    if extra:
+        pairs.append(extra)
+
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Metric(ABC):
+    """
+    Metric is the base class for the metrics rendered in the Prometheus text format.
+
+    Attributes:
+        name (str): The metric name.
+        documentation (str): The HELP text of the metric.
+        label_names (tuple[str, ...]): The names of the labels every sample has.
+
+    Methods:
+        render: Returns the metric in the Prometheus text exposition format.
+    """
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+
+    @abstractmethod
+    def samples(self) -> Iterator[str]:
+        """
+        Yields the sample lines of the metric.
+
+        Returns:
+            Iterator[str]: One Prometheus text line per sample.
+        """
+
+    def render(self) -> str:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self.samples(),
+        ]
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """
+    Counter is a metric that only goes up, with one value per set of label values.
+    """
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterator[str]:
+        for labels, value in self._values.items():
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {value}"
+
+
+class Gauge(Counter):
+    """
+    Gauge is a metric that can go up and down, with one value per set of label values.
+    """
+    type_name = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    """
+    Histogram counts observations in cumulative buckets, with one series per set of label values.
+
+    Attributes:
+        buckets (tuple[float, ...]): The upper bounds of the buckets, in ascending order.
+    """
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = buckets
+        # Per label values: the observations of each bucket (not cumulative, last one is +Inf) and their sum.
+        self._series: dict[tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def samples(self) -> Iterator[str]:
+        for labels, (counts, total) in self._series.items():
+            cumulative = 0
+
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                label_text = _format_labels(self.label_names, labels, f'le="{bound}"')
+                yield f"{self.name}_bucket{label_text} {cumulative}"
+
+            label_text = _format_labels(self.label_names, labels)
+            yield f"{self.name}_sum{label_text} {total}"
+            yield f"{self.name}_count{label_text} {cumulative}"
+
+
+class RequestTimings:
+    """
+    RequestTimings accumulates the time a request spends in each instrumented phase.
+
+    Attributes:
+        phases (dict[str, float]): The seconds spent per phase, e.g. "database" or "password_hash".
+    """
+    __slots__ = ("phases",)
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+
+
+request_timings: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """
+    Adds time to a phase of the current request. Does nothing outside of a request.
+
+    Args:
+        phase (str): The phase name.
+        seconds (float): The time spent.
+
+    Returns:
+        None
+    """
+    timings = request_timings.get()
+
+    if timings is not None:
+        timings.phases[phase] = timings.phases.get(phase, 0.0) + seconds
+
+
+class timed_phase:
+    """
+    Context manager that records the time spent inside it in a phase of the current request.
+
+    Args:
+        phase (str): The phase name.
+    """
+    __slots__ = ("phase", "started_at")
+
+    def __init__(self, phase: str) -> None:
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.started_at = perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        record_phase(self.phase, perf_counter() - self.started_at)
+
+
+class MetricsRegistry:
+    """
+    MetricsRegistry holds the application metrics.
+
+    Attributes:
+        requests (Counter): Finished requests per method, route and status code.
+        in_flight (Gauge): Requests being processed.
+        latency (Histogram): Request latency per method and route.
+        phase_latency (Histogram): Time per request spent in each phase, per method and route.
+
+    Methods:
+        observe_request: Records a finished request.
+        render: Returns every metric in the Prometheus text exposition format.
+    """
+    def __init__(self) -> None:
+        self.requests = Counter(
+            "http_requests_total",
+            "Finished HTTP requests.",
+            ("method", "route", "status"),
+        )
+        self.in_flight = Gauge(
+            "http_requests_in_flight",
+            "HTTP requests being processed.",
+        )
+        self.latency = Histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency.",
+            ("method", "route"),
+        )
+        self.phase_latency = Histogram(
+            "http_request_phase_duration_seconds",
+            "Time spent per HTTP request in database queries, password hashing and serialization.",
+            ("method", "route", "phase"),
+        )
+
+    def observe_request(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        timings: RequestTimings
+    ) -> None:
+        """
+        Records a finished request.
+
+        Args:
+            method (str): The HTTP method.
+            route (str): The route path template, e.g. "/user/list".
+            status (int): The response status code.
+            seconds (float): The request latency.
+            timings (RequestTimings): The time spent per phase during the request.
+
+        Returns:
+            None
+        """
+        self.requests.inc(method, route, str(status))
+        self.latency.observe(seconds, method, route)
+
+        for phase, phase_seconds in timings.phases.items():
+            self.phase_latency.observe(phase_seconds, method, route, phase)
+
+    def render(self) -> str:
+        metrics = (self.requests, self.in_flight, self.latency, self.phase_latency)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+metrics = MetricsRegistry()
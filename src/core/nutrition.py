@@ -0,0 +1,143 @@
+from typing import Sequence
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# The energy of each macronutrient, in kcal per gram (Atwater factors), in distribution order.
+ENERGY_NUTRIENTS = ("proteins", "fats", "carbohydrates")
+ENERGY_PER_GRAM = (4.0, 9.0, 4.0)
+
+
+class NutritionEngine:
+    """
+    NutritionEngine computes nutrients for batches of foods at once.
+
+    Inputs are columns, one sequence of floats per nutrient, with one entry per food, so a batch
+    covering many diets is summed in a few array operations instead of one Decimal addition per
+    row. NumPy is used when installed (the "nutrition" extra); otherwise the same results are
+    computed with plain floats.
+
+    Args:
+        use_numpy (bool | None): Whether to use NumPy, defaults to whether it is installed.
+
+    Attributes:
+        use_numpy (bool): Whether NumPy is used.
+
+    Methods:
+        group_totals: Sums the nutrients of the foods of each group.
+        energy_distribution: Computes the share of energy of each macronutrient.
+        body_mass_index: Computes body mass indexes.
+    """
+    def __init__(self, use_numpy: bool | None = None) -> None:
+        if use_numpy and numpy is None:
+            raise ValueError("The NumPy nutrition engine requires the numpy package")
+
+        self.use_numpy = numpy is not None if use_numpy is None else use_numpy
+
+    def group_totals(
+        self,
+        groups: Sequence[int],
+        columns: Sequence[Sequence[float]],
+        size: int,
+        factors: Sequence[float] | None = None
+    ) -> list[list[float]]:
+        """
+        Sums the nutrients of the foods of each group, e.g. of each diet or of each meal of each diet.
+
+        Args:
+            groups (Sequence[int]): The group of each food, from 0 to size - 1.
+            columns (Sequence[Sequence[float]]): The values of each nutrient, with one entry per food.
+            size (int): The number of groups.
+            factors (Sequence[float] | None): The multiplier of each food (e.g. its quantity), defaults to 1.
+
+        Returns:
+            list[list[float]]: The totals of each group, one value per column; groups without foods are zeroed.
+        """
+        if self.use_numpy:
+            groups = numpy.asarray(groups, dtype=numpy.intp)
+            matrix = numpy.asarray(columns, dtype=numpy.float64).reshape(len(columns), len(groups))
+
+            if factors is not None:
+                matrix = matrix * numpy.asarray(factors, dtype=numpy.float64)
+
+            totals = numpy.zeros((size, len(columns)))
+
+            for index, column in enumerate(matrix):
+                totals[:, index] = numpy.bincount(groups, weights=column, minlength=size)
+
+            return totals.tolist()
+
+        totals = [[0.0] * len(columns) for _ in range(size)]
+
+        for index, column in enumerate(columns):
+            if factors is None:
+                for group, value in zip(groups, column):
+                    totals[group][index] += value
+            else:
+                for group, value, factor in zip(groups, column, factors):
+                    totals[group][index] += value * factor
+
+        return totals
+
+    def energy_distribution(
+        self,
+        proteins: Sequence[float],
+        fats: Sequence[float],
+        carbohydrates: Sequence[float]
+    ) -> list[list[float]]:
+        """
+        Computes, for each entry, the percentage of the macronutrient energy coming from each macronutrient.
+
+        Args:
+            proteins (Sequence[float]): The proteins of each entry, in grams.
+            fats (Sequence[float]): The fats of each entry, in grams.
+            carbohydrates (Sequence[float]): The carbohydrates of each entry, in grams.
+
+        Returns:
+            list[list[float]]: The percentages of proteins, fats and carbohydrates of each entry, rounded
+                to 2 decimals; zeroed for entries without energy.
+        """
+        if self.use_numpy:
+            grams = numpy.asarray((proteins, fats, carbohydrates), dtype=numpy.float64).reshape(3, len(proteins)).T
+            energy = grams * numpy.asarray(ENERGY_PER_GRAM)
+            total = energy.sum(axis=1, keepdims=True)
+            shares = numpy.divide(energy * 100, total, out=numpy.zeros_like(energy), where=total > 0)
+            return numpy.round(shares, 2).tolist()
+
+        distribution = []
+
+        for grams in zip(proteins, fats, carbohydrates):
+            energy = [value * factor for value, factor in zip(grams, ENERGY_PER_GRAM)]
+            total = sum(energy)
+            distribution.append([round(value * 100 / total, 2) if total > 0 else 0.0 for value in energy])
+
+        return distribution
+
+    def body_mass_index(self, weights: Sequence[float], heights: Sequence[float]) -> list[float]:
+        """
+        Computes body mass indexes, the CMI of NutritionalDataModel.
+
+        Args:
+            weights (Sequence[float]): The weights, in kilograms.
+            heights (Sequence[float]): The heights, in centimeters, in the same order.
+
+        Returns:
+            list[float]: The body mass index of each entry, rounded to 2 decimals; zeroed for entries without height.
+        """
+        if self.use_numpy:
+            meters = numpy.asarray(heights, dtype=numpy.float64) / 100
+            squares = meters * meters
+            weights = numpy.asarray(weights, dtype=numpy.float64)
+            indexes = numpy.divide(weights, squares, out=numpy.zeros_like(weights), where=squares > 0)
+            return numpy.round(indexes, 2).tolist()
+
+        return [
+            round(weight / (height / 100) ** 2, 2) if height > 0 else 0.0
+            for weight, height in zip(weights, heights)
+        ]
+
+
+# The engine used by the application.
+nutrition_engine = NutritionEngine()
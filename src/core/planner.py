@@ -0,0 +1,333 @@
+import importlib.util
+import re
+from math import inf
+from typing import NamedTuple, Sequence
+
+from src.core.enums import DietGoal
+from src.core.settings import settings
+from src.core.text import normalize_text
+from src.core.workers import WorkerPool
+
+# The nutrients a plan is solved for, in vector order.
+PLAN_NUTRIENTS = ("calories", "proteins", "fats", "carbohydrates")
+
+# Mifflin-St Jeor constant per gender; unknown genders use the mean of both.
+GENDER_CONSTANTS = {"M": 5.0, "F": -161.0}
+UNKNOWN_GENDER_CONSTANT = -78.0
+DEFAULT_AGE = 30
+ACTIVITY_FACTOR = 1.4
+
+# Per goal: the multiplier of the maintenance calories and the proteins per kg of body weight.
+GOAL_FACTORS = {
+    DietGoal.LOSE: (0.8, 2.0),
+    DietGoal.MAINTAIN: (1.0, 1.6),
+    DietGoal.GAIN: (1.1, 1.8),
+}
+FAT_ENERGY_SHARE = 0.25
+
+# Word prefixes of the free text goals, checked in order.
+GOAL_KEYWORDS = (
+    (DietGoal.LOSE, ("perd", "emagrec", "redu", "defin", "lose", "cut")),
+    (DietGoal.GAIN, ("ganh", "massa", "hipertrof", "aument", "gain", "bulk")),
+)
+
+# The objective weight of each food used, so the solver prefers fewer foods between equal plans.
+FOOD_PENALTY = 1e-3
+
+_EXCLUSION_SEPARATORS = re.compile(r"[,;/\n]+|\s+e\s+|\s+and\s+")
+
+MILP_AVAILABLE = importlib.util.find_spec("scipy") is not None
+
+# Diet plans are solved on a process pool, so a long solve never holds the event loop or the GIL.
+plan_pool = WorkerPool(
+    max_workers=settings.DIET_PLAN_WORKERS,
+    max_pending=settings.DIET_PLAN_MAX_PENDING,
+    use_processes=True,
+)
+
+
+class PlanTargets(NamedTuple):
+    """
+    PlanTargets are the daily nutrient targets of a diet plan.
+
+    Attributes:
+        calories (float): The calories, in kcal.
+        proteins (float): The proteins, in grams.
+        fats (float): The fats, in grams.
+        carbohydrates (float): The carbohydrates, in grams.
+    """
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
+
+
+class PlanProblem(NamedTuple):
+    """
+    PlanProblem is a diet plan to solve: how many portions of each candidate food reach the targets.
+
+    Attributes:
+        targets (PlanTargets): The daily nutrient targets.
+        foods (tuple[tuple[float, ...], ...]): The PLAN_NUTRIENTS of one portion of each candidate food.
+        prices (tuple[float, ...]): The price of one portion of each candidate food.
+        budget (float | None): The most the plan may cost, or None for no limit.
+        max_portions (int): The most portions of one food.
+        max_foods (int): The most distinct foods.
+        time_limit (float): The seconds the solver may run.
+    """
+    targets: PlanTargets
+    foods: tuple[tuple[float, ...], ...]
+    prices: tuple[float, ...]
+    budget: float | None
+    max_portions: int
+    max_foods: int
+    time_limit: float
+
+
+class PlanSolution(NamedTuple):
+    """
+    PlanSolution is a solved diet plan.
+
+    Attributes:
+        portions (tuple[int, ...]): The portions of each candidate food, in the order of the problem.
+        solver (str): "milp" for the integer program, "greedy" for the fallback heuristic.
+    """
+    portions: tuple[int, ...]
+    solver: str
+
+
+def parse_goal(goal: str | None) -> DietGoal:
+    """
+    Reads the free text goal of the nutritional data, e.g. "Perder peso" or "ganho de massa".
+
+    Args:
+        goal (str | None): The goal.
+
+    Returns:
+        DietGoal: The goal, MAINTAIN when it is missing or not recognized.
+    """
+    words = normalize_text(goal or "").split()
+
+    for diet_goal, prefixes in GOAL_KEYWORDS:
+        if any(word.startswith(prefixes) for word in words):
+            return diet_goal
+
+    return DietGoal.MAINTAIN
+
+
+def parse_exclusions(*texts: str | None) -> tuple[str, ...]:
+    """
+    Splits free text lists of foods to avoid, e.g. the allergies "Leite, amendoim e camarão".
+
+    Args:
+        *texts (str | None): The lists, separated by commas, semicolons, slashes, lines or "e".
+
+    Returns:
+        tuple[str, ...]: The distinct normalized terms, sorted.
+    """
+    terms = {
+        normalize_text(term)
+        for text in texts if text
+        for term in _EXCLUSION_SEPARATORS.split(text)
+    }
+    return tuple(sorted(term for term in terms if term))
+
+
+def is_excluded(name: str, exclusions: Sequence[str]) -> bool:
+    """
+    Checks whether a food name contains a word starting with one of the exclusions.
+
+    Args:
+        name (str): The name of the food.
+        exclusions (Sequence[str]): The normalized terms to avoid.
+
+    Returns:
+        bool: True if the food must be left out of the plan.
+    """
+    padded = f" {normalize_text(name)}"
+    return any(f" {term}" in padded for term in exclusions)
+
+
+def compute_targets(
+    weight: float,
+    height: float,
+    age: int | None,
+    gender: str | None,
+    goal: DietGoal
+) -> PlanTargets:
+    """
+    Computes daily targets from the Mifflin-St Jeor resting energy of the user.
+
+    Proteins follow the body weight, fats take FAT_ENERGY_SHARE of the energy and carbohydrates the
+    rest. Values are rounded to 50 kcal and 5 g, so users with similar profiles share cached plans.
+
+    Args:
+        weight (float): The weight, in kilograms.
+        height (float): The height, in centimeters.
+        age (int | None): The age in years, DEFAULT_AGE when unknown.
+        gender (str | None): The UserGender value, the mean of both constants when unknown.
+        goal (DietGoal): The goal.
+
+    Returns:
+        PlanTargets: The rounded targets.
+    """
+    resting = (
+        10 * weight + 6.25 * height - 5 * (age or DEFAULT_AGE)
+        + GENDER_CONSTANTS.get(gender, UNKNOWN_GENDER_CONSTANT)
+    )
+    calorie_factor, proteins_per_kg = GOAL_FACTORS[goal]
+
+    calories = max(resting, 0) * ACTIVITY_FACTOR * calorie_factor
+    proteins = proteins_per_kg * weight
+    fats = calories * FAT_ENERGY_SHARE / 9
+    carbohydrates = max(calories - proteins * 4 - fats * 9, 0) / 4
+
+    return PlanTargets(
+        calories=round(calories / 50) * 50.0,
+        proteins=round(proteins / 5) * 5.0,
+        fats=round(fats / 5) * 5.0,
+        carbohydrates=round(carbohydrates / 5) * 5.0,
+    )
+
+
+def plan_deviation(targets: Sequence[float], totals: Sequence[float]) -> float:
+    """
+    Measures how far totals are from the targets, as the sum of the relative error of each nutrient.
+
+    Args:
+        targets (Sequence[float]): The targets, in PLAN_NUTRIENTS order.
+        totals (Sequence[float]): The totals, in the same order.
+
+    Returns:
+        float: The deviation, 0 when every target is met exactly.
+    """
+    return sum(abs(total - target) / target for target, total in zip(targets, totals) if target > 0)
+
+
+def solve_plan(problem: PlanProblem, use_milp: bool | None = None) -> PlanSolution:
+    """
+    Solves a diet plan, minimizing plan_deviation within the portion, food and budget limits.
+
+    The integer program is solved with SciPy's HiGHS interface when SciPy is installed (the
+    "nutrition" extra). Without it, or when the solver finds no solution in time, a greedy
+    heuristic is used. Runs on plan_pool, so it must stay a picklable module level function.
+
+    Args:
+        problem (PlanProblem): The plan to solve.
+        use_milp (bool | None): Whether to use the integer program, defaults to whether SciPy is installed.
+
+    Returns:
+        PlanSolution: The portions of each food.
+    """
+    if (MILP_AVAILABLE if use_milp is None else use_milp) and problem.foods:
+        portions = _solve_milp(problem)
+
+        if portions is not None:
+            return PlanSolution(portions, "milp")
+
+    return PlanSolution(_solve_greedy(problem), "greedy")
+
+
+def _solve_milp(problem: PlanProblem) -> tuple[int, ...] | None:
+    """
+    Solves the plan as a mixed integer program.
+
+    Variables: the portions of each food (integer), whether each food is used (binary) and, per
+    nutrient, the excess and shortfall against its target. The objective is the sum of the excesses
+    and shortfalls divided by their targets, plus FOOD_PENALTY per food used.
+    """
+    import numpy
+    from scipy.optimize import Bounds, LinearConstraint, milp
+
+    foods, nutrients = len(problem.foods), len(PLAN_NUTRIENTS)
+    values = numpy.asarray(problem.foods, dtype=numpy.float64).reshape(foods, nutrients).T
+    targets = numpy.asarray(problem.targets, dtype=numpy.float64)
+    weights = numpy.divide(1.0, targets, out=numpy.zeros_like(targets), where=targets > 0)
+    identity = numpy.eye(foods)
+
+    objective = numpy.concatenate([numpy.zeros(foods), numpy.full(foods, FOOD_PENALTY), weights, weights])
+    constraints = [
+        # Totals minus the excess plus the shortfall equal the targets.
+        LinearConstraint(
+            numpy.hstack([values, numpy.zeros((nutrients, foods)), -numpy.eye(nutrients), numpy.eye(nutrients)]),
+            targets,
+            targets,
+        ),
+        # A food has portions only when it is used.
+        LinearConstraint(
+            numpy.hstack([identity, -problem.max_portions * identity, numpy.zeros((foods, 2 * nutrients))]),
+            -inf,
+            0,
+        ),
+        LinearConstraint(
+            numpy.concatenate([numpy.zeros(foods), numpy.ones(foods), numpy.zeros(2 * nutrients)]),
+            0,
+            problem.max_foods,
+        ),
+    ]
+
+    if problem.budget is not None:
+        constraints.append(LinearConstraint(
+            numpy.concatenate([numpy.asarray(problem.prices, dtype=numpy.float64), numpy.zeros(foods + 2 * nutrients)]),
+            0,
+            problem.budget,
+        ))
+
+    result = milp(
+        objective,
+        constraints=constraints,
+        integrality=numpy.concatenate([numpy.ones(2 * foods), numpy.zeros(2 * nutrients)]),
+        bounds=Bounds(
+            numpy.zeros(2 * foods + 2 * nutrients),
+            numpy.concatenate([numpy.full(foods, problem.max_portions), numpy.ones(foods), numpy.full(2 * nutrients, inf)]),
+        ),
+        options={"time_limit": problem.time_limit},
+    )
+
+    if result.x is None:
+        return None
+
+    return tuple(int(round(portions)) for portions in result.x[:foods])
+
+
+def _solve_greedy(problem: PlanProblem) -> tuple[int, ...]:
+    """
+    Solves the plan by local search: starting from an empty plan, applies the single portion added
+    or removed that lowers plan_deviation the most, until no move improves it.
+    """
+    portions = [0] * len(problem.foods)
+    totals = [0.0] * len(PLAN_NUTRIENTS)
+    cost = 0.0
+    used = 0
+    deviation = plan_deviation(problem.targets, totals)
+
+    while True:
+        best_move, best_deviation = None, deviation
+
+        for index, food in enumerate(problem.foods):
+            for step in (1, -1):
+                count = portions[index] + step
+
+                if count < 0 or count > problem.max_portions:
+                    continue
+                if step == 1 and portions[index] == 0 and used >= problem.max_foods:
+                    continue
+                if step == 1 and problem.budget is not None and cost + problem.prices[index] > problem.budget:
+                    continue
+
+                candidate = plan_deviation(
+                    problem.targets, [total + step * value for total, value in zip(totals, food)]
+                )
+
+                if candidate < best_deviation - 1e-9:
+                    best_move, best_deviation = (index, step), candidate
+
+        if best_move is None:
+            return tuple(portions)
+
+        index, step = best_move
+        used += (portions[index] == 0) - (portions[index] + step == 0)
+        portions[index] += step
+        cost += step * problem.prices[index]
+        totals = [total + step * value for total, value in zip(totals, problem.foods[index])]
+        deviation = best_deviation
@@ -0,0 +1,196 @@
+import logging
+import re
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![$:\w])\d+(?:\.\d+)?\b")
+_PARAMETER_LIST = re.compile(r"\(\s*(?:\?|%s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%s|:\w+|\$\d+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """
+    Normalizes a SQL statement so executions that differ only by their values share one fingerprint.
+
+    Literals become "?", lists of parameters (e.g. an expanded IN) become "(...)" and whitespace is collapsed.
+
+    Args:
+        statement (str): The SQL statement sent to the database.
+
+    Returns:
+        str: The statement fingerprint.
+    """
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PARAMETER_LIST.sub("(...)", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    Replaces statement parameter values by their type names, so logs never hold user data.
+
+    Args:
+        parameters (Any): The DBAPI parameters: a sequence, a mapping, or a list of them for executemany.
+
+    Returns:
+        Any: The same structure with type names instead of values.
+    """
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (list, tuple, dict)):
+            return f"<{len(parameters)} parameter sets>"
+
+        return tuple(type(value).__name__ for value in parameters)
+
+    return type(parameters).__name__
+
+
+class QueryStats:
+    """
+    QueryStats holds the executions of one statement fingerprint.
+
+    Attributes:
+        count (int): The number of executions.
+        total (float): The total duration, in seconds.
+        max (float): The longest execution, in seconds.
+    """
+    __slots__ = ("count", "total", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+
+request_queries: ContextVar[dict[str, QueryStats] | None] = ContextVar("request_queries", default=None)
+
+
+class QueryProfiler:
+    """
+    QueryProfiler collects statement statistics per request and reports slow queries and N+1 patterns.
+
+    Register observe as a DatabaseHandler statement observer, and open a profile per request with
+    start_request/finish_request (done by QueryProfilerMiddleware).
+
+    Attributes:
+        slow_threshold (float): Statements slower than this many seconds are logged. Zero disables it.
+        repeat_threshold (int): Requests running one fingerprint more times than this are flagged. Zero disables it.
+        max_fingerprints (int): The maximum number of fingerprints kept in the process wide totals.
+        totals (dict[str, QueryStats]): The statistics of every fingerprint seen, across requests.
+
+    Methods:
+        observe: Records an executed statement.
+        start_request: Opens the query profile of a request.
+        finish_request: Closes the query profile of a request and flags repeated statements.
+        top: Returns the fingerprints with the highest total duration.
+    """
+    def __init__(self, slow_threshold: float, repeat_threshold: int, max_fingerprints: int = 1000) -> None:
+        self.slow_threshold = slow_threshold
+        self.repeat_threshold = repeat_threshold
+        self.max_fingerprints = max_fingerprints
+        self.totals: dict[str, QueryStats] = {}
+
+    def observe(self, statement: str, parameters: Any, seconds: float) -> None:
+        """
+        Records an executed statement in the current request profile and the process wide totals.
+
+        Args:
+            statement (str): The SQL statement.
+            parameters (Any): The statement parameters.
+            seconds (float): The statement duration.
+
+        Returns:
+            None
+        """
+        key = fingerprint(statement)
+        stats = self.totals.get(key)
+
+        if stats is None and len(self.totals) < self.max_fingerprints:
+            stats = self.totals[key] = QueryStats()
+
+        if stats is not None:
+            stats.add(seconds)
+
+        queries = request_queries.get()
+
+        if queries is not None:
+            request_stats = queries.get(key)
+
+            if request_stats is None:
+                request_stats = queries[key] = QueryStats()
+
+            request_stats.add(seconds)
+
+        if self.slow_threshold and seconds >= self.slow_threshold:
+            logger.warning(
+                "Slow query (%.1f ms): %s parameters=%s",
+                seconds * 1000,
+                key,
+                redact_parameters(parameters)
+            )
+
+    def start_request(self) -> object:
+        """
+        Opens the query profile of the current request.
+
+        Returns:
+            object: The token to pass to finish_request.
+        """
+        return request_queries.set({})
+
+    def finish_request(self, token: object, route: str) -> dict[str, QueryStats]:
+        """
+        Closes the query profile of the current request, logging fingerprints run more than repeat_threshold times.
+
+        Args:
+            token (object): The token returned by start_request.
+            route (str): The route the request was served by, used in the log.
+
+        Returns:
+            dict[str, QueryStats]: The statistics of every fingerprint the request ran.
+        """
+        queries = request_queries.get() or {}
+        request_queries.reset(token)
+
+        if self.repeat_threshold:
+            for key, stats in queries.items():
+                if stats.count > self.repeat_threshold:
+                    logger.warning(
+                        "Possible N+1 on %s: %d executions (%.1f ms) of %s",
+                        route,
+                        stats.count,
+                        stats.total * 1000,
+                        key
+                    )
+
+        return queries
+
+    def top(self, limit: int = 20) -> list[dict]:
+        """
+        Returns the fingerprints with the highest total duration across requests.
+
+        Args:
+            limit (int): The maximum number of fingerprints returned.
+
+        Returns:
+            list[dict]: The fingerprint, count, total and max duration of each statement.
+        """
+        ranked = sorted(self.totals.items(), key=lambda item: item[1].total, reverse=True)
+
+        return [
+            {"fingerprint": key, "count": stats.count, "total": stats.total, "max": stats.max}
+            for key, stats in ranked[:limit]
+        ]
@@ -0,0 +1,145 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from math import ceil
+from time import monotonic
+
+from fastapi import HTTPException
+
+from src.core import messages
+
+
+class RateLimitStore(ABC):
+    """
+    RateLimitStore is the base class for the storage behind RateLimiter.
+
+    The in-memory store only limits the process it runs in. To share the limits between workers
+    or hosts, subclass it with a shared backend (e.g. Redis sorted sets) and hand it to the limiters.
+
+    Methods:
+        hit: Records an attempt for a key unless its limit was reached.
+        reset: Forgets the attempts of a key.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> float:
+        """
+        Records an attempt for a key, unless the key already made limit attempts in the last window seconds.
+
+        Args:
+            key (str): The rate limited key.
+            limit (int): The maximum number of attempts in the window.
+            window (float): The window length, in seconds.
+
+        Returns:
+            float: Zero if the attempt was allowed, otherwise the seconds until the next one is.
+        """
+
+    @abstractmethod
+    async def reset(self, key: str) -> None:
+        """
+        Forgets the attempts of a key.
+
+        Args:
+            key (str): The rate limited key.
+
+        Returns:
+            None
+        """
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """
+    MemoryRateLimitStore keeps a sliding window log of attempt times per key, in process memory.
+
+    Each key holds at most limit timestamps, and the least recently used keys are dropped above
+    max_keys, so memory stays bounded under attacks spread over many keys.
+
+    Attributes:
+        max_keys (int): The maximum number of keys tracked.
+    """
+    def __init__(self, max_keys: int) -> None:
+        self.max_keys = max_keys
+        self._data: OrderedDict[str, deque[float]] = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: float) -> float:
+        now = monotonic()
+        attempts = self._data.get(key)
+
+        if attempts is None:
+            attempts = self._data[key] = deque()
+
+            while len(self._data) > self.max_keys:
+                self._data.popitem(last=False)
+        else:
+            self._data.move_to_end(key)
+
+        while attempts and attempts[0] <= now - window:
+            attempts.popleft()
+
+        if len(attempts) >= limit:
+            return attempts[0] + window - now
+
+        attempts.append(now)
+        return 0.0
+
+    async def reset(self, key: str) -> None:
+        self._data.pop(key, None)
+
+
+class RateLimiter:
+    """
+    RateLimiter rejects a key with 429 once it made limit attempts within a sliding window.
+
+    Attributes:
+        store (RateLimitStore): The storage of the attempts.
+        name (str): The prefix of the keys in the store, so limiters can share a store.
+        limit (int): The maximum number of attempts in the window. Zero disables the limiter.
+        window (float): The window length, in seconds.
+
+    Methods:
+        check: Records an attempt, raising 429 if the key is over its limit.
+        reset: Forgets the attempts of a key.
+    """
+    def __init__(self, store: RateLimitStore, name: str, limit: int, window: float) -> None:
+        self.store = store
+        self.name = name
+        self.limit = limit
+        self.window = window
+
+    async def check(self, key: str) -> None:
+        """
+        Records an attempt for a key.
+
+        Args:
+            key (str): The rate limited key, e.g. a client address or an email.
+
+        Returns:
+            None
+
+        Raises:
+            HTTPException: If the key made limit attempts within the window (429), with a Retry-After header.
+        """
+        if self.limit <= 0:
+            return
+
+        retry_after = await self.store.hit(f"{self.name}:{key}", self.limit, self.window)
+
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=429,
+                detail=messages.TOO_MANY_REQUESTS,
+                headers={"Retry-After": str(ceil(retry_after))}
+            )
+
+    async def reset(self, key: str) -> None:
+        """
+        Forgets the attempts of a key.
+
+        Args:
+            key (str): The rate limited key.
+
+        Returns:
+            None
+        """
+        if self.limit > 0:
+            await self.store.reset(f"{self.name}:{key}")
@@ -1,4 +1,12 @@
-from pydantic import BaseModel, ConfigDict
+from functools import cache
+from typing import Iterable, Sequence
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+
+@cache
+def _list_adapter(schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[schema])
 
 
 class BaseSchema(BaseModel):
@@ -7,6 +15,8 @@ class BaseSchema(BaseModel):
 
     Methods:
         to_dict: Converts the model instance to a dictionary, excluding specified fields and including additional fields
+        to_dicts: Converts a list of instances to dictionaries in a single serializer call
+        from_dicts: Validates a list of dictionaries into instances in a single validator call
     """
 
     model_config = ConfigDict(
@@ -15,23 +25,60 @@ class BaseSchema(BaseModel):
         extra="ignore"
     )
     
-    def to_dict(self, exclude: list[str] = [], include: dict = {}) -> dict:
+    def to_dict(self, exclude: Iterable[str] = (), include: dict | None = None) -> dict:
         """
         Converts the model instance to a dictionary.
 
+        Excluded fields are skipped by the serializer instead of being removed from the result.
+
         Args:
-            exclude (list[str]): List of field names to exclude from the dictionary.
-            include (dict): Dictionary of additional fields to include in the output.
+            exclude (Iterable[str]): Field names to exclude from the dictionary.
+            include (dict | None): Additional fields to include in the output.
 
         Returns:
             dict: A dictionary representation of the model instance, excluding specified fields and including additional fields.
         """
-        data = self.model_dump(exclude_none=True)
-
-        for field in exclude:
-            data.pop(field, None)
+        data = self.model_dump(exclude=set(exclude) or None, exclude_none=True)
 
         if include:
             data.update(include)
 
-        return data
\ No newline at end of file
+        return data
+
+    @classmethod
+    def to_dicts(cls, items: Sequence["BaseSchema"], exclude: Iterable[str] = ()) -> list[dict]:
+        """
+        Converts a list of instances of this schema to dictionaries.
+
+        The list is dumped by one cached TypeAdapter, instead of one model_dump call per item.
+
+        Args:
+            items (Sequence[BaseSchema]): The instances to convert.
+            exclude (Iterable[str]): Field names to exclude from every dictionary.
+
+        Returns:
+            list[dict]: One dictionary per instance, in the same order.
+        """
+        exclude = set(exclude)
+
+        return _list_adapter(cls).dump_python(
+            items,
+            exclude={"__all__": exclude} if exclude else None,
+            exclude_none=True
+        )
+
+    @classmethod
+    def from_dicts(cls, items: Sequence[dict]) -> list["BaseSchema"]:
+        """
+        Validates a list of dictionaries into instances of this schema.
+
+        The list, nested schemas included, is validated by one cached TypeAdapter, which is faster
+        than one model_construct call per instance.
+
+        Args:
+            items (Sequence[dict]): The dictionaries to validate.
+
+        Returns:
+            list[BaseSchema]: One instance per dictionary, in the same order.
+        """
+        return _list_adapter(cls).validate_python(items)
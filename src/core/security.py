@@ -1,23 +1,62 @@
+from functools import partial
+from time import time
+
 import bcrypt
-from jose import jwt
+from fastapi import HTTPException
 
+from src.core import messages
+from src.core.metrics import timed_phase
+from src.core.rate_limit import MemoryRateLimitStore, RateLimiter
 from src.core.settings import settings
+from src.core.tokens import InvalidTokenError, TokenCache, get_token_codec
+from src.core.workers import WorkerPool
+
+
+password_pool = WorkerPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    use_processes=settings.PASSWORD_HASH_EXECUTOR == "process",
+)
+
+token_codec = get_token_codec(settings.JWT_CODEC, settings.SECRET_KEY, settings.ALGORITHM)
+
+token_cache = TokenCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
+
+# Replace the store of both limiters with a shared RateLimitStore to enforce the limits across workers.
+rate_limit_store = MemoryRateLimitStore(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+login_ip_limiter = RateLimiter(
+    rate_limit_store,
+    name="login-ip",
+    limit=settings.LOGIN_RATE_LIMIT_PER_IP,
+    window=settings.LOGIN_RATE_LIMIT_WINDOW,
+)
+
+login_email_limiter = RateLimiter(
+    rate_limit_store,
+    name="login-email",
+    limit=settings.LOGIN_RATE_LIMIT_PER_EMAIL,
+    window=settings.LOGIN_RATE_LIMIT_WINDOW,
+)
+
+_dummy_password_hash: str | None = None
 
 
 class SecurityHandler:
 
     @staticmethod
-    def hash_password(password: str) -> str:
+    def hash_password(password: str, rounds: int | None = None) -> str:
         """
         Hashes a password using bcrypt.
 
         Args:
             password (str): The password to hash.
+            rounds (int | None): The bcrypt work factor. Defaults to settings.BCRYPT_ROUNDS.
 
         Returns:
             str: The hashed password.
         """
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=rounds or settings.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
         return hashed.decode('utf-8')
 
@@ -34,7 +73,105 @@ class SecurityHandler:
             bool: True if the passwords match, False otherwise.
         """
         return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
-    
+
+    @staticmethod
+    def password_needs_rehash(hashed_password: str) -> bool:
+        """
+        Checks if a hashed password was created with a work factor different from the configured one.
+
+        Args:
+            hashed_password (str): The bcrypt hash, in the "$2b$<rounds>$<salt+hash>" format.
+
+        Returns:
+            bool: True if the hash should be recomputed with settings.BCRYPT_ROUNDS, False otherwise.
+        """
+        try:
+            rounds = int(hashed_password.split("$")[2])
+        except (IndexError, ValueError):
+            return True
+
+        return rounds != settings.BCRYPT_ROUNDS
+
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        Hashes a password on the password worker pool, without blocking the event loop.
+
+        Args:
+            password (str): The password to hash.
+
+        Returns:
+            str: The hashed password.
+
+        Raises:
+            HTTPException: If the worker pool is saturated (503).
+        """
+        with timed_phase("password_hash"):
+            return await password_pool.run(
+                SecurityHandler.hash_password, password, settings.BCRYPT_ROUNDS
+            )
+
+    @staticmethod
+    async def hash_passwords_async(passwords: list[str]) -> list[str]:
+        """
+        Hashes many passwords in parallel on the password worker pool, e.g. for bulk imports.
+
+        Args:
+            passwords (list[str]): The passwords to hash.
+
+        Returns:
+            list[str]: The hashed passwords, in the same order.
+        """
+        with timed_phase("password_hash"):
+            return await password_pool.map(
+                partial(SecurityHandler.hash_password, rounds=settings.BCRYPT_ROUNDS), passwords
+            )
+
+    @staticmethod
+    async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+        """
+        Verifies a plain password on the password worker pool, without blocking the event loop.
+
+        Args:
+            plain_password (str): The plain password to verify.
+            hashed_password (str): The hashed password to compare against.
+
+        Returns:
+            bool: True if the passwords match, False otherwise.
+
+        Raises:
+            HTTPException: If the worker pool is saturated (503).
+        """
+        with timed_phase("password_hash"):
+            return await password_pool.run(
+                SecurityHandler.verify_password, plain_password, hashed_password
+            )
+
+    @staticmethod
+    async def verify_dummy_password(plain_password: str) -> bool:
+        """
+        Runs a password verification against a throwaway hash with the configured work factor.
+
+        Used when the user does not exist, so the response takes as long as a wrong password
+        would and does not reveal which emails are registered. The hash is created on first use.
+
+        Args:
+            plain_password (str): The password received.
+
+        Returns:
+            bool: Always False.
+
+        Raises:
+            HTTPException: If the worker pool is saturated (503).
+        """
+        global _dummy_password_hash
+
+        if _dummy_password_hash is None:
+            _dummy_password_hash = await SecurityHandler.hash_password_async("dummy-password")
+
+        await SecurityHandler.verify_password_async(plain_password, _dummy_password_hash)
+        return False
+
 
     @staticmethod
     def create_jwt_token(
@@ -52,20 +189,37 @@ class SecurityHandler:
             str: The generated JWT token.
         """
         to_encode = data.copy()
-        to_encode.update({"exp": jwt.datetime.utcnow() + jwt.timedelta(seconds=expires_delta)})
-        return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+        to_encode.update({"exp": int(time()) + expires_delta})
+        return token_codec.encode(to_encode)
     
 
     @staticmethod
     def decode_jwt_token(token: str) -> dict:
         """
-        Decodes a JWT token.
+        Decodes a JWT token, reusing the claims of tokens that were already verified.
 
         Args:
             token (str): The JWT token to decode.
 
         Returns:
             dict: The decoded payload data.
+
+        Raises:
+            HTTPException: If the token is malformed, badly signed or expired (401).
         """
-        return jwt.decode(token, settings.SECRET_KEY, algorithms=settings.ALGORITHM)
+        claims = token_cache.get(token)
+
+        if claims is None:
+            try:
+                claims = token_codec.decode(token)
+            except InvalidTokenError:
+                raise HTTPException(
+                    status_code=401,
+                    detail=messages.USER_NOT_AUTHORIZED,
+                    headers={"WWW-Authenticate": "Bearer"}
+                )
+
+            token_cache.set(token, claims)
+
+        return dict(claims)
     
\ No newline at end of file
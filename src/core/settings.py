@@ -8,6 +8,75 @@ class Settings(BaseSettings):
     Attributes:
         algorithm (str): The algorithm used for token encoding.
         secret_key (str): The secret key used for token encoding.
+        db_url (str): The database connection URL.
+        server_host (str): The address the server binds to.
+        server_port (int): The port the server binds to.
+        server_workers (int): The number of worker processes. Zero uses the number of available CPUs.
+        server_loop (str): The uvicorn event loop, "auto" selects uvloop when installed.
+        server_http (str): The uvicorn HTTP parser, "auto" selects httptools when installed.
+        server_keep_alive (int): Seconds an idle keep-alive connection is kept open.
+        server_backlog (int): The maximum number of pending connections.
+        server_max_requests (int): Requests served before a worker is recycled. Zero disables recycling,
+            which only applies with more than one worker.
+        db_pool_size (int): The number of connections kept open in the pool.
+        db_max_overflow (int): The number of extra connections allowed above the pool size.
+        db_pool_timeout (float): Seconds to wait for a connection before failing.
+        db_pool_recycle (int): Seconds after which a connection is replaced.
+        db_pool_pre_ping (bool): If True, connections are tested before being handed out.
+        db_drain_timeout (float): Seconds to wait for in-use connections on shutdown.
+        db_pool_warm_size (int): The number of connections opened at startup.
+        startup_time_target (float): Startup seconds above which a warning is logged. Zero disables the warning.
+        json_response_class (str): The JSON encoder used for responses, "pydantic" (default), "orjson"
+            (requires orjson, installed by the server extra) or "json" (standard library).
+        query_profiler (bool): If True, statements are fingerprinted and profiled per request.
+        slow_query_threshold (float): Statements slower than this many seconds are logged. Zero disables the log.
+        n_plus_one_threshold (int): Requests running one statement fingerprint more times than this are
+            logged as possible N+1 queries. Zero disables the check.
+        sqlite_performance_mode (bool): If True, SQLite connections use WAL and the sqlite_* pragmas below.
+        sqlite_mmap_size (int): The SQLite mmap_size pragma, in bytes.
+        sqlite_cache_size (int): The SQLite cache_size pragma, negative values are KiB.
+        sqlite_busy_timeout (int): The SQLite busy_timeout pragma, in milliseconds.
+        sqlite_write_queue (bool): If True, writes are serialized and group committed by a single writer.
+        sqlite_write_batch_size (int): The maximum number of writes committed together.
+        jwt_codec (str): The token codec implementation, "jose" or "hmac" (HS* algorithms only, faster).
+        token_cache_max_size (int): The maximum number of verified tokens kept in memory. Zero disables the cache.
+        bcrypt_rounds (int): The bcrypt work factor used when hashing passwords.
+        password_hash_executor (str): The pool type used for password hashing, "thread" or "process".
+        password_hash_workers (int): The maximum number of concurrent password hashing jobs.
+        password_hash_max_pending (int): The maximum number of queued hashing jobs before rejecting with 503.
+        login_rate_limit_window (float): The sliding window of the login rate limits, in seconds.
+        login_rate_limit_per_ip (int): Login attempts allowed per client address in the window. Zero disables it.
+        login_rate_limit_per_email (int): Login attempts allowed per email in the window. Zero disables it.
+        rate_limit_max_keys (int): The maximum number of keys tracked by the in-memory rate limit store.
+        admin_emails (list[str]): The emails of the users allowed to list, export and import users and to
+            read the /metrics and /health diagnostics, as a JSON list. Empty, the default, disables those
+            endpoints.
+        user_page_size (int): The default number of users per page in listings.
+        user_page_size_max (int): The maximum number of users per page a client may request.
+        user_export_batch_size (int): The number of rows fetched per round trip when exporting users.
+        user_import_batch_size (int): The number of rows validated, hashed and inserted together by bulk imports.
+        user_import_max_line_length (int): The maximum length of a bulk import line; longer lines are rejected.
+        food_search_limit (int): The default number of foods returned by the food search.
+        food_search_limit_max (int): The maximum number of foods a client may request from the food search.
+        food_search_fuzzy_threshold (float): The trigram similarity a word must reach to replace a misspelled
+            word of a search that found nothing.
+        food_search_cache_ttl (int): Seconds a food search result stays cached. Zero disables the cache.
+        food_search_cache_max_size (int): The maximum number of food searches kept in the cache.
+        nutrient_rollup_default_days (int): The number of days returned by the nutrient rollup endpoints
+            when no start date is given.
+        nutrient_rollup_max_days (int): The longest date range a client may request from the nutrient rollups.
+        diet_plan_workers (int): The number of processes solving diet plans.
+        diet_plan_max_pending (int): The maximum number of queued diet plans before rejecting with 503.
+        diet_plan_candidates (int): The maximum number of foods a diet plan is chosen from.
+        diet_plan_max_foods (int): The maximum number of distinct foods in a diet plan.
+        diet_plan_max_portions (int): The maximum number of portions of one food in a diet plan.
+        diet_plan_time_limit (float): Seconds the integer program solver may run per plan.
+        diet_plan_cache_ttl (int): Seconds a diet plan stays cached per target profile. Zero disables the cache.
+        diet_plan_cache_max_size (int): The maximum number of diet plans kept in the cache.
+        user_cache_ttl (int): Seconds an authenticated user stays cached. Zero disables the cache. Changes
+            are evicted only in the worker process that made them, so with several workers this is
+            also how long other workers may still serve a changed or deleted user.
+        user_cache_max_size (int): The maximum number of authenticated users kept in the cache.
     """
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -19,5 +88,76 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     DB_URL: str
 
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8004
+    SERVER_WORKERS: int = 0
+    SERVER_LOOP: str = "auto"
+    SERVER_HTTP: str = "auto"
+    SERVER_KEEP_ALIVE: int = 5
+    SERVER_BACKLOG: int = 2048
+    SERVER_MAX_REQUESTS: int = 0
 
-settings = Settings()
\ No newline at end of file
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_DRAIN_TIMEOUT: float = 10
+    DB_POOL_WARM_SIZE: int = 1
+    STARTUP_TIME_TARGET: float = 0
+    JSON_RESPONSE_CLASS: str = "pydantic"
+
+    QUERY_PROFILER: bool = True
+    SLOW_QUERY_THRESHOLD: float = 0.2
+    N_PLUS_ONE_THRESHOLD: int = 10
+
+    SQLITE_PERFORMANCE_MODE: bool = False
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_CACHE_SIZE: int = -64000
+    SQLITE_BUSY_TIMEOUT: int = 5000
+    SQLITE_WRITE_QUEUE: bool = False
+    SQLITE_WRITE_BATCH_SIZE: int = 64
+
+    JWT_CODEC: str = "jose"
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_EXECUTOR: str = "thread"
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    LOGIN_RATE_LIMIT_WINDOW: float = 300
+    LOGIN_RATE_LIMIT_PER_IP: int = 30
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 10
+    RATE_LIMIT_MAX_KEYS: int = 100000
+
+    ADMIN_EMAILS: list[str] = []
+    USER_PAGE_SIZE: int = 50
+    USER_PAGE_SIZE_MAX: int = 500
+    USER_EXPORT_BATCH_SIZE: int = 1000
+    USER_IMPORT_BATCH_SIZE: int = 500
+    USER_IMPORT_MAX_LINE_LENGTH: int = 65536
+
+    FOOD_SEARCH_LIMIT: int = 10
+    FOOD_SEARCH_LIMIT_MAX: int = 50
+    FOOD_SEARCH_FUZZY_THRESHOLD: float = 0.4
+    FOOD_SEARCH_CACHE_TTL: int = 300
+    FOOD_SEARCH_CACHE_MAX_SIZE: int = 10000
+
+    NUTRIENT_ROLLUP_DEFAULT_DAYS: int = 90
+    NUTRIENT_ROLLUP_MAX_DAYS: int = 732
+
+    DIET_PLAN_WORKERS: int = 2
+    DIET_PLAN_MAX_PENDING: int = 16
+    DIET_PLAN_CANDIDATES: int = 300
+    DIET_PLAN_MAX_FOODS: int = 8
+    DIET_PLAN_MAX_PORTIONS: int = 3
+    DIET_PLAN_TIME_LIMIT: float = 2.0
+    DIET_PLAN_CACHE_TTL: int = 3600
+    DIET_PLAN_CACHE_MAX_SIZE: int = 1000
+
+    USER_CACHE_TTL: int = 5
+    USER_CACHE_MAX_SIZE: int = 10000
+
+
+settings = Settings()
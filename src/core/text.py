@@ -0,0 +1,96 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]+")
+
+
+@lru_cache(maxsize=4096)
+def normalize_text(text: str) -> str:
+    """
+    Normalizes text for accent and case insensitive matching, e.g. "Pão de Açúcar" -> "pao de acucar".
+
+    Accents are removed, letters are case folded and every run of other characters becomes one space,
+    which matches how the SQLite unicode61 tokenizer with remove_diacritics splits and folds words.
+
+    Args:
+        text (str): The text to normalize.
+
+    Returns:
+        str: The normalized text.
+    """
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_ALPHANUMERIC.sub(" ", stripped).strip()
+
+
+def trigrams(term: str) -> frozenset[str]:
+    """
+    Returns the trigrams of a term, padded so the beginning of the term weighs more, e.g. "  a", " ar", "arr".
+
+    Args:
+        term (str): A normalized term.
+
+    Returns:
+        frozenset[str]: The distinct trigrams.
+    """
+    padded = f"  {term} "
+    return frozenset(padded[index:index + 3] for index in range(len(padded) - 2))
+
+
+class TrigramIndex:
+    """
+    TrigramIndex finds the terms of a vocabulary closest to a misspelled term, by trigram similarity.
+
+    Attributes:
+        terms (tuple[str, ...]): The vocabulary, sorted.
+
+    Methods:
+        has_prefix: Returns whether a term of the vocabulary starts with a prefix.
+        closest: Returns the terms most similar to a term.
+    """
+    def __init__(self, terms: list[str]) -> None:
+        self.terms = tuple(sorted(terms))
+        self._trigrams = [trigrams(term) for term in self.terms]
+        self._postings: dict[str, list[int]] = {}
+
+        for position, term_trigrams in enumerate(self._trigrams):
+            for trigram in term_trigrams:
+                self._postings.setdefault(trigram, []).append(position)
+
+    def has_prefix(self, prefix: str) -> bool:
+        position = bisect_left(self.terms, prefix)
+        return position < len(self.terms) and self.terms[position].startswith(prefix)
+
+    def closest(self, term: str, threshold: float, limit: int = 3) -> list[str]:
+        """
+        Returns the terms whose trigram Jaccard similarity with a term reaches a threshold.
+
+        Only the terms sharing at least one trigram with the term are scored.
+
+        Args:
+            term (str): The normalized term.
+            threshold (float): The minimum similarity, between 0 and 1.
+            limit (int): The maximum number of terms returned.
+
+        Returns:
+            list[str]: The most similar terms first.
+        """
+        query = trigrams(term)
+        shared: dict[int, int] = {}
+
+        for trigram in query:
+            for position in self._postings.get(trigram, ()):
+                shared[position] = shared.get(position, 0) + 1
+
+        scored = []
+
+        for position, count in shared.items():
+            score = count / (len(query) + len(self._trigrams[position]) - count)
+
+            if score >= threshold:
+                scored.append((score, self.terms[position]))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [term for _, term in scored[:limit]]
@@ -0,0 +1,244 @@
+import base64
+import hashlib
+import hmac
+import json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import time
+
+
+class InvalidTokenError(Exception):
+    """
+    InvalidTokenError is raised by token codecs when a token is malformed, badly signed or expired.
+    """
+
+
+class TokenCodec(ABC):
+    """
+    TokenCodec is the base class for JWT encoders/decoders.
+
+    Attributes:
+        secret_key (str): The secret key used to sign tokens.
+        algorithm (str): The signing algorithm.
+
+    Methods:
+        encode: Signs a set of claims and returns the token.
+        decode: Verifies a token and returns its claims.
+    """
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+
+    @abstractmethod
+    def encode(self, claims: dict) -> str:
+        """
+        Signs a set of claims.
+
+        Args:
+            claims (dict): The claims to sign.
+
+        Returns:
+            str: The signed token.
+        """
+
+    @abstractmethod
+    def decode(self, token: str) -> dict:
+        """
+        Verifies a token.
+
+        Args:
+            token (str): The token to verify.
+
+        Returns:
+            dict: The claims of the token.
+
+        Raises:
+            InvalidTokenError: If the token is malformed, badly signed or expired.
+        """
+
+
+class JoseTokenCodec(TokenCodec):
+    """
+    JoseTokenCodec encodes and decodes tokens with python-jose. Supports every algorithm python-jose does.
+
+    python-jose and its crypto backends are imported when the codec is built, so they do not slow
+    down startup when another codec is configured.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        super().__init__(secret_key, algorithm)
+
+        from jose import JWTError, jwt
+
+        self._jwt = jwt
+        self._error = JWTError
+
+    def encode(self, claims: dict) -> str:
+        return self._jwt.encode(claims, self.secret_key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> dict:
+        try:
+            return self._jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+        except self._error as error:
+            raise InvalidTokenError(str(error)) from error
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class HmacTokenCodec(TokenCodec):
+    """
+    HmacTokenCodec encodes and decodes HS256/HS384/HS512 tokens with the standard library only.
+
+    Tokens are interchangeable with the ones produced by JoseTokenCodec, but skip python-jose's
+    generic key handling and claim validation, which dominate its decode time.
+    """
+    DIGESTS = {
+        "HS256": hashlib.sha256,
+        "HS384": hashlib.sha384,
+        "HS512": hashlib.sha512,
+    }
+
+    def __init__(self, secret_key: str, algorithm: str) -> None:
+        if algorithm not in self.DIGESTS:
+            raise ValueError(f"HmacTokenCodec does not support the {algorithm} algorithm")
+
+        super().__init__(secret_key, algorithm)
+        self._key = secret_key.encode("utf-8")
+        self._digest = self.DIGESTS[algorithm]
+        self._header = _b64encode(
+            json.dumps({"alg": algorithm, "typ": "JWT"}, separators=(",", ":")).encode("utf-8")
+        )
+
+    def _sign(self, signing_input: str) -> bytes:
+        return hmac.new(self._key, signing_input.encode("ascii"), self._digest).digest()
+
+    def encode(self, claims: dict) -> str:
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8"))
+        signing_input = f"{self._header}.{payload}"
+        return f"{signing_input}.{_b64encode(self._sign(signing_input))}"
+
+    def decode(self, token: str) -> dict:
+        try:
+            signing_input, _, signature = token.rpartition(".")
+            header, _, payload = signing_input.partition(".")
+
+            if json.loads(_b64decode(header)).get("alg") != self.algorithm:
+                raise InvalidTokenError("The token algorithm is not allowed")
+
+            if not hmac.compare_digest(self._sign(signing_input), _b64decode(signature)):
+                raise InvalidTokenError("Signature verification failed")
+
+            claims = json.loads(_b64decode(payload))
+        except (AttributeError, ValueError) as error:
+            raise InvalidTokenError("Malformed token") from error
+
+        if not isinstance(claims, dict):
+            raise InvalidTokenError("Malformed token")
+
+        exp = claims.get("exp")
+
+        if exp is not None:
+            if not isinstance(exp, (int, float)):
+                raise InvalidTokenError("Invalid expiration claim")
+            if exp <= time():
+                raise InvalidTokenError("Signature has expired")
+
+        return claims
+
+
+TOKEN_CODECS: dict[str, type[TokenCodec]] = {
+    "jose": JoseTokenCodec,
+    "hmac": HmacTokenCodec,
+}
+
+
+def get_token_codec(name: str, secret_key: str, algorithm: str) -> TokenCodec:
+    """
+    Builds the token codec registered under the given name.
+
+    Args:
+        name (str): The codec name, one of TOKEN_CODECS.
+        secret_key (str): The secret key used to sign tokens.
+        algorithm (str): The signing algorithm.
+
+    Returns:
+        TokenCodec: The codec instance.
+    """
+    if name not in TOKEN_CODECS:
+        raise ValueError(f"Unknown token codec {name!r}, expected one of {sorted(TOKEN_CODECS)}")
+
+    return TOKEN_CODECS[name](secret_key, algorithm)
+
+
+class TokenCache:
+    """
+    TokenCache keeps the claims of already verified tokens, bounded and evicted by least recent use.
+
+    Entries are keyed by the SHA-256 digest of the token, so raw tokens are not kept in memory,
+    and expire together with the token's "exp" claim.
+
+    Attributes:
+        max_size (int): The maximum number of tokens kept. Zero disables the cache.
+    """
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._data: OrderedDict[bytes, tuple[float | None, dict]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token: str) -> dict | None:
+        """
+        Returns the cached claims of a token.
+
+        Args:
+            token (str): The raw token.
+
+        Returns:
+            dict | None: The claims, or None if the token is not cached or has expired.
+        """
+        key = self._key(token)
+        item = self._data.get(key)
+
+        if item is None:
+            return None
+
+        exp, claims = item
+
+        if exp is not None and exp <= time():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return claims
+
+    def set(self, token: str, claims: dict) -> None:
+        """
+        Caches the claims of a verified token.
+
+        Args:
+            token (str): The raw token.
+            claims (dict): The verified claims.
+
+        Returns:
+            None
+        """
+        if self.max_size <= 0:
+            return
+
+        key = self._key(token)
+        self._data[key] = (claims.get("exp"), claims)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,134 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from fastapi import HTTPException
+
+from src.core import messages
+
+
+class WorkerPool:
+    """
+    WorkerPool runs blocking, CPU bound functions outside of the event loop with a bounded queue.
+
+    Attributes:
+        max_workers (int): The maximum number of jobs running at the same time.
+        max_pending (int): The maximum number of jobs waiting or running before new ones are rejected.
+        use_processes (bool): If True, jobs run on a process pool instead of a thread pool. Workers
+            are started with forkserver (or spawn), so functions must be importable module level ones.
+        pending (int): The number of jobs currently waiting or running.
+
+    Methods:
+        run: Runs a function on the pool and awaits its result.
+        map: Runs a function over many arguments, waiting for free workers instead of rejecting.
+        shutdown: Shuts down the underlying executor.
+    """
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        use_processes: bool = False
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.use_processes = use_processes
+        self.pending = 0
+        self._executor: Executor | None = None
+
+    @property
+    def executor(self) -> Executor:
+        """
+        Lazily creates the underlying executor, so importing this module never spawns workers.
+
+        Returns:
+            Executor: The thread or process pool executor.
+        """
+        if self._executor is None:
+            if self.use_processes:
+                from concurrent.futures import ProcessPoolExecutor
+
+                # Forking a process running the event loop copies its threads' locks and open
+                # connections; forkserver (spawn where unavailable) starts workers from a clean
+                # interpreter that only imports the module of each function it runs.
+                start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(start_method)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="worker-pool"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Runs a function on the pool and awaits its result.
+
+        Args:
+            func (Callable[..., Any]): The blocking function to run. Must be picklable when using processes.
+            *args (Any): Positional arguments passed to the function.
+
+        Returns:
+            Any: The value returned by the function.
+
+        Raises:
+            HTTPException: If the pool already holds max_pending jobs (503).
+        """
+        if self.pending >= self.max_pending:
+            raise HTTPException(
+                status_code=503,
+                detail=messages.SERVER_BUSY
+            )
+
+        self.pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self.pending -= 1
+
+    async def map(self, func: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+        """
+        Runs a function over many arguments, keeping at most max_workers of them on the pool at a time.
+
+        Meant for bulk jobs: they wait for free workers instead of being rejected, while their
+        running jobs still count as pending, so concurrent callers of run see the backpressure.
+
+        Args:
+            func (Callable[[Any], Any]): The blocking function to run. Must be picklable when using processes.
+            items (list[Any]): The argument of each call.
+
+        Returns:
+            list[Any]: The value returned for each argument, in the same order.
+        """
+        loop = asyncio.get_running_loop()
+        results = []
+
+        for start in range(0, len(items), self.max_workers):
+            chunk = items[start:start + self.max_workers]
+            self.pending += len(chunk)
+            try:
+                results.extend(await asyncio.gather(
+                    *(loop.run_in_executor(self.executor, func, item) for item in chunk)
+                ))
+            finally:
+                self.pending -= len(chunk)
+
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Shuts down the underlying executor, if it was created.
+
+        Args:
+            wait (bool): If True, waits for running jobs to finish.
+
+        Returns:
+            None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
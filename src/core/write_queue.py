@@ -0,0 +1,181 @@
+import asyncio
+import contextvars
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+WriteJob = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class WriteQueue:
+    """
+    WriteQueue serializes database writes through a single session and commits them in groups.
+
+    Concurrent callers submit jobs (async functions receiving the writer session); a single worker
+    task runs every queued job, up to max_batch_size, inside one transaction and commits once. If a
+    job raises, the batch is rolled back and its jobs are re-run one transaction each, so jobs must
+    be safe to run again and must not commit themselves. If the worker itself fails (e.g. the commit
+    or rollback raises, or it is cancelled), every job it still holds fails with the same error and
+    the next submit starts a new worker.
+
+    Attributes:
+        session_factory (Callable[[], AsyncSession]): The factory used to open the writer session.
+        max_batch_size (int): The maximum number of jobs committed together.
+        batches (int): The number of transactions committed.
+        jobs (int): The number of jobs completed.
+
+    Methods:
+        submit: Queues a job and awaits its result.
+        close: Finishes the queued jobs and stops the worker.
+    """
+    def __init__(self, session_factory: Callable[[], AsyncSession], max_batch_size: int = 64) -> None:
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.jobs = 0
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+    async def submit(self, job: WriteJob) -> Any:
+        """
+        Queues a job and awaits its result.
+
+        Args:
+            job (WriteJob): The async function to run with the writer session.
+
+        Returns:
+            Any: The value returned by the job, once its transaction is committed.
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            # A fresh context, so the worker does not inherit the request state of the first caller.
+            self._worker = asyncio.create_task(self._run(self._queue), context=contextvars.Context())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((job, future))
+        return await future
+
+    async def close(self) -> None:
+        """
+        Finishes the queued jobs and stops the worker.
+
+        Returns:
+            None
+        """
+        if self._worker is None or self._worker.done():
+            return
+
+        self._queue.put_nowait(None)
+        await self._worker
+        self._worker = None
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        batch: list[tuple[WriteJob, asyncio.Future]] = []
+
+        try:
+            async with self.session_factory() as session:
+                running = True
+
+                while running:
+                    item = await queue.get()
+
+                    if item is None:
+                        break
+
+                    batch = [item]
+
+                    while len(batch) < self.max_batch_size and not queue.empty():
+                        item = queue.get_nowait()
+
+                        if item is None:
+                            running = False
+                            break
+
+                        batch.append(item)
+
+                    await self._commit_batch(session, batch)
+                    batch = []
+        except BaseException as error:
+            # The worker is gone: resolve every job it still owned, or their callers would wait forever.
+            # No await happens from here until the task ends, so no job can reach the dead queue meanwhile.
+            self._fail_pending(batch, queue, error)
+
+            if not isinstance(error, Exception):
+                raise
+
+    @staticmethod
+    def _fail_pending(
+        batch: list[tuple[WriteJob, asyncio.Future]],
+        queue: asyncio.Queue,
+        error: BaseException
+    ) -> None:
+        pending = list(batch)
+
+        while not queue.empty():
+            item = queue.get_nowait()
+
+            if item is not None:
+                pending.append(item)
+
+        for _, future in pending:
+            if future.done():
+                continue
+
+            if isinstance(error, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(error)
+
+    async def _commit_batch(
+        self,
+        session: AsyncSession,
+        batch: list[tuple[WriteJob, asyncio.Future]]
+    ) -> None:
+        try:
+            results = [await job(session) for job, _ in batch]
+            await session.commit()
+        except Exception as error:
+            await session.rollback()
+            session.expunge_all()
+
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(error)
+                return
+
+            await self._commit_each(session, batch)
+            return
+
+        session.expunge_all()
+        self.batches += 1
+        self.jobs += len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _commit_each(
+        self,
+        session: AsyncSession,
+        batch: list[tuple[WriteJob, asyncio.Future]]
+    ) -> None:
+        for job, future in batch:
+            try:
+                result = await job(session)
+                await session.commit()
+            except Exception as error:
+                await session.rollback()
+
+                if not future.done():
+                    future.set_exception(error)
+                continue
+            finally:
+                session.expunge_all()
+
+            self.batches += 1
+            self.jobs += 1
+
+            if not future.done():
+                future.set_result(result)
@@ -1,6 +1,11 @@
-from .db import db
+from .db import db, diet_plan_cache, food_catalog, food_search_cache, query_profiler, user_cache
 
 
 __all__ = [
-    "db"
-]
\ No newline at end of file
+    "db",
+    "diet_plan_cache",
+    "food_catalog",
+    "food_search_cache",
+    "query_profiler",
+    "user_cache"
+]
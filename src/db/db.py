@@ -1,4 +1,52 @@
-from src.core import DatabaseHandler, settings
+from src.core import DatabaseHandler, MemoryCache, settings
+from src.core.catalog import CatalogHolder
+from src.core.metrics import record_phase
+from src.core.profiler import QueryProfiler
 
 
-db = DatabaseHandler(settings.DB_URL)
\ No newline at end of file
+sqlite_pragmas = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": settings.SQLITE_MMAP_SIZE,
+    "cache_size": settings.SQLITE_CACHE_SIZE,
+    "busy_timeout": settings.SQLITE_BUSY_TIMEOUT,
+}
+
+db = DatabaseHandler(
+    settings.DB_URL,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    sqlite_pragmas=sqlite_pragmas if settings.SQLITE_PERFORMANCE_MODE else None,
+    write_queue=settings.SQLITE_WRITE_QUEUE,
+    write_batch_size=settings.SQLITE_WRITE_BATCH_SIZE,
+)
+
+db.add_statement_observer(lambda statement, parameters, seconds: record_phase("database", seconds))
+
+query_profiler = QueryProfiler(
+    slow_threshold=settings.SLOW_QUERY_THRESHOLD,
+    repeat_threshold=settings.N_PLUS_ONE_THRESHOLD,
+)
+
+if settings.QUERY_PROFILER:
+    db.add_statement_observer(query_profiler.observe)
+
+user_cache = MemoryCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl=settings.USER_CACHE_TTL,
+)
+
+food_search_cache = MemoryCache(
+    max_size=settings.FOOD_SEARCH_CACHE_MAX_SIZE,
+    ttl=settings.FOOD_SEARCH_CACHE_TTL,
+)
+
+diet_plan_cache = MemoryCache(
+    max_size=settings.DIET_PLAN_CACHE_MAX_SIZE,
+    ttl=settings.DIET_PLAN_CACHE_TTL,
+)
+
+food_catalog = CatalogHolder()
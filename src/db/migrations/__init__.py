@@ -0,0 +1,28 @@
+from .base import Migration, add_column, backfill, create_index
+from .m0001_initial import InitialSchema
+from .m0002_indexes import ForeignKeyAndDateIndexes
+from .m0003_nutrient_rollups import NutrientRollups
+from .m0004_food_search import FoodSearchIndex
+from .m0005_food_catalog import ReferenceFoodCatalog
+from .m0006_food_prices import FoodPrices
+from .migrator import Migrator, SchemaVersionError
+
+
+MIGRATIONS: list[Migration] = [
+    InitialSchema(),
+    ForeignKeyAndDateIndexes(),
+    NutrientRollups(),
+    FoodSearchIndex(),
+    ReferenceFoodCatalog(),
+    FoodPrices(),
+]
+
+__all__ = [
+    "add_column",
+    "backfill",
+    "create_index",
+    "Migration",
+    "MIGRATIONS",
+    "Migrator",
+    "SchemaVersionError",
+]
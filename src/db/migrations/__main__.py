@@ -0,0 +1,57 @@
+"""
+Command line entry point for schema migrations.
+
+Usage:
+    python -m src.db.migrations upgrade [--to VERSION]
+    python -m src.db.migrations current
+    python -m src.db.migrations check
+"""
+import argparse
+import asyncio
+import sys
+
+from src.db import db
+from src.db.migrations import MIGRATIONS, Migrator, SchemaVersionError
+
+
+async def run(args: argparse.Namespace) -> int:
+    migrator = Migrator(db, MIGRATIONS)
+
+    try:
+        if args.command == "upgrade":
+            for migration in await migrator.upgrade(target=args.to):
+                print(f"Applied {migration.version:04d}: {migration.description}")
+            print(f"Schema version: {await migrator.current_version()}")
+
+        elif args.command == "current":
+            print(f"Schema version: {await migrator.current_version()} (latest {migrator.latest_version})")
+
+        elif args.command == "check":
+            await migrator.check()
+            print("Schema is up to date")
+
+    except SchemaVersionError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    finally:
+        await db.close()
+
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.db.migrations")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    upgrade = subparsers.add_parser("upgrade", help="apply pending migrations")
+    upgrade.add_argument("--to", type=int, default=None, help="stop at this version")
+
+    subparsers.add_parser("current", help="print the schema version")
+    subparsers.add_parser("check", help="exit with status 1 if migrations are pending")
+
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
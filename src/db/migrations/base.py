@@ -0,0 +1,148 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable
+
+from sqlalchemy import Column, ColumnElement, Index, inspect, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+from sqlalchemy.schema import CreateIndex
+
+from src.core import DatabaseHandler
+
+
+class Migration(ABC):
+    """
+    Migration is the base class for versioned schema changes.
+
+    Migrations must be idempotent: the initial migration adopts databases created by
+    metadata.create_all, so later steps may find their changes already applied. They must not
+    depend on the current models' metadata to define what they create, since the models keep
+    changing after the migration shipped.
+
+    Attributes:
+        version (int): The schema version reached after this migration. Must be unique and increasing.
+        description (str): A short description of the change.
+
+    Methods:
+        upgrade: Applies the migration.
+    """
+    version: int
+    description: str
+
+    @abstractmethod
+    async def upgrade(self, handler: DatabaseHandler) -> None:
+        """
+        Applies the migration.
+
+        Args:
+            handler (DatabaseHandler): The database to change.
+
+        Returns:
+            None
+        """
+
+
+async def create_index(handler: DatabaseHandler, index: Index) -> None:
+    """
+    Creates an index if it does not exist, without holding a long lock on the table where possible.
+
+    On PostgreSQL the index is built with CREATE INDEX CONCURRENTLY, outside of a transaction.
+    Other databases build it in a transaction of its own, so each index only locks its table while
+    it is being built.
+
+    Args:
+        handler (DatabaseHandler): The database to change.
+        index (Index): The index declared on a model table.
+
+    Returns:
+        None
+    """
+    async with handler.engine.connect() as conn:
+        if conn.dialect.name == "postgresql":
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=conn.dialect))
+            await conn.exec_driver_sql(ddl.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1))
+            return
+
+        await conn.run_sync(lambda sync_conn: index.create(sync_conn, checkfirst=True))
+        await conn.commit()
+
+
+async def add_column(handler: DatabaseHandler, column: Column) -> None:
+    """
+    Adds a column declared on a model table if the table does not have it yet.
+
+    The column is added without constraints or defaults, so it must be nullable; fill it with
+    backfill if needed.
+
+    Args:
+        handler (DatabaseHandler): The database to change.
+        column (Column): The column declared on a model table.
+
+    Returns:
+        None
+    """
+    table = column.table
+
+    async with handler.engine.begin() as conn:
+        columns = await conn.run_sync(
+            lambda sync_conn: {existing["name"] for existing in inspect(sync_conn).get_columns(table.name)}
+        )
+
+        if column.name in columns:
+            return
+
+        preparer = conn.dialect.identifier_preparer
+        await conn.exec_driver_sql(
+            f"ALTER TABLE {preparer.format_table(table)} "
+            f"ADD COLUMN {preparer.format_column(column)} {column.type.compile(dialect=conn.dialect)}"
+        )
+
+
+async def backfill(
+    handler: DatabaseHandler,
+    key: ColumnElement,
+    apply: Callable[[AsyncConnection, list], Awaitable[None]],
+    where=None,
+    batch_size: int = 1000,
+    pause: float = 0.0
+) -> int:
+    """
+    Applies a change to batches of keys in key order, one short transaction per batch, so large
+    tables are never locked for the whole backfill.
+
+    Args:
+        handler (DatabaseHandler): The database to change.
+        key (ColumnElement): The unique column the batches are read from, e.g. a primary key.
+        apply (Callable[[AsyncConnection, list], Awaitable[None]]): Applies the change to one batch of
+            keys inside the batch transaction, e.g. an UPDATE ... WHERE id IN the keys.
+        where: An optional filter selecting the keys, e.g. table.c.total.is_(None).
+        batch_size (int): The number of keys per transaction.
+        pause (float): Seconds to sleep between batches, leaving room for application writes.
+
+    Returns:
+        int: The number of keys processed.
+    """
+    last_key = None
+    total = 0
+
+    while True:
+        query = select(key).order_by(key).limit(batch_size)
+
+        if last_key is not None:
+            query = query.where(key > last_key)
+        if where is not None:
+            query = query.where(where)
+
+        async with handler.engine.begin() as conn:
+            keys = (await conn.execute(query)).scalars().all()
+
+            if not keys:
+                return total
+
+            await apply(conn, list(keys))
+
+        total += len(keys)
+        last_key = keys[-1]
+
+        if pause:
+            await asyncio.sleep(pause)
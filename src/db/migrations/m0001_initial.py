@@ -0,0 +1,160 @@
+from sqlalchemy import (
+    DECIMAL,
+    Boolean,
+    Column,
+    ForeignKey,
+    Integer,
+    MetaData,
+    String,
+    TIMESTAMP,
+    Table,
+    Text,
+    func,
+)
+
+from src.core import DatabaseHandler
+from src.db.migrations.base import Migration
+
+
+def timestamps() -> tuple[Column, Column]:
+    """
+    Builds the created_at and updated_at columns every baseline table has.
+
+    Returns:
+        tuple[Column, Column]: The created_at and updated_at columns.
+    """
+    return (
+        Column("created_at", TIMESTAMP, nullable=False, server_default=func.now()),
+        Column("updated_at", TIMESTAMP, nullable=False, server_default=func.now()),
+    )
+
+
+# The schema as the models declared it before migrations existed. It is frozen here, so this
+# migration keeps creating the same tables when the models change; later changes are migrations.
+metadata = MetaData()
+
+Table(
+    "users",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("name", String(255), nullable=True),
+    Column("gender", String(1), nullable=True),
+    Column("birth_date", TIMESTAMP, nullable=True),
+    Column("state", String(2), nullable=True),
+    Column("city", String(50), nullable=True),
+    Column("cep", String(10), nullable=True),
+    Column("complement", Text, nullable=True),
+    Column("email", String(255), nullable=False, unique=True),
+    Column("password", String(255), nullable=False),
+    *timestamps(),
+)
+
+Table(
+    "diets",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("user_id", String, ForeignKey("users.id"), nullable=False),
+    Column("date", TIMESTAMP, nullable=False),
+    Column("total_calories", DECIMAL, nullable=False),
+    Column("total_proteins", DECIMAL, nullable=False),
+    Column("total_fats", DECIMAL, nullable=False),
+    Column("total_carbohydrates", DECIMAL, nullable=False),
+    Column("total_water", DECIMAL, nullable=False),
+    Column("duration", Integer, nullable=False),
+    *timestamps(),
+)
+
+Table(
+    "exercises",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("description", Text, nullable=True),
+    Column("tip", Text, nullable=True),
+    Column("series", Integer, nullable=False),
+    Column("repetitions", String, nullable=False),
+    Column("muscle_group", String, nullable=False),
+    Column("is_completed", Boolean, nullable=False),
+    Column("weight", DECIMAL, nullable=True),
+    *timestamps(),
+)
+
+Table(
+    "foods",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("quantity", DECIMAL, nullable=False),
+    Column("calories", DECIMAL, nullable=False),
+    Column("proteins", DECIMAL, nullable=False),
+    Column("fats", DECIMAL, nullable=False),
+    Column("carbohydrates", DECIMAL, nullable=False),
+    Column("consumption_date", TIMESTAMP, nullable=False),
+    Column("type", String, nullable=False),
+    *timestamps(),
+)
+
+Table(
+    "meals",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("food_id", String, ForeignKey("foods.id"), nullable=False),
+    Column("diet_id", String, ForeignKey("diets.id"), nullable=False),
+    Column("type", String, nullable=False),
+    Column("is_completed", Boolean, nullable=False),
+    Column("description", Text, nullable=True),
+    *timestamps(),
+)
+
+Table(
+    "medical_history",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("user_id", String, ForeignKey("users.id"), nullable=False),
+    Column("have_illness", Boolean, nullable=False),
+    Column("illness", String, nullable=True),
+    Column("illness_description", Text, nullable=True),
+    Column("medical_record_file_path", String, nullable=True),
+    *timestamps(),
+)
+
+Table(
+    "nutritional_data",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("user_id", String, ForeignKey("users.id"), nullable=False),
+    Column("weight", DECIMAL, nullable=False),
+    Column("height", DECIMAL, nullable=False),
+    Column("cmi", DECIMAL, nullable=False),
+    Column("evaluation_date", TIMESTAMP, nullable=False),
+    Column("skinfolds", String, nullable=True),
+    Column("circumferences", String, nullable=True),
+    Column("allergies", Text, nullable=True),
+    Column("goal", String, nullable=True),
+    Column("monthly_budget", DECIMAL, nullable=True),
+    *timestamps(),
+)
+
+Table(
+    "trains",
+    metadata,
+    Column("id", String, primary_key=True),
+    Column("exercise_id", String, ForeignKey("exercises.id"), nullable=False),
+    Column("user_id", String, ForeignKey("users.id"), nullable=False),
+    Column("date", TIMESTAMP, nullable=False),
+    Column("duration", Integer, nullable=False),
+    Column("goal", String, nullable=True),
+    *timestamps(),
+)
+
+
+class InitialSchema(Migration):
+    """
+    Creates the baseline tables, adopting databases created by the old create_all startup.
+    """
+    version = 1
+    description = "initial schema"
+
+    async def upgrade(self, handler: DatabaseHandler) -> None:
+        async with handler.engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: metadata.create_all(sync_conn, checkfirst=True))
@@ -0,0 +1,32 @@
+from src.core import DatabaseHandler
+from src.db.migrations.base import Migration, create_index
+from src.db.models import (
+    DietModel,
+    FoodModel,
+    MealModel,
+    MedicalHistoryModel,
+    NutritionalDataModel,
+    TrainModel,
+    UserModel,
+)
+
+
+class ForeignKeyAndDateIndexes(Migration):
+    """
+    Creates the per-user foreign key, date and pagination indexes on existing tables.
+    """
+    version = 2
+    description = "foreign key, date and pagination indexes"
+
+    async def upgrade(self, handler: DatabaseHandler) -> None:
+        for model in (
+            UserModel,
+            DietModel,
+            TrainModel,
+            MealModel,
+            NutritionalDataModel,
+            MedicalHistoryModel,
+            FoodModel,
+        ):
+            for index in model.__table__.indexes:
+                await create_index(handler, index)
@@ -0,0 +1,86 @@
+from sqlalchemy import bindparam, column, table, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.core import DatabaseHandler
+from src.db.migrations.base import Migration, backfill
+from src.db.models import NutrientDailyRollupModel, NutrientWeeklyRollupModel
+
+
+# The users whose diets are summed in each backfill transaction.
+BACKFILL_BATCH_SIZE = 500
+
+USERS = table("users", column("id"))
+
+# The nutrient columns of the rollups, summed from the total_<nutrient> columns of the diets.
+NUTRIENTS = ("calories", "proteins", "fats", "carbohydrates")
+
+# Per dialect, the day of a diet date and the Monday of its week, as dates.
+DAY_EXPRESSIONS = {
+    "sqlite": ("date(date)", "date(date, '-6 days', 'weekday 1')"),
+    "postgresql": ("CAST(date AS DATE)", "CAST(date_trunc('week', date) AS DATE)"),
+}
+
+
+def backfill_statements(dialect: str) -> tuple[str, ...]:
+    """
+    Builds the statements replacing the rollups of a batch of users with the sums of their diets,
+    grouped in the database. The users are bound to the user_ids parameter.
+
+    Args:
+        dialect (str): The name of the SQLAlchemy dialect, a key of DAY_EXPRESSIONS.
+
+    Returns:
+        tuple[str, ...]: The statements, to run in one transaction per batch.
+    """
+    day, week_start = DAY_EXPRESSIONS[dialect]
+    columns = ", ".join(NUTRIENTS)
+    sums = ", ".join(f"SUM(total_{nutrient})" for nutrient in NUTRIENTS)
+
+    return (
+        f"DELETE FROM {NutrientDailyRollupModel.__tablename__} WHERE user_id IN :user_ids",
+        f"DELETE FROM {NutrientWeeklyRollupModel.__tablename__} WHERE user_id IN :user_ids",
+        f"""
+        INSERT INTO {NutrientDailyRollupModel.__tablename__} (user_id, day, {columns})
+        SELECT user_id, {day}, {sums} FROM diets WHERE user_id IN :user_ids GROUP BY user_id, {day}
+        """,
+        f"""
+        INSERT INTO {NutrientWeeklyRollupModel.__tablename__} (user_id, week_start, {columns})
+        SELECT user_id, {week_start}, {sums} FROM diets WHERE user_id IN :user_ids
+        GROUP BY user_id, {week_start}
+        """,
+    )
+
+
+class NutrientRollups(Migration):
+    """
+    Creates the daily and weekly nutrient rollup tables and fills them from the existing diets.
+
+    The backfill is plain SQL for SQLite and PostgreSQL, committed per batch of users so the
+    diets are never locked for the whole backfill; on other databases the rollups start empty
+    and are filled by NutrientRollupRepository.rebuild.
+    """
+    version = 3
+    description = "daily and weekly nutrient rollups"
+
+    async def upgrade(self, handler: DatabaseHandler) -> None:
+        async with handler.engine.begin() as conn:
+            for model in (NutrientDailyRollupModel, NutrientWeeklyRollupModel):
+                await conn.run_sync(
+                    lambda sync_conn, rollup=model.__table__: rollup.create(sync_conn, checkfirst=True)
+                )
+
+            dialect = conn.dialect.name
+
+        if dialect not in DAY_EXPRESSIONS:
+            return
+
+        statements = [
+            text(statement).bindparams(bindparam("user_ids", expanding=True))
+            for statement in backfill_statements(dialect)
+        ]
+
+        async def summarize(conn: AsyncConnection, user_ids: list) -> None:
+            for statement in statements:
+                await conn.execute(statement, {"user_ids": user_ids})
+
+        await backfill(handler, USERS.c.id, summarize, batch_size=BACKFILL_BATCH_SIZE)
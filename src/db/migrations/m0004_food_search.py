@@ -0,0 +1,55 @@
+from src.core import DatabaseHandler
+from src.db.migrations.base import Migration
+
+
+# FTS5 index over foods.name: the words are folded to lowercase without accents and the 2 and 3
+# character prefixes are indexed for autocomplete. It is a standalone table keyed by the unindexed
+# food_id column, joined on foods.id: foods has a text primary key, so its implicit rowid is not
+# stable (VACUUM may renumber it) and cannot link the index to its rows. The triggers keep it in
+# sync with every write to foods, including the ones made outside of the application; deleting a
+# food or renaming it scans the index for its food_id, which is fine for a rarely edited catalog.
+SQLITE_STATEMENTS = (
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS foods_fts USING fts5(
+        food_id UNINDEXED,
+        name,
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    "CREATE VIRTUAL TABLE IF NOT EXISTS foods_fts_vocabulary USING fts5vocab(foods_fts, 'row')",
+    """
+    CREATE TRIGGER IF NOT EXISTS foods_fts_insert AFTER INSERT ON foods BEGIN
+        INSERT INTO foods_fts(food_id, name) VALUES (new.id, new.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS foods_fts_delete AFTER DELETE ON foods BEGIN
+        DELETE FROM foods_fts WHERE food_id = old.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS foods_fts_update AFTER UPDATE OF id, name ON foods BEGIN
+        DELETE FROM foods_fts WHERE food_id = old.id;
+        INSERT INTO foods_fts(food_id, name) VALUES (new.id, new.name);
+    END
+    """,
+    "DELETE FROM foods_fts",
+    "INSERT INTO foods_fts(food_id, name) SELECT id, name FROM foods",
+)
+
+
+class FoodSearchIndex(Migration):
+    """
+    Creates the full-text index of the food names on SQLite. Other databases search with LIKE.
+    """
+    version = 4
+    description = "food name full-text index"
+
+    async def upgrade(self, handler: DatabaseHandler) -> None:
+        async with handler.engine.begin() as conn:
+            if conn.dialect.name != "sqlite":
+                return
+
+            for statement in SQLITE_STATEMENTS:
+                await conn.exec_driver_sql(statement)
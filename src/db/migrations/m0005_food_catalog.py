@@ -0,0 +1,40 @@
+from sqlalchemy import func, insert, select
+
+from src.core import DatabaseHandler
+from src.core.catalog import CATALOG_NUTRIENTS
+from src.db.migrations.base import Migration, create_index
+from src.db.models import CatalogFoodModel, FoodConsumptionModel, FoodModel
+
+
+class ReferenceFoodCatalog(Migration):
+    """
+    Creates the reference food catalog and the consumption log, seeding the catalog with one
+    entry per food name, its nutrients averaged per 100 g.
+    """
+    version = 5
+    description = "reference food catalog and consumption log"
+
+    async def upgrade(self, handler: DatabaseHandler) -> None:
+        async with handler.engine.begin() as conn:
+            for model in (CatalogFoodModel, FoodConsumptionModel):
+                await conn.run_sync(
+                    lambda sync_conn, table=model.__table__: table.create(sync_conn, checkfirst=True)
+                )
+
+        for index in FoodConsumptionModel.__table__.indexes:
+            await create_index(handler, index)
+
+        per_100g = [
+            func.avg(getattr(FoodModel, nutrient) * 100 / FoodModel.quantity)
+            for nutrient in CATALOG_NUTRIENTS
+        ]
+        seed = (
+            select(func.min(FoodModel.id), FoodModel.name, *per_100g)
+            .where(FoodModel.quantity > 0, FoodModel.name.not_in(select(CatalogFoodModel.name)))
+            .group_by(FoodModel.name)
+        )
+
+        async with handler.engine.begin() as conn:
+            await conn.execute(
+                insert(CatalogFoodModel).from_select(["id", "name", *CATALOG_NUTRIENTS], seed)
+            )
@@ -0,0 +1,14 @@
+from src.core import DatabaseHandler
+from src.db.migrations.base import Migration, add_column
+from src.db.models import FoodModel
+
+
+class FoodPrices(Migration):
+    """
+    Adds the optional price of the foods, used to keep diet plans within the user's budget.
+    """
+    version = 6
+    description = "food prices"
+
+    async def upgrade(self, handler: DatabaseHandler) -> None:
+        await add_column(handler, FoodModel.__table__.c.price)
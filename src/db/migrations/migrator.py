@@ -0,0 +1,123 @@
+from sqlalchemy import TIMESTAMP, Column, Integer, MetaData, String, Table, func, insert, inspect, select
+
+from src.core import DatabaseHandler
+from src.db.migrations.base import Migration
+
+
+metadata = MetaData()
+
+schema_version = Table(
+    "schema_version",
+    metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", TIMESTAMP, nullable=False, server_default=func.now()),
+)
+
+
+class SchemaVersionError(RuntimeError):
+    """
+    SchemaVersionError is raised when the database schema is not at the version the code expects.
+    """
+
+
+class Migrator:
+    """
+    Migrator applies versioned migrations and records each applied version in the schema_version table.
+
+    Attributes:
+        handler (DatabaseHandler): The database to migrate.
+        migrations (list[Migration]): The known migrations, sorted by version.
+
+    Methods:
+        current_version: Returns the version of the database schema.
+        pending: Returns the migrations not applied yet.
+        upgrade: Applies the pending migrations.
+        check: Verifies the database schema is up to date.
+    """
+    def __init__(self, handler: DatabaseHandler, migrations: list[Migration]) -> None:
+        self.handler = handler
+        self.migrations = sorted(migrations, key=lambda migration: migration.version)
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    async def current_version(self) -> int:
+        """
+        Returns the version of the database schema.
+
+        Returns:
+            int: The highest applied version, or 0 if no migration was applied.
+        """
+        async with self.handler.engine.connect() as conn:
+            exists = await conn.run_sync(
+                lambda sync_conn: inspect(sync_conn).has_table(schema_version.name)
+            )
+
+            if not exists:
+                return 0
+
+            result = await conn.execute(select(func.max(schema_version.c.version)))
+            return result.scalar() or 0
+
+    async def pending(self) -> list[Migration]:
+        """
+        Returns the migrations not applied yet.
+
+        Returns:
+            list[Migration]: The migrations with a version above the current one.
+        """
+        current = await self.current_version()
+        return [migration for migration in self.migrations if migration.version > current]
+
+    async def upgrade(self, target: int | None = None) -> list[Migration]:
+        """
+        Applies the pending migrations, one at a time, recording each version once it succeeds.
+
+        Args:
+            target (int | None): The version to stop at. Defaults to the latest version.
+
+        Returns:
+            list[Migration]: The migrations applied.
+        """
+        async with self.handler.engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+
+        applied = []
+
+        for migration in await self.pending():
+            if target is not None and migration.version > target:
+                break
+
+            await migration.upgrade(self.handler)
+
+            async with self.handler.engine.begin() as conn:
+                await conn.execute(
+                    insert(schema_version).values(
+                        version=migration.version,
+                        description=migration.description
+                    )
+                )
+
+            applied.append(migration)
+
+        return applied
+
+    async def check(self) -> None:
+        """
+        Verifies the database schema is up to date, without changing it.
+
+        Returns:
+            None
+
+        Raises:
+            SchemaVersionError: If the schema version differs from the latest migration.
+        """
+        current = await self.current_version()
+
+        if current != self.latest_version:
+            raise SchemaVersionError(
+                f"Database schema is at version {current}, expected {self.latest_version}. "
+                "Run `python -m src.db.migrations upgrade`."
+            )
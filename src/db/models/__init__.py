@@ -1,19 +1,25 @@
 from .diet import DietModel
 from .exercise import ExerciseModel
 from .food import FoodModel
+from .food_catalog import CatalogFoodModel, FoodConsumptionModel
 from .meal import MealModel
 from .medical_history import MedicalHistoryModel
+from .nutrient_rollup import NutrientDailyRollupModel, NutrientWeeklyRollupModel
 from .nutritional_data import NutritionalDataModel
 from .train import TrainModel
 from .user import UserModel
 
 
 __all__ = [
+    'CatalogFoodModel',
     "DietModel",
     'ExerciseModel',
+    'FoodConsumptionModel',
     'FoodModel',
     'MealModel',
     'MedicalHistoryModel',
+    'NutrientDailyRollupModel',
+    'NutrientWeeklyRollupModel',
     'NutritionalDataModel',
     'TrainModel',
     'UserModel',
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import DECIMAL, ForeignKey, String, TIMESTAMP, Text, func
+from sqlalchemy import DECIMAL, ForeignKey, Index, String, TIMESTAMP, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -25,6 +25,9 @@ class DietModel(BaseModel):
     """
      
     __tablename__ = 'diets'
+    __table_args__ = (
+        Index('ix_diets_user_id_date', 'user_id', 'date'),
+    )
 
     id: Mapped[str] = mapped_column(String,primary_key=True, default=id_generator)
     user_id: Mapped[str] = mapped_column(ForeignKey('users.id'), nullable=False)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import DECIMAL, String, TIMESTAMP, func
+from sqlalchemy import DECIMAL, Index, String, TIMESTAMP, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -20,11 +20,15 @@ class FoodModel(BaseModel):
         carbohydrates (float): The amount of carbohydrates in the food item.
         consumption_date (datetime): The date when the food was consumed.
         type (str): The type of food (e.g., 'breakfast', 'lunch', 'dinner').
+        price (float | None): The price of the quantity of the food item, used by the diet plan budget.
         created_at (datetime): Timestamp when the record was created.
         updated_at (datetime): Timestamp when the record was last updated.
     """
      
     __tablename__ = 'foods'
+    __table_args__ = (
+        Index('ix_foods_consumption_date', 'consumption_date'),
+    )
 
     id: Mapped[str] = mapped_column(String,primary_key=True, default=id_generator)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -35,6 +39,7 @@ class FoodModel(BaseModel):
     carbohydrates: Mapped[float] = mapped_column(DECIMAL, nullable=False)
     consumption_date: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
     type: Mapped[str] = mapped_column(String, nullable=False)
+    price: Mapped[float | None] = mapped_column(DECIMAL, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP, nullable=False, server_default=func.now()
     )
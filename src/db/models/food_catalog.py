@@ -0,0 +1,73 @@
+from datetime import datetime
+from sqlalchemy import DECIMAL, ForeignKey, Index, String, TIMESTAMP, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+from src.core import BaseModel, id_generator
+
+
+class CatalogFoodModel(BaseModel):
+    """
+    CatalogFoodModel is a SQLAlchemy model representing a food of the shared reference catalog.
+
+    The catalog holds each food once, with its nutrients per 100 g; consumption is logged
+    separately in FoodConsumptionModel. It is seeded from the foods table but does not replace
+    it yet: meals, diets and diet plans still use the per portion nutrients of FoodModel, until
+    meals move to the catalog as described in docs/catalogo-de-alimentos.md.
+
+    Attributes:
+        id (str): The unique identifier for the food.
+        name (str): The name of the food.
+        calories (float): The calories per 100 g.
+        proteins (float): The proteins per 100 g.
+        fats (float): The fats per 100 g.
+        carbohydrates (float): The carbohydrates per 100 g.
+        created_at (datetime): Timestamp when the record was created.
+        updated_at (datetime): Timestamp when the record was last updated.
+    """
+
+    __tablename__ = 'food_catalog'
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=id_generator)
+    name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    calories: Mapped[float] = mapped_column(DECIMAL, nullable=False)
+    proteins: Mapped[float] = mapped_column(DECIMAL, nullable=False)
+    fats: Mapped[float] = mapped_column(DECIMAL, nullable=False)
+    carbohydrates: Mapped[float] = mapped_column(DECIMAL, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+class FoodConsumptionModel(BaseModel):
+    """
+    FoodConsumptionModel is a SQLAlchemy model representing a quantity of a catalog food eaten by a user.
+
+    Attributes:
+        id (str): The unique identifier for the entry.
+        user_id (str): The ID of the user who ate the food.
+        catalog_food_id (str): The ID of the catalog food.
+        grams (float): The quantity eaten, in grams.
+        consumed_at (datetime): When the food was eaten.
+        created_at (datetime): Timestamp when the record was created.
+    """
+
+    __tablename__ = 'food_consumptions'
+    __table_args__ = (
+        Index('ix_food_consumptions_user_id_consumed_at', 'user_id', 'consumed_at'),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=id_generator)
+    user_id: Mapped[str] = mapped_column(ForeignKey('users.id'), nullable=False)
+    catalog_food_id: Mapped[str] = mapped_column(ForeignKey('food_catalog.id'), nullable=False)
+    grams: Mapped[float] = mapped_column(DECIMAL, nullable=False)
+    consumed_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP, nullable=False, server_default=func.now()
+    )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import ForeignKey, String, TIMESTAMP, Text, func
+from sqlalchemy import ForeignKey, Index, String, TIMESTAMP, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -22,6 +22,10 @@ class MealModel(BaseModel):
     """
      
     __tablename__ = 'meals'
+    __table_args__ = (
+        Index('ix_meals_diet_id', 'diet_id'),
+        Index('ix_meals_food_id', 'food_id'),
+    )
 
     id: Mapped[str] = mapped_column(String,primary_key=True, default=id_generator)
     food_id: Mapped[str] = mapped_column(ForeignKey('foods.id'), nullable=False)
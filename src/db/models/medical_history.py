@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, Text, TIMESTAMP, ForeignKey, func
+from sqlalchemy import String, Text, TIMESTAMP, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -22,6 +22,9 @@ class MedicalHistoryModel(BaseModel):
     """
     
     __tablename__ = 'medical_history'
+    __table_args__ = (
+        Index('ix_medical_history_user_id', 'user_id'),
+    )
 
     id: Mapped[str] = mapped_column(String,primary_key=True, default=id_generator)
     user_id: Mapped[str] = mapped_column(ForeignKey('users.id'), nullable=False)
@@ -0,0 +1,72 @@
+from datetime import date, datetime
+from sqlalchemy import DECIMAL, Date, ForeignKey, TIMESTAMP, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+from src.core import BaseModel
+
+
+class NutrientDailyRollupModel(BaseModel):
+    """
+    NutrientDailyRollupModel is a SQLAlchemy model holding the nutrients a user consumed per day.
+
+    The rows sum the totals of the user's diets by diet date. The (user_id, day) primary key
+    serves date range reads of a user with a single index scan.
+
+    Attributes:
+        user_id (str): The ID of the user.
+        day (date): The day of the diets.
+        calories (float): The calories of the completed meals of the day.
+        proteins (float): The proteins of the completed meals of the day.
+        fats (float): The fats of the completed meals of the day.
+        carbohydrates (float): The carbohydrates of the completed meals of the day.
+        updated_at (datetime): Timestamp when the record was last updated.
+    """
+
+    __tablename__ = 'nutrient_daily_rollups'
+
+    user_id: Mapped[str] = mapped_column(ForeignKey('users.id'), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    calories: Mapped[float] = mapped_column(DECIMAL, nullable=False, default=0)
+    proteins: Mapped[float] = mapped_column(DECIMAL, nullable=False, default=0)
+    fats: Mapped[float] = mapped_column(DECIMAL, nullable=False, default=0)
+    carbohydrates: Mapped[float] = mapped_column(DECIMAL, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+class NutrientWeeklyRollupModel(BaseModel):
+    """
+    NutrientWeeklyRollupModel is a SQLAlchemy model holding the nutrients a user consumed per week.
+
+    Weeks start on Monday. The (user_id, week_start) primary key serves date range reads of a
+    user with a single index scan.
+
+    Attributes:
+        user_id (str): The ID of the user.
+        week_start (date): The Monday of the week.
+        calories (float): The calories of the completed meals of the week.
+        proteins (float): The proteins of the completed meals of the week.
+        fats (float): The fats of the completed meals of the week.
+        carbohydrates (float): The carbohydrates of the completed meals of the week.
+        updated_at (datetime): Timestamp when the record was last updated.
+    """
+
+    __tablename__ = 'nutrient_weekly_rollups'
+
+    user_id: Mapped[str] = mapped_column(ForeignKey('users.id'), primary_key=True)
+    week_start: Mapped[date] = mapped_column(Date, primary_key=True)
+    calories: Mapped[float] = mapped_column(DECIMAL, nullable=False, default=0)
+    proteins: Mapped[float] = mapped_column(DECIMAL, nullable=False, default=0)
+    fats: Mapped[float] = mapped_column(DECIMAL, nullable=False, default=0)
+    carbohydrates: Mapped[float] = mapped_column(DECIMAL, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
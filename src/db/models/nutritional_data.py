@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, Text, TIMESTAMP, ForeignKey, DECIMAL, func
+from sqlalchemy import String, Text, TIMESTAMP, ForeignKey, Index, DECIMAL, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -27,6 +27,9 @@ class NutritionalDataModel(BaseModel):
     """
     
     __tablename__ = 'nutritional_data'
+    __table_args__ = (
+        Index('ix_nutritional_data_user_id_evaluation_date', 'user_id', 'evaluation_date'),
+    )
 
     id: Mapped[str] = mapped_column(String,primary_key=True, default=id_generator)
     user_id: Mapped[str] = mapped_column(ForeignKey('users.id'), nullable=False)
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Integer, String, Text, TIMESTAMP, ForeignKey, func
+from sqlalchemy import Integer, String, Text, TIMESTAMP, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -22,6 +22,10 @@ class TrainModel(BaseModel):
     """
      
     __tablename__ = 'trains'
+    __table_args__ = (
+        Index('ix_trains_user_id_date', 'user_id', 'date'),
+        Index('ix_trains_exercise_id', 'exercise_id'),
+    )
 
     id: Mapped[str] = mapped_column(String,primary_key=True, default=id_generator)
     exercise_id: Mapped[str] = mapped_column(ForeignKey('exercises.id'), nullable=False)
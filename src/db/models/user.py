@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import String, Text, TIMESTAMP, func
+from sqlalchemy import Index, String, Text, TIMESTAMP, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -26,6 +26,9 @@ class UserModel(BaseModel):
     """
     
     __tablename__ = 'users'
+    __table_args__ = (
+        Index('ix_users_created_at_id', 'created_at', 'id'),
+    )
 
     id: Mapped[str] = mapped_column(String,primary_key=True, default=id_generator)
     name: Mapped[str] = mapped_column(String(255), nullable=True)
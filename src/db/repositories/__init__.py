@@ -1,6 +1,17 @@
-from .user import UserRepository
+from .catalog import CatalogRepository
+from .diet import DietRepository
+from .food import FoodRepository
+from .nutrient_rollup import NutrientRollupRepository
+from .nutritional_data import NutritionalDataRepository
+from .user import WARM_UP_QUERIES as USER_WARM_UP_QUERIES, UserRepository
 
 
 __all__ = [
+    "CatalogRepository",
+    "DietRepository",
+    "FoodRepository",
+    "NutrientRollupRepository",
+    "NutritionalDataRepository",
+    "USER_WARM_UP_QUERIES",
     "UserRepository",
 ]
\ No newline at end of file
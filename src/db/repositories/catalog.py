@@ -0,0 +1,98 @@
+from datetime import datetime
+
+from sqlalchemy import insert, select
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import id_generator
+from src.core.catalog import CATALOG_NUTRIENTS, FoodCatalog
+from src.db.db import db
+from src.db.models import CatalogFoodModel, FoodConsumptionModel
+from src.schemas import ConsumptionCreate, ConsumptionResponse
+
+
+CATALOG_COLUMNS = (
+    CatalogFoodModel.id,
+    CatalogFoodModel.name,
+    *(getattr(CatalogFoodModel, nutrient) for nutrient in CATALOG_NUTRIENTS),
+)
+CONSUMPTION_RESPONSE_COLUMNS = tuple(getattr(FoodConsumptionModel, name) for name in ConsumptionResponse.model_fields)
+
+
+class CatalogRepository:
+    """
+    CatalogRepository reads the reference food catalog and stores the consumption log.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def load_catalog(self) -> FoodCatalog:
+        """
+        Reads the whole catalog into an immutable in-memory snapshot, in one query.
+
+        Returns:
+            FoodCatalog: The snapshot.
+        """
+        result = await self.db.execute(select(*CATALOG_COLUMNS).order_by(CatalogFoodModel.name))
+        return FoodCatalog(result.tuples())
+
+    async def catalog_food_exists(self, food_id: str) -> bool:
+        """
+        Checks whether a food is in the catalog table, e.g. when it is missing from a snapshot.
+
+        Args:
+            food_id (str): The ID of the food.
+
+        Returns:
+            bool: True if the food exists.
+        """
+        result = await self.db.execute(select(CatalogFoodModel.id).where(CatalogFoodModel.id == food_id))
+        return result.first() is not None
+
+    async def add_consumption(self, user_id: str, request: ConsumptionCreate) -> Row:
+        """
+        Logs a quantity of a catalog food eaten by a user.
+
+        Args:
+            user_id (str): The ID of the user.
+            request (ConsumptionCreate): The consumption entry.
+
+        Returns:
+            Row: The CONSUMPTION_RESPONSE_COLUMNS of the entry.
+        """
+        values = {**request.to_dict(), "id": id_generator(), "user_id": user_id}
+        stmt = insert(FoodConsumptionModel).values(**values).returning(*CONSUMPTION_RESPONSE_COLUMNS)
+
+        async def insert_consumption(session: AsyncSession) -> Row:
+            result = await session.execute(stmt)
+            return result.one()
+
+        return await db.run_write(insert_consumption, self.db)
+
+    async def get_consumed_quantities(
+        self,
+        user_id: str,
+        start: datetime,
+        end: datetime
+    ) -> tuple[list[str], list[float]]:
+        """
+        Retrieves the foods and quantities a user logged in a period, with one (user_id, consumed_at) index range scan.
+
+        Args:
+            user_id (str): The ID of the user.
+            start (datetime): The start of the period, inclusive.
+            end (datetime): The end of the period, exclusive.
+
+        Returns:
+            tuple[list[str], list[float]]: The catalog food IDs and the grams of each entry, in the same order.
+        """
+        query = select(FoodConsumptionModel.catalog_food_id, FoodConsumptionModel.grams).where(
+            FoodConsumptionModel.user_id == user_id,
+            FoodConsumptionModel.consumed_at >= start,
+            FoodConsumptionModel.consumed_at < end,
+        )
+        rows = (await self.db.execute(query)).all()
+        return [row[0] for row in rows], [row[1] for row in rows]
+
+    def map_row_to_consumption(self, row: Row) -> ConsumptionResponse:
+        return ConsumptionResponse.model_validate(row._mapping)
@@ -0,0 +1,357 @@
+from datetime import datetime
+from typing import Iterable
+
+from fastapi import HTTPException
+from sqlalchemy import Float, and_, delete, func, insert, or_, select, type_coerce, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import id_generator, messages
+from src.db.db import db
+from src.db.models import DietModel, FoodModel, MealModel
+from src.db.repositories.nutrient_rollup import NUTRIENTS, NutrientRollupRepository
+from src.schemas import DietCreate, DietResponse, MealCreate, MealResponse
+
+
+DIET_RESPONSE_COLUMNS = tuple(getattr(DietModel, name) for name in DietResponse.model_fields)
+MEAL_RESPONSE_COLUMNS = tuple(getattr(MealModel, name) for name in MealResponse.model_fields)
+
+# Number of diets rebuilt per UPDATE statement.
+REBUILD_BATCH_SIZE = 500
+
+
+def _meal_sums(diet_id_column) -> dict:
+    """
+    Builds, per nutrient, a correlated subquery summing the foods of the completed meals of a diet.
+
+    Args:
+        diet_id_column: The column or bound value holding the diet ID.
+
+    Returns:
+        dict: The scalar subquery of each nutrient.
+    """
+    return {
+        nutrient: (
+            select(func.coalesce(func.sum(getattr(FoodModel, nutrient)), 0))
+            .select_from(MealModel)
+            .join(FoodModel, FoodModel.id == MealModel.food_id)
+            .where(MealModel.diet_id == diet_id_column, MealModel.is_completed.is_(True))
+            .scalar_subquery()
+        )
+        for nutrient in NUTRIENTS
+    }
+
+
+class DietRepository:
+    """
+    DietRepository stores diets and meals and keeps the diet totals in step with the completed meals.
+
+    Every meal change applies the nutrients of its food to the diet totals, and to the user's
+    nutrient rollups, as a delta in the same write job, so the totals are never re-summed from the
+    meals on the request path. total_water is entered with the diet and is not derived from meals.
+    find_drifted and rebuild_totals verify and repair them in bulk.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def add_diet(self, user_id: str, request: DietCreate) -> Row:
+        """
+        Adds a new diet with zeroed nutrient totals.
+
+        Args:
+            user_id (str): The ID of the user the diet belongs to.
+            request (DietCreate): The diet creation request.
+
+        Returns:
+            Row: The DIET_RESPONSE_COLUMNS of the added diet.
+        """
+        values = {
+            **request.to_dict(),
+            "id": id_generator(),
+            "user_id": user_id,
+            **{f"total_{nutrient}": 0 for nutrient in NUTRIENTS},
+        }
+        stmt = insert(DietModel).values(**values).returning(*DIET_RESPONSE_COLUMNS)
+
+        async def insert_diet(session: AsyncSession) -> Row:
+            result = await session.execute(stmt)
+            return result.one()
+
+        return await db.run_write(insert_diet, self.db)
+
+    async def get_diet_row(self, diet_id: str, user_id: str) -> Row | None:
+        """
+        Retrieves a diet of a user.
+
+        Args:
+            diet_id (str): The ID of the diet.
+            user_id (str): The ID of the user the diet must belong to.
+
+        Returns:
+            Row | None: The DIET_RESPONSE_COLUMNS of the diet, or None if the user has no such diet.
+        """
+        query = select(*DIET_RESPONSE_COLUMNS).where(DietModel.id == diet_id, DietModel.user_id == user_id)
+        result = await self.db.execute(query)
+        return result.first()
+
+    async def add_meal(self, diet_id: str, request: MealCreate) -> Row:
+        """
+        Adds a meal to a diet, adding its food to the diet totals when the meal is already completed.
+
+        Args:
+            diet_id (str): The ID of the diet.
+            request (MealCreate): The meal creation request.
+
+        Returns:
+            Row: The MEAL_RESPONSE_COLUMNS of the added meal.
+
+        Raises:
+            HTTPException: If the food does not exist (404).
+        """
+        values = {**request.to_dict(), "id": id_generator(), "diet_id": diet_id}
+        stmt = insert(MealModel).values(**values).returning(*MEAL_RESPONSE_COLUMNS)
+
+        async def insert_meal(session: AsyncSession) -> Row:
+            food = await session.execute(select(FoodModel.id).where(FoodModel.id == request.food_id))
+
+            if food.first() is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=messages.FOOD_NOT_FOUND
+                )
+
+            meal = (await session.execute(stmt)).one()
+
+            if meal.is_completed:
+                await self._apply_food(session, diet_id, meal.food_id, 1)
+
+            return meal
+
+        return await db.run_write(insert_meal, self.db)
+
+    async def set_meal_completed(self, diet_id: str, meal_id: str, is_completed: bool) -> Row:
+        """
+        Marks a meal as completed or not, adding or subtracting its food from the diet totals.
+
+        The meal is only updated when its state changes, so repeating the request does not apply
+        the delta twice.
+
+        Args:
+            diet_id (str): The ID of the diet.
+            meal_id (str): The ID of the meal.
+            is_completed (bool): The new completion state.
+
+        Returns:
+            Row: The MEAL_RESPONSE_COLUMNS of the meal.
+
+        Raises:
+            HTTPException: If the diet has no such meal (404).
+        """
+        changed_stmt = (
+            update(MealModel)
+            .where(
+                MealModel.id == meal_id,
+                MealModel.diet_id == diet_id,
+                MealModel.is_completed.is_not(is_completed)
+            )
+            .values(is_completed=is_completed)
+            .returning(*MEAL_RESPONSE_COLUMNS)
+        )
+        current_stmt = select(*MEAL_RESPONSE_COLUMNS).where(MealModel.id == meal_id, MealModel.diet_id == diet_id)
+
+        async def update_meal(session: AsyncSession) -> Row:
+            meal = (await session.execute(changed_stmt)).one_or_none()
+
+            if meal is not None:
+                await self._apply_food(session, diet_id, meal.food_id, 1 if is_completed else -1)
+                return meal
+
+            meal = (await session.execute(current_stmt)).one_or_none()
+
+            if meal is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=messages.MEAL_NOT_FOUND
+                )
+
+            return meal
+
+        return await db.run_write(update_meal, self.db)
+
+    async def delete_meal(self, diet_id: str, meal_id: str) -> None:
+        """
+        Deletes a meal, subtracting its food from the diet totals when it was completed.
+
+        Args:
+            diet_id (str): The ID of the diet.
+            meal_id (str): The ID of the meal.
+
+        Returns:
+            None
+
+        Raises:
+            HTTPException: If the diet has no such meal (404).
+        """
+        stmt = (
+            delete(MealModel)
+            .where(MealModel.id == meal_id, MealModel.diet_id == diet_id)
+            .returning(MealModel.food_id, MealModel.is_completed)
+        )
+
+        async def remove_meal(session: AsyncSession) -> None:
+            meal = (await session.execute(stmt)).one_or_none()
+
+            if meal is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=messages.MEAL_NOT_FOUND
+                )
+
+            if meal.is_completed:
+                await self._apply_food(session, diet_id, meal.food_id, -1)
+
+        await db.run_write(remove_meal, self.db)
+
+    async def get_diets_with_meals(
+        self,
+        user_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        diet_id: str | None = None
+    ) -> tuple[list[Row], list[Row]]:
+        """
+        Retrieves diets of a user and the nutrients of the food of each of their meals, in two queries.
+
+        The nutrients are read as floats instead of Decimal, since they are summed by the nutrition engine.
+
+        Args:
+            user_id (str): The ID of the user.
+            start (datetime | None): The start of the period, inclusive.
+            end (datetime | None): The end of the period, exclusive.
+            diet_id (str | None): The ID of a single diet to retrieve.
+
+        Returns:
+            tuple[list[Row], list[Row]]: The id and date of each diet, ordered by date, and the diet_id, type,
+                is_completed and nutrients of each of their meals, ordered by creation.
+        """
+        conditions = [DietModel.user_id == user_id]
+
+        if start is not None:
+            conditions.append(DietModel.date >= start)
+
+        if end is not None:
+            conditions.append(DietModel.date < end)
+
+        if diet_id is not None:
+            conditions.append(DietModel.id == diet_id)
+
+        diets_query = select(DietModel.id, DietModel.date).where(*conditions).order_by(DietModel.date, DietModel.id)
+        meals_query = (
+            select(
+                MealModel.diet_id,
+                MealModel.type,
+                MealModel.is_completed,
+                *(type_coerce(getattr(FoodModel, nutrient), Float).label(nutrient) for nutrient in NUTRIENTS)
+            )
+            .join(DietModel, DietModel.id == MealModel.diet_id)
+            .join(FoodModel, FoodModel.id == MealModel.food_id)
+            .where(*conditions)
+            .order_by(MealModel.created_at, MealModel.id)
+        )
+
+        diets = (await self.db.execute(diets_query)).all()
+        meals = (await self.db.execute(meals_query)).all()
+        return list(diets), list(meals)
+
+    async def find_drifted(self, tolerance: float = 1e-6) -> list[Row]:
+        """
+        Compares the stored totals of every diet with the sum of its completed meals, in one query.
+
+        Args:
+            tolerance (float): The largest difference accepted per nutrient.
+
+        Returns:
+            list[Row]: The id, the user_id, the stored total_<nutrient> and the summed <nutrient> of every diet
+                whose totals differ from its meals.
+        """
+        sums = {
+            nutrient: func.coalesce(func.sum(getattr(FoodModel, nutrient)), 0).label(nutrient)
+            for nutrient in NUTRIENTS
+        }
+        totals = [getattr(DietModel, f"total_{nutrient}") for nutrient in NUTRIENTS]
+
+        query = (
+            select(DietModel.id, DietModel.user_id, *totals, *sums.values())
+            .select_from(DietModel)
+            .outerjoin(MealModel, and_(MealModel.diet_id == DietModel.id, MealModel.is_completed.is_(True)))
+            .outerjoin(FoodModel, FoodModel.id == MealModel.food_id)
+            .group_by(DietModel.id, DietModel.user_id, *totals)
+            .having(or_(*(
+                func.abs(total - sums[nutrient]) > tolerance
+                for nutrient, total in zip(NUTRIENTS, totals)
+            )))
+        )
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def rebuild_totals(self, diet_ids: Iterable[str] | None = None) -> int:
+        """
+        Recomputes the nutrient totals from the completed meals, REBUILD_BATCH_SIZE diets per statement.
+
+        Args:
+            diet_ids (Iterable[str] | None): The diets to rebuild, or None to rebuild every diet.
+
+        Returns:
+            int: The number of diets rebuilt.
+        """
+        values = {f"total_{nutrient}": sum_ for nutrient, sum_ in _meal_sums(DietModel.id).items()}
+
+        if diet_ids is None:
+            diet_ids = (await self.db.execute(select(DietModel.id))).scalars().all()
+
+        diet_ids = list(diet_ids)
+        rebuilt = 0
+
+        for start in range(0, len(diet_ids), REBUILD_BATCH_SIZE):
+            stmt = (
+                update(DietModel)
+                .where(DietModel.id.in_(diet_ids[start:start + REBUILD_BATCH_SIZE]))
+                .values(**values)
+            )
+
+            async def rebuild(session: AsyncSession, stmt=stmt) -> int:
+                result = await session.execute(stmt)
+                return result.rowcount
+
+            rebuilt += await db.run_write(rebuild, self.db)
+
+        return rebuilt
+
+    @staticmethod
+    async def _apply_food(session: AsyncSession, diet_id: str, food_id: str, sign: int) -> None:
+        """
+        Adds (sign 1) or subtracts (sign -1) the nutrients of a food to the totals of a diet and
+        to the rollups of its user.
+        """
+        query = select(*(getattr(FoodModel, nutrient) for nutrient in NUTRIENTS)).where(FoodModel.id == food_id)
+        food = (await session.execute(query)).one()
+        deltas = {nutrient: sign * float(value) for nutrient, value in zip(NUTRIENTS, food)}
+
+        stmt = (
+            update(DietModel)
+            .where(DietModel.id == diet_id)
+            .values(**{
+                f"total_{nutrient}": getattr(DietModel, f"total_{nutrient}") + delta
+                for nutrient, delta in deltas.items()
+            })
+            .returning(DietModel.user_id, DietModel.date)
+        )
+        diet = (await session.execute(stmt)).one()
+
+        await NutrientRollupRepository.apply_deltas(session, diet.user_id, diet.date.date(), deltas)
+
+    def map_row_to_diet(self, row: Row) -> DietResponse:
+        return DietResponse.model_validate(row._mapping)
+
+    def map_row_to_meal(self, row: Row) -> MealResponse:
+        return MealResponse.model_validate(row._mapping)
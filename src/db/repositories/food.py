@@ -0,0 +1,117 @@
+from sqlalchemy import Float, func, select, text, type_coerce
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import FoodModel
+from src.schemas import FoodSearchResponse
+
+
+FOOD_SEARCH_COLUMNS = tuple(getattr(FoodModel, name) for name in FoodSearchResponse.model_fields)
+
+# Ranked by BM25, then shorter names first: "arroz" before "arroz integral cozido".
+FTS_SEARCH_QUERY = text(
+    f"""
+    SELECT {", ".join(f"foods.{column.key}" for column in FOOD_SEARCH_COLUMNS)}
+    FROM foods_fts JOIN foods ON foods.id = foods_fts.food_id
+    WHERE foods_fts MATCH :match
+    ORDER BY foods_fts.rank, length(foods.name)
+    LIMIT :limit
+    """
+)
+
+VOCABULARY_QUERY = text("SELECT term FROM foods_fts_vocabulary")
+
+
+class FoodRepository:
+    """
+    FoodRepository reads foods, searching them by name with the full-text index of migration 4.
+
+    The index only exists on SQLite; other databases fall back to a case insensitive LIKE on the name.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    @property
+    def full_text(self) -> bool:
+        return self.db.bind.dialect.name == "sqlite"
+
+    async def search(self, match: str, limit: int) -> list[Row]:
+        """
+        Searches foods with an FTS5 MATCH expression, best ranked first.
+
+        Args:
+            match (str): The FTS5 query, e.g. '"arroz" "integ"*'.
+            limit (int): The maximum number of foods.
+
+        Returns:
+            list[Row]: The FOOD_SEARCH_COLUMNS of the matching foods.
+        """
+        result = await self.db.execute(FTS_SEARCH_QUERY, {"match": match, "limit": limit})
+        return list(result.all())
+
+    async def search_like(self, words: list[str], limit: int) -> list[Row]:
+        """
+        Searches foods whose name contains every word, shortest names first. Used without the full-text index.
+
+        Args:
+            words (list[str]): The normalized words.
+            limit (int): The maximum number of foods.
+
+        Returns:
+            list[Row]: The FOOD_SEARCH_COLUMNS of the matching foods.
+        """
+        query = (
+            select(*FOOD_SEARCH_COLUMNS)
+            .where(*(FoodModel.name.ilike(f"%{word}%") for word in words))
+            .order_by(func.length(FoodModel.name), FoodModel.name)
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def get_vocabulary(self) -> list[str]:
+        """
+        Retrieves every distinct word of the full-text index, as indexed (lowercase, without accents).
+
+        Returns:
+            list[str]: The words.
+        """
+        result = await self.db.execute(VOCABULARY_QUERY)
+        return list(result.scalars().all())
+
+    async def get_plan_candidates(self, priced: bool = False) -> list[Row]:
+        """
+        Retrieves one food per name to build diet plans from, the one with the smallest ID.
+
+        The values are read as floats instead of Decimal, since they feed the plan solver.
+
+        Args:
+            priced (bool): If True, only foods with a price are returned.
+
+        Returns:
+            list[Row]: The id, name, quantity, calories, proteins, fats, carbohydrates and price of
+                each food, ordered by name.
+        """
+        conditions = [FoodModel.quantity > 0]
+
+        if priced:
+            conditions.append(FoodModel.price.is_not(None))
+
+        first_per_name = select(func.min(FoodModel.id)).where(*conditions).group_by(FoodModel.name)
+        query = (
+            select(
+                FoodModel.id,
+                FoodModel.name,
+                *(
+                    type_coerce(getattr(FoodModel, column), Float).label(column)
+                    for column in ("quantity", "calories", "proteins", "fats", "carbohydrates", "price")
+                ),
+            )
+            .where(FoodModel.id.in_(first_per_name))
+            .order_by(FoodModel.name)
+        )
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    def map_row_to_search_response(self, row: Row) -> FoodSearchResponse:
+        return FoodSearchResponse.model_validate(row._mapping)
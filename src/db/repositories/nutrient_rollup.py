@@ -0,0 +1,235 @@
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import delete, func, insert, select, union
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.db import db
+from src.db.models import DietModel, NutrientDailyRollupModel, NutrientWeeklyRollupModel
+from src.schemas import DailyNutrientsResponse, WeeklyNutrientsResponse
+
+
+# Nutrients summed from the foods of the completed meals into the diet totals and the rollups.
+NUTRIENTS = ("calories", "proteins", "fats", "carbohydrates")
+
+DAILY_RESPONSE_COLUMNS = tuple(
+    getattr(NutrientDailyRollupModel, name) for name in DailyNutrientsResponse.model_fields
+)
+WEEKLY_RESPONSE_COLUMNS = tuple(
+    getattr(NutrientWeeklyRollupModel, name) for name in WeeklyNutrientsResponse.model_fields
+)
+
+# Number of users whose rollups are rebuilt per write.
+REBUILD_BATCH_SIZE = 200
+
+
+def week_start(day: date) -> date:
+    """
+    Returns the Monday of the week of a day.
+
+    Args:
+        day (date): The day.
+
+    Returns:
+        date: The first day of its week.
+    """
+    return day - timedelta(days=day.weekday())
+
+
+def _upsert_delta(session: AsyncSession, model: type, keys: dict, deltas: dict[str, float]):
+    """
+    Builds an INSERT ... ON CONFLICT statement adding deltas to a rollup row, creating it when missing.
+
+    Args:
+        session (AsyncSession): The session the statement will run on, used to pick the dialect.
+        model (type): The rollup model.
+        keys (dict): The primary key values of the row.
+        deltas (dict[str, float]): The value added to each nutrient.
+
+    Returns:
+        Insert: The upsert statement.
+    """
+    dialect = postgresql if session.bind.dialect.name == "postgresql" else sqlite
+    table = model.__table__
+    stmt = dialect.insert(table).values(**keys, **deltas)
+
+    return stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={
+            **{name: table.c[name] + stmt.excluded[name] for name in deltas},
+            "updated_at": func.now(),
+        }
+    )
+
+
+class NutrientRollupRepository:
+    """
+    NutrientRollupRepository maintains the daily and weekly nutrient rollups of each user.
+
+    The rollups sum the diet totals by diet date. Writes apply the same deltas as the diet totals,
+    in the same write job; rebuild recomputes the rollups of whole users from their diets, so it
+    can be rerun at any time to catch up with rows written outside of the API.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    @staticmethod
+    async def apply_deltas(session: AsyncSession, user_id: str, day: date, deltas: dict[str, float]) -> None:
+        """
+        Adds nutrient deltas to the daily and weekly rollups of a user. Must run inside a write job.
+
+        Args:
+            session (AsyncSession): The session of the write job.
+            user_id (str): The ID of the user.
+            day (date): The date of the diet that changed.
+            deltas (dict[str, float]): The value added to each nutrient, negative to subtract.
+
+        Returns:
+            None
+        """
+        await session.execute(
+            _upsert_delta(session, NutrientDailyRollupModel, {"user_id": user_id, "day": day}, deltas)
+        )
+        await session.execute(
+            _upsert_delta(
+                session,
+                NutrientWeeklyRollupModel,
+                {"user_id": user_id, "week_start": week_start(day)},
+                deltas
+            )
+        )
+
+    async def get_daily(self, user_id: str, start: date, end: date) -> list[Row]:
+        """
+        Retrieves the daily rollups of a user in a date range, in one primary key range scan.
+
+        Args:
+            user_id (str): The ID of the user.
+            start (date): The first day, inclusive.
+            end (date): The last day, inclusive.
+
+        Returns:
+            list[Row]: The DAILY_RESPONSE_COLUMNS of the days with diets, in date order.
+        """
+        query = (
+            select(*DAILY_RESPONSE_COLUMNS)
+            .where(
+                NutrientDailyRollupModel.user_id == user_id,
+                NutrientDailyRollupModel.day.between(start, end)
+            )
+            .order_by(NutrientDailyRollupModel.day)
+        )
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def get_weekly(self, user_id: str, start: date, end: date) -> list[Row]:
+        """
+        Retrieves the weekly rollups of a user for the weeks overlapping a date range, in one primary key range scan.
+
+        Args:
+            user_id (str): The ID of the user.
+            start (date): The first day, inclusive.
+            end (date): The last day, inclusive.
+
+        Returns:
+            list[Row]: The WEEKLY_RESPONSE_COLUMNS of the weeks with diets, in date order.
+        """
+        query = (
+            select(*WEEKLY_RESPONSE_COLUMNS)
+            .where(
+                NutrientWeeklyRollupModel.user_id == user_id,
+                NutrientWeeklyRollupModel.week_start.between(week_start(start), end)
+            )
+            .order_by(NutrientWeeklyRollupModel.week_start)
+        )
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def get_changed_users(self, since: datetime) -> list[str]:
+        """
+        Retrieves the users with diets created or updated since a moment.
+
+        Args:
+            since (datetime): The moment, compared with the diets' updated_at.
+
+        Returns:
+            list[str]: The user IDs.
+        """
+        query = select(DietModel.user_id).where(DietModel.updated_at >= since).distinct()
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def rebuild(self, user_ids: Iterable[str] | None = None) -> int:
+        """
+        Replaces the rollups of users with the sums of their diets, REBUILD_BATCH_SIZE users per write.
+
+        Rebuilding is idempotent: the rows are recomputed from the diets, not adjusted, so running
+        it again gives the same rollups.
+
+        Args:
+            user_ids (Iterable[str] | None): The users to rebuild, or None for every user with diets or rollups.
+
+        Returns:
+            int: The number of users rebuilt.
+        """
+        if user_ids is None:
+            query = union(select(DietModel.user_id), select(NutrientDailyRollupModel.user_id))
+            user_ids = (await self.db.execute(query)).scalars().all()
+
+        user_ids = list(user_ids)
+
+        for start in range(0, len(user_ids), REBUILD_BATCH_SIZE):
+            batch = user_ids[start:start + REBUILD_BATCH_SIZE]
+
+            async def replace(session: AsyncSession, batch: list[str] = batch) -> None:
+                daily, weekly = await self._sum_diets(session, batch)
+
+                for model in (NutrientDailyRollupModel, NutrientWeeklyRollupModel):
+                    await session.execute(delete(model).where(model.user_id.in_(batch)))
+
+                if daily:
+                    await session.execute(insert(NutrientDailyRollupModel), daily)
+                    await session.execute(insert(NutrientWeeklyRollupModel), weekly)
+
+            await db.run_write(replace, self.db)
+
+        return len(user_ids)
+
+    @staticmethod
+    async def _sum_diets(session: AsyncSession, user_ids: list[str]) -> tuple[list[dict], list[dict]]:
+        """
+        Sums the diet totals of users per day and per week.
+
+        The days are grouped in Python, since truncating timestamps to dates differs between databases.
+        """
+        totals = [getattr(DietModel, f"total_{nutrient}") for nutrient in NUTRIENTS]
+        query = select(DietModel.user_id, DietModel.date, *totals).where(DietModel.user_id.in_(user_ids))
+
+        days: dict[tuple[str, date], list[float]] = defaultdict(lambda: [0.0] * len(NUTRIENTS))
+        weeks: dict[tuple[str, date], list[float]] = defaultdict(lambda: [0.0] * len(NUTRIENTS))
+
+        for user_id, diet_date, *values in (await session.execute(query)).all():
+            day = diet_date.date()
+
+            for sums in (days[user_id, day], weeks[user_id, week_start(day)]):
+                for index, value in enumerate(values):
+                    sums[index] += float(value)
+
+        daily = [
+            {"user_id": user_id, "day": day, **dict(zip(NUTRIENTS, sums))}
+            for (user_id, day), sums in days.items()
+        ]
+        weekly = [
+            {"user_id": user_id, "week_start": day, **dict(zip(NUTRIENTS, sums))}
+            for (user_id, day), sums in weeks.items()
+        ]
+        return daily, weekly
+
+    def map_row_to_daily(self, row: Row) -> DailyNutrientsResponse:
+        return DailyNutrientsResponse.model_validate(row._mapping)
+
+    def map_row_to_weekly(self, row: Row) -> WeeklyNutrientsResponse:
+        return WeeklyNutrientsResponse.model_validate(row._mapping)
@@ -0,0 +1,80 @@
+from datetime import datetime
+
+from sqlalchemy import Float, func, select, type_coerce
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import NutritionalDataModel, UserModel
+
+
+class NutritionalDataRepository:
+    """
+    NutritionalDataRepository reads the nutritional evaluations of the users.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def get_latest_profile(self, user_id: str) -> Row | None:
+        """
+        Retrieves the latest evaluation of a user with the user's gender and birth date, with one
+        (user_id, evaluation_date) index lookup.
+
+        Args:
+            user_id (str): The ID of the user.
+
+        Returns:
+            Row | None: The weight, height, goal, allergies, monthly_budget, gender and birth_date,
+                or None if the user has no evaluation.
+        """
+        query = (
+            select(
+                type_coerce(NutritionalDataModel.weight, Float).label("weight"),
+                type_coerce(NutritionalDataModel.height, Float).label("height"),
+                NutritionalDataModel.goal,
+                NutritionalDataModel.allergies,
+                type_coerce(NutritionalDataModel.monthly_budget, Float).label("monthly_budget"),
+                UserModel.gender,
+                UserModel.birth_date,
+            )
+            .join(UserModel, UserModel.id == NutritionalDataModel.user_id)
+            .where(NutritionalDataModel.user_id == user_id)
+            .order_by(NutritionalDataModel.evaluation_date.desc())
+            .limit(1)
+        )
+        result = await self.db.execute(query)
+        return result.first()
+
+    async def get_measurements(self, user_id: str, start: datetime, end: datetime) -> list[Row]:
+        """
+        Retrieves the weight and height of the evaluations of a user in a period, along with the
+        latest evaluation before it, which still applies at its start. Both are read with
+        (user_id, evaluation_date) index lookups.
+
+        Args:
+            user_id (str): The ID of the user.
+            start (datetime): The start of the period, inclusive.
+            end (datetime): The end of the period, exclusive.
+
+        Returns:
+            list[Row]: The evaluation_date, weight and height of each evaluation, ordered by date.
+        """
+        previous = (
+            select(func.max(NutritionalDataModel.evaluation_date))
+            .where(NutritionalDataModel.user_id == user_id, NutritionalDataModel.evaluation_date < start)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                NutritionalDataModel.evaluation_date,
+                type_coerce(NutritionalDataModel.weight, Float).label("weight"),
+                type_coerce(NutritionalDataModel.height, Float).label("height"),
+            )
+            .where(
+                NutritionalDataModel.user_id == user_id,
+                NutritionalDataModel.evaluation_date >= func.coalesce(previous, start),
+                NutritionalDataModel.evaluation_date < end,
+            )
+            .order_by(NutritionalDataModel.evaluation_date)
+        )
+        result = await self.db.execute(query)
+        return list(result.all())
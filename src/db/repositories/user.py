@@ -1,57 +1,101 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import AsyncIterator
+
 from fastapi import HTTPException
-from sqlalchemy import delete, select
+from sqlalchemy import TIMESTAMP, Select, bindparam, delete, insert, literal, select, tuple_, update
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core import messages
+from src.db.db import db, user_cache
 from src.db.models import UserModel
 from src.schemas import UserCreate, UserResponse
 
+
+# SQLite stores the CURRENT_TIMESTAMP server default without microseconds, so keyset
+# comparisons must bind created_at in the same text format to compare correctly.
+CREATED_AT_KEY = TIMESTAMP().with_variant(sqlite.DATETIME(truncate_microseconds=True), "sqlite")
+
+# Columns needed to build a UserResponse, so reads never load the password hash unless asked to.
+USER_RESPONSE_COLUMNS = tuple(getattr(UserModel, name) for name in UserResponse.model_fields)
+
+
+@lru_cache(maxsize=64)
+def user_row_query(columns: tuple, key: str) -> Select:
+    """
+    Builds, once per projection, a SELECT of the given columns filtered by a bound user key.
+
+    Reusing the statement object lets SQLAlchemy skip rebuilding it and its cache key on every request.
+
+    Args:
+        columns (tuple): The UserModel columns to select.
+        key (str): The UserModel column to filter by, bound as a parameter of the same name.
+
+    Returns:
+        Select: The reusable statement.
+    """
+    return select(*columns).where(getattr(UserModel, key) == bindparam(key))
+
+
+# Hot read statements executed once at startup, so their compiled form is cached before the first request.
+WARM_UP_QUERIES = [
+    (user_row_query(USER_RESPONSE_COLUMNS, "id"), {"id": ""}),
+    (user_row_query(USER_RESPONSE_COLUMNS + (UserModel.password,), "email"), {"email": ""}),
+]
+
+
 class UserRepository:
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    async def add_user(self, model: UserModel) -> UserModel:
+    async def add_user(self, model: UserModel) -> Row:
         """
-        Adds a new user to the database.
+        Adds a new user to the database with a single INSERT ... RETURNING statement.
+
+        Duplicated emails are detected by the users.email unique constraint instead of a previous lookup.
 
         Args:
             model (UserModel): The user model to be added.
 
         Returns:
-            UserModel: The added user model.
+            Row: The USER_RESPONSE_COLUMNS of the added user, including generated and server default values.
+
+        Raises:
+            HTTPException: If the email is already registered (409).
         """
+        values = model.to_dict(exclude_none=True)
+        stmt = insert(UserModel).values(**values).returning(*USER_RESPONSE_COLUMNS)
 
-        stmt = select(UserModel).where(UserModel.email == model.email)
-        result = await self.db.execute(stmt)
-        existing_user = result.unique().scalars().first()
+        async def insert_user(session: AsyncSession) -> Row:
+            try:
+                result = await session.execute(stmt)
+            except IntegrityError:
+                raise HTTPException(
+                    status_code=409,
+                    detail=messages.USER_EMAIL_ALREADY_EXISTS
+                )
 
-        if existing_user:
-            raise HTTPException(
-                status_code=409,
-                detail=messages.USER_EMAIL_ALREADY_EXISTS
-            )
+            return result.one()
 
-        self.db.add(model)
-        await self.db.commit()
-        await self.db.refresh(model)
-        return model
+        return await db.run_write(insert_user, self.db)
     
     async def get_user(
         self,
         user_id: str | None = None,
-        email: str | None = None,
-        all_results: bool = False
-    ) -> list[UserModel] | UserModel | None:
+        email: str | None = None
+    ) -> UserModel | None:
         """
         Retrieves a user from the database by ID or email.
 
         Args:
             user_id (str | None): The ID of the user to retrieve.
             email (str | None): The email of the user to retrieve.
-            all_results (bool): If True, returns all matching users; otherwise, returns a single user.
 
         Returns:
-            list[UserModel] | UserModel | None: The retrieved user(s) or None if not found.
+            UserModel | None: The retrieved user or None if not found.
         """
         query = select(UserModel)
         
@@ -62,29 +106,197 @@ class UserRepository:
         
         result = await self.db.execute(query)
         
-        if all_results:
-            return result.unique().scalars().all()
-        
-        return result.unique().scalars().first()
+        return result.scalars().first()
+
+    async def get_user_row(
+        self,
+        *columns,
+        user_id: str | None = None,
+        email: str | None = None
+    ) -> Row | None:
+        """
+        Retrieves only the given columns of a user, by ID or email, without loading an ORM entity.
+
+        Args:
+            *columns: The UserModel columns to select, e.g. UserModel.id, UserModel.password.
+            user_id (str | None): The ID of the user to retrieve.
+            email (str | None): The email of the user to retrieve.
+
+        Returns:
+            Row | None: The selected columns of the user, or None if not found.
+        """
+        if user_id:
+            query, params = user_row_query(columns, "id"), {"id": user_id}
+        elif email:
+            query, params = user_row_query(columns, "email"), {"email": email}
+        else:
+            return None
+
+        result = await self.db.execute(query, params)
+        return result.first()
+
+    async def get_user_response(
+        self,
+        user_id: str | None = None,
+        email: str | None = None
+    ) -> UserResponse | None:
+        """
+        Retrieves a user by ID or email, selecting only the columns of UserResponse.
+
+        Args:
+            user_id (str | None): The ID of the user to retrieve.
+            email (str | None): The email of the user to retrieve.
+
+        Returns:
+            UserResponse | None: The retrieved user or None if not found.
+        """
+        row = await self.get_user_row(*USER_RESPONSE_COLUMNS, user_id=user_id, email=email)
+        return self.map_row_to_response(row) if row is not None else None
+
+    async def get_user_credentials(self, email: str) -> Row | None:
+        """
+        Retrieves the columns needed to log a user in: the UserResponse columns and the password hash.
+
+        Args:
+            email (str): The email of the user to retrieve.
+
+        Returns:
+            Row | None: The user columns and password, or None if not found.
+        """
+        return await self.get_user_row(*USER_RESPONSE_COLUMNS, UserModel.password, email=email)
     
 
-    async def update(self, model: UserModel) -> UserModel:
+    async def list_users(
+        self,
+        limit: int,
+        after: tuple[datetime, str] | None = None
+    ) -> list[Row]:
+        """
+        Retrieves a page of users ordered by (created_at, id), using keyset pagination.
+
+        Args:
+            limit (int): The maximum number of users to retrieve.
+            after (tuple[datetime, str] | None): The (created_at, id) of the last user of the previous page.
+
+        Returns:
+            list[Row]: The USER_RESPONSE_COLUMNS of the users following the given key.
+        """
+        query = select(*USER_RESPONSE_COLUMNS).order_by(UserModel.created_at, UserModel.id).limit(limit)
+
+        if after is not None:
+            created_at, user_id = after
+            query = query.where(
+                tuple_(UserModel.created_at, UserModel.id)
+                > tuple_(literal(created_at, CREATED_AT_KEY), user_id)
+            )
+
+        result = await self.db.execute(query)
+        return list(result.all())
+
+    async def stream_users(self, batch_size: int) -> AsyncIterator[Row]:
+        """
+        Streams every user ordered by (created_at, id), fetching batch_size rows at a time.
+
+        Args:
+            batch_size (int): The number of rows fetched from the database per round trip.
+
+        Yields:
+            Row: The USER_RESPONSE_COLUMNS of the users, one at a time.
+        """
+        query = (
+            select(*USER_RESPONSE_COLUMNS)
+            .order_by(UserModel.created_at, UserModel.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(query)
+
+        async for partition in result.partitions():
+            for row in partition:
+                yield row
+
+    async def get_existing_emails(self, emails: list[str]) -> set[str]:
+        """
+        Retrieves which of the given emails are already registered, with a single query.
+
+        Args:
+            emails (list[str]): The emails to check.
+
+        Returns:
+            set[str]: The registered emails.
+        """
+        if not emails:
+            return set()
+
+        result = await self.db.execute(select(UserModel.email).where(UserModel.email.in_(emails)))
+        return set(result.scalars().all())
+
+    async def add_users(self, values: list[dict]) -> list[dict]:
+        """
+        Inserts users with one executemany INSERT, falling back to one INSERT per user when an
+        email was registered concurrently.
+
+        Args:
+            values (list[dict]): The column values of each user, including the id and password hash.
+
+        Returns:
+            list[dict]: The values whose email was already registered and were not inserted.
+        """
+        if not values:
+            return []
+
+        async def insert_users(session: AsyncSession) -> None:
+            await session.execute(insert(UserModel), values)
+
+        try:
+            await db.run_write(insert_users, self.db)
+            return []
+        except IntegrityError:
+            await self.db.rollback()
+
+        conflicts = []
+
+        for row in values:
+            async def insert_user(session: AsyncSession, row: dict = row) -> None:
+                await session.execute(insert(UserModel).values(**row))
+
+            try:
+                await db.run_write(insert_user, self.db)
+            except IntegrityError:
+                await self.db.rollback()
+                conflicts.append(row)
+
+        return conflicts
+
+    async def update(self, user_id: str, values: dict) -> Row | None:
         """
-        Updates an existing user in the database.
+        Updates an existing user in the database with a single UPDATE ... RETURNING statement
+        and evicts it from the authenticated user cache.
 
         Args:
-            model (UserModel): The user model with updated data.
+            user_id (str): The ID of the user to update.
+            values (dict): The column names and new values.
 
         Returns:
-            UserModel: The updated user model.
+            Row | None: The USER_RESPONSE_COLUMNS of the updated user, or None if the user does not exist.
         """
-        await self.db.commit()
-        await self.db.refresh(model)
-        return model
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id)
+            .values(**values)
+            .returning(*USER_RESPONSE_COLUMNS)
+        )
+
+        async def update_user(session: AsyncSession) -> Row | None:
+            result = await session.execute(stmt)
+            return result.one_or_none()
+
+        row = await db.run_write(update_user, self.db)
+        await user_cache.delete(user_id)
+        return row
     
     async def delete(self, user_id: str) -> bool:
         """
-        Deletes a user from the database by ID.
+        Deletes a user from the database by ID and evicts it from the authenticated user cache.
 
         Args:
             user_id (str): The ID of the user to delete.
@@ -92,10 +304,14 @@ class UserRepository:
         Returns:
             None
         """
-        query = delete(UserModel).where(UserModel.id == user_id)
-        result = await self.db.execute(query)
-        await self.db.commit()
-        return result.rowcount > 0
+        async def remove(session: AsyncSession) -> int:
+            query = delete(UserModel).where(UserModel.id == user_id)
+            result = await session.execute(query)
+            return result.rowcount
+
+        rowcount = await db.run_write(remove, self.db)
+        await user_cache.delete(user_id)
+        return rowcount > 0
     
 
     def map_request_to_model(self, request: UserCreate) -> UserModel:
@@ -111,6 +327,29 @@ class UserRepository:
         return UserModel(
             **request.to_dict()
         )
+
+    def map_requests_to_models(self, requests: list[UserCreate]) -> list[UserModel]:
+        """
+        Maps a list of UserCreate requests to UserModels, dumping every request in one serializer call.
+
+        Args:
+            requests (list[UserCreate]): The user creation requests.
+
+        Returns:
+            list[UserModel]: The mapped user models, in the same order.
+        """
+        return [UserModel(**values) for values in UserCreate.to_dicts(requests)]
     
-    def map_model_to_response(self, model: UserModel) -> UserResponse:
-        return UserResponse.model_validate(model, from_attributes=True)
\ No newline at end of file
+    def map_row_to_response(self, row: Row) -> UserResponse:
+        """
+        Maps a row holding the USER_RESPONSE_COLUMNS to a UserResponse, without ORM attribute access.
+
+        The values come from the database, which already enforces the schema, so they are not validated again.
+
+        Args:
+            row (Row): The selected columns. Extra columns, like the password, are ignored.
+
+        Returns:
+            UserResponse: The mapped user response.
+        """
+        return UserResponse.model_construct(**row._mapping)
\ No newline at end of file
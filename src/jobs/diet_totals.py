@@ -0,0 +1,66 @@
+"""
+Verifies the diet totals against the sum of their completed meals and optionally rebuilds them.
+
+The totals are maintained incrementally as meals change; this job detects drift left by writes
+that bypassed the API (manual fixes, imports, edited foods) and repairs it in bulk, along with
+the nutrient rollups of the users concerned.
+
+Usage:
+    python -m src.jobs.diet_totals [--fix] [--all] [--tolerance 0.000001]
+
+Exits with status 1 when drifted diets were found and --fix was not given.
+"""
+import argparse
+import asyncio
+import sys
+
+from src.db import db
+from src.db.repositories import DietRepository, NutrientRollupRepository
+from src.db.repositories.nutrient_rollup import NUTRIENTS
+
+
+async def run(args: argparse.Namespace) -> int:
+    try:
+        async for session in db.get_session():
+            repository = DietRepository(session)
+
+            if args.all:
+                print(f"Rebuilt {await repository.rebuild_totals()} diets")
+                print(f"Rebuilt the rollups of {await NutrientRollupRepository(session).rebuild()} users")
+                return 0
+
+            drifted = await repository.find_drifted(tolerance=args.tolerance)
+
+            for row in drifted:
+                differences = ", ".join(
+                    f"{nutrient} {getattr(row, f'total_{nutrient}')} != {getattr(row, nutrient)}"
+                    for nutrient in NUTRIENTS
+                    if abs(getattr(row, f"total_{nutrient}") - getattr(row, nutrient)) > args.tolerance
+                )
+                print(f"Diet {row.id}: {differences}")
+
+            print(f"{len(drifted)} diets with drifted totals")
+
+            if drifted and args.fix:
+                print(f"Rebuilt {await repository.rebuild_totals(row.id for row in drifted)} diets")
+                user_ids = {row.user_id for row in drifted}
+                print(f"Rebuilt the rollups of {await NutrientRollupRepository(session).rebuild(user_ids)} users")
+                return 0
+
+            return 1 if drifted else 0
+
+    finally:
+        await db.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.jobs.diet_totals")
+    parser.add_argument("--fix", action="store_true", help="rebuild the totals of the drifted diets")
+    parser.add_argument("--all", action="store_true", help="rebuild the totals of every diet without checking")
+    parser.add_argument("--tolerance", type=float, default=1e-6, help="largest difference accepted per nutrient")
+
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
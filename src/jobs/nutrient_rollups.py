@@ -0,0 +1,53 @@
+"""
+Catches the daily and weekly nutrient rollups up with the diets.
+
+The rollups are updated with every meal change made through the API. Diets written by other
+means (imports, manual fixes, the diet totals rebuild) are picked up by this job, which rebuilds
+the rollups of every user with diets updated in the last hours. Rebuilding recomputes the rows
+from the diets, so overlapping runs are harmless.
+
+Usage:
+    python -m src.jobs.nutrient_rollups [--hours 24]
+    python -m src.jobs.nutrient_rollups --all
+"""
+import argparse
+import asyncio
+import sys
+from datetime import timedelta
+
+from sqlalchemy import func, select
+
+from src.db import db
+from src.db.repositories import NutrientRollupRepository
+
+
+async def run(args: argparse.Namespace) -> int:
+    try:
+        async for session in db.get_session():
+            repository = NutrientRollupRepository(session)
+
+            if args.all:
+                print(f"Rebuilt the rollups of {await repository.rebuild()} users")
+                return 0
+
+            # The database clock, which set the diets' updated_at.
+            now = (await session.execute(select(func.now()))).scalar_one()
+            user_ids = await repository.get_changed_users(now - timedelta(hours=args.hours))
+
+            print(f"Rebuilt the rollups of {await repository.rebuild(user_ids)} users")
+            return 0
+
+    finally:
+        await db.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.jobs.nutrient_rollups")
+    parser.add_argument("--hours", type=float, default=24, help="rebuild users with diets updated in the last hours")
+    parser.add_argument("--all", action="store_true", help="rebuild the rollups of every user")
+
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
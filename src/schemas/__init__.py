@@ -1,15 +1,65 @@
+from .catalog import (
+    CatalogFoodResponse,
+    ConsumptionCreate,
+    ConsumptionResponse,
+    ConsumptionTotalsResponse
+)
+from .diet import (
+    DietCreate,
+    DietResponse,
+    DietSummaryResponse,
+    EnergyDistributionResponse,
+    MealBreakdownResponse,
+    MealCreate,
+    MealResponse,
+    MealUpdate,
+    NutrientTotalsResponse
+)
+from .diet_plan import DietPlanItemResponse, DietPlanResponse
+from .food import FoodSearchResponse
+from .health import (
+    CacheStatsResponse,
+    DatabasePoolStatsResponse,
+    QueryStatsResponse,
+    StartupStatsResponse
+)
 from .message import MessageResponse
+from .nutrition import DailyNutrientsResponse, WeeklyNutrientsResponse
 from .user import (
     TokenData,
     TokenResponse,
     UserCreate,
     UserLogin,
+    UserPage,
     UserResponse
 )
 
 __all__ = [
+    "CatalogFoodResponse",
+    "ConsumptionCreate",
+    "ConsumptionResponse",
+    "ConsumptionTotalsResponse",
+    "DietCreate",
+    "DietResponse",
+    "DietSummaryResponse",
+    "DietPlanItemResponse",
+    "DietPlanResponse",
+    "EnergyDistributionResponse",
+    "MealBreakdownResponse",
+    "MealCreate",
+    "MealResponse",
+    "MealUpdate",
+    "NutrientTotalsResponse",
+    "FoodSearchResponse",
+    "CacheStatsResponse",
+    "DatabasePoolStatsResponse",
+    "QueryStatsResponse",
+    "StartupStatsResponse",
     "MessageResponse",
+    "DailyNutrientsResponse",
+    "WeeklyNutrientsResponse",
     "UserCreate",
     "UserLogin",
+    "UserPage",
     "UserResponse",
 ]
\ No newline at end of file
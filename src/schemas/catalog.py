@@ -0,0 +1,80 @@
+from datetime import date, datetime
+from pydantic import Field
+
+from src.core import BaseSchema
+
+
+class CatalogFoodResponse(BaseSchema):
+    """
+    CatalogFoodResponse is a schema for returning a food of the reference catalog.
+
+    Attributes:
+        id (str): The unique identifier of the food.
+        name (str): The name of the food.
+        calories (float): The calories per 100 g.
+        proteins (float): The proteins per 100 g.
+        fats (float): The fats per 100 g.
+        carbohydrates (float): The carbohydrates per 100 g.
+    """
+
+    id: str
+    name: str
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
+
+
+class ConsumptionCreate(BaseSchema):
+    """
+    ConsumptionCreate is a Pydantic model that represents a quantity of a catalog food eaten by the user.
+
+    Attributes:
+        catalog_food_id (str): The ID of the catalog food.
+        grams (float): The quantity eaten, in grams.
+        consumed_at (datetime): When the food was eaten.
+    """
+    catalog_food_id: str
+    grams: float = Field(gt=0, le=100000, description="Quantity eaten, in grams", examples=[150])
+    consumed_at: datetime = Field(description="When the food was eaten", examples=["2025-01-01T12:30:00"])
+
+
+class ConsumptionResponse(BaseSchema):
+    """
+    ConsumptionResponse is a Pydantic model that represents a logged consumption.
+
+    Attributes:
+        id (str): The unique identifier of the entry.
+        catalog_food_id (str): The ID of the catalog food.
+        grams (float): The quantity eaten, in grams.
+        consumed_at (datetime): When the food was eaten.
+        created_at (datetime): Timestamp when the entry was created.
+    """
+    id: str
+    catalog_food_id: str
+    grams: float
+    consumed_at: datetime
+    created_at: datetime
+
+
+class ConsumptionTotalsResponse(BaseSchema):
+    """
+    ConsumptionTotalsResponse is a schema for returning the nutrients a user logged in a date range.
+
+    Attributes:
+        start (date): The first day, inclusive.
+        end (date): The last day, inclusive.
+        entries (int): The number of consumption entries in the range.
+        calories (float): The total calories.
+        proteins (float): The total proteins.
+        fats (float): The total fats.
+        carbohydrates (float): The total carbohydrates.
+    """
+
+    start: date
+    end: date
+    entries: int
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
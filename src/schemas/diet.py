@@ -0,0 +1,174 @@
+from datetime import datetime
+from pydantic import Field
+
+from src.core import BaseSchema
+
+
+class DietCreate(BaseSchema):
+    """
+    DietCreate is a Pydantic model that represents the data required to create a diet.
+
+    The nutrient totals are not part of the request: they start at zero and follow the completed meals.
+
+    Attributes:
+        date (datetime): The date of the diet.
+        total_water (float): The water consumed, in liters.
+        duration (int): The duration of the diet in minutes.
+    """
+    date: datetime = Field(
+        description="Date of the diet",
+        examples=["2025-01-01T00:00:00"]
+    )
+    total_water: float = Field(0, ge=0, description="Water consumed, in liters")
+    duration: int = Field(0, ge=0, description="Duration of the diet in minutes")
+
+
+class DietResponse(BaseSchema):
+    """
+    DietResponse is a Pydantic model that represents the response data for a diet.
+
+    Attributes:
+        id (str): The unique identifier of the diet.
+        user_id (str): The ID of the user the diet belongs to.
+        date (datetime): The date of the diet.
+        total_calories (float): The calories of the completed meals.
+        total_proteins (float): The proteins of the completed meals.
+        total_fats (float): The fats of the completed meals.
+        total_carbohydrates (float): The carbohydrates of the completed meals.
+        total_water (float): The water consumed, in liters.
+        duration (int): The duration of the diet in minutes.
+        created_at (datetime): Timestamp when the diet record was created.
+        updated_at (datetime): Timestamp when the diet record was last updated.
+    """
+    id: str
+    user_id: str
+    date: datetime
+    total_calories: float
+    total_proteins: float
+    total_fats: float
+    total_carbohydrates: float
+    total_water: float
+    duration: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class MealCreate(BaseSchema):
+    """
+    MealCreate is a Pydantic model that represents the data required to add a meal to a diet.
+
+    Attributes:
+        food_id (str): The ID of the food eaten in the meal.
+        type (str): The type of meal (e.g., 'breakfast', 'lunch', 'dinner').
+        is_completed (bool): Indicates if the meal has already been eaten.
+        description (str | None): A description of the meal.
+    """
+    food_id: str
+    type: str = Field(examples=["lunch"])
+    is_completed: bool = False
+    description: str | None = None
+
+
+class MealUpdate(BaseSchema):
+    """
+    MealUpdate is a Pydantic model that represents the completion state of a meal.
+
+    Attributes:
+        is_completed (bool): Indicates if the meal has been eaten.
+    """
+    is_completed: bool
+
+
+class MealResponse(BaseSchema):
+    """
+    MealResponse is a Pydantic model that represents the response data for a meal.
+
+    Attributes:
+        id (str): The unique identifier of the meal.
+        food_id (str): The ID of the food eaten in the meal.
+        diet_id (str): The ID of the diet the meal belongs to.
+        type (str): The type of meal.
+        is_completed (bool): Indicates if the meal has been eaten.
+        description (str | None): A description of the meal.
+        created_at (datetime): Timestamp when the meal record was created.
+        updated_at (datetime): Timestamp when the meal record was last updated.
+    """
+    id: str
+    food_id: str
+    diet_id: str
+    type: str
+    is_completed: bool
+    description: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class NutrientTotalsResponse(BaseSchema):
+    """
+    NutrientTotalsResponse is a Pydantic model that represents the nutrient totals of a set of meals.
+
+    Attributes:
+        calories (float): The calories of the meals.
+        proteins (float): The proteins of the meals.
+        fats (float): The fats of the meals.
+        carbohydrates (float): The carbohydrates of the meals.
+    """
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
+
+
+class EnergyDistributionResponse(BaseSchema):
+    """
+    EnergyDistributionResponse is a Pydantic model that represents the share of the energy of each macronutrient.
+
+    Attributes:
+        proteins (float): The percentage of the energy from proteins (4 kcal/g).
+        fats (float): The percentage of the energy from fats (9 kcal/g).
+        carbohydrates (float): The percentage of the energy from carbohydrates (4 kcal/g).
+    """
+    proteins: float
+    fats: float
+    carbohydrates: float
+
+
+class MealBreakdownResponse(BaseSchema):
+    """
+    MealBreakdownResponse is a Pydantic model that represents the nutrients of the meals of one type of a diet.
+
+    Attributes:
+        type (str): The type of meal.
+        meals (int): The number of meals of the type.
+        completed_meals (int): The number of meals of the type already eaten.
+        planned (NutrientTotalsResponse): The totals of every meal of the type.
+        completed (NutrientTotalsResponse): The totals of the completed meals of the type.
+    """
+    type: str
+    meals: int
+    completed_meals: int
+    planned: NutrientTotalsResponse
+    completed: NutrientTotalsResponse
+
+
+class DietSummaryResponse(BaseSchema):
+    """
+    DietSummaryResponse is a Pydantic model that represents the planned and eaten nutrients of a diet.
+
+    Attributes:
+        id (str): The unique identifier of the diet.
+        date (datetime): The date of the diet.
+        planned (NutrientTotalsResponse): The totals of every meal of the diet.
+        completed (NutrientTotalsResponse): The totals of the completed meals of the diet.
+        energy_distribution (EnergyDistributionResponse): The energy shares of the planned meals.
+        meals (list[MealBreakdownResponse]): The breakdown per type of meal, in order of first meal.
+        body_mass_index (float | None): The body mass index of the latest nutritional evaluation up to
+            the date of the diet, or None if there is none.
+    """
+    id: str
+    date: datetime
+    planned: NutrientTotalsResponse
+    completed: NutrientTotalsResponse
+    energy_distribution: EnergyDistributionResponse
+    meals: list[MealBreakdownResponse]
+    body_mass_index: float | None = None
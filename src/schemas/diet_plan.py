@@ -0,0 +1,52 @@
+from src.core import BaseSchema
+from src.schemas.diet import NutrientTotalsResponse
+
+
+class DietPlanItemResponse(BaseSchema):
+    """
+    DietPlanItemResponse is a Pydantic model that represents a food of a diet plan.
+
+    Attributes:
+        food_id (str): The ID of the food.
+        name (str): The name of the food.
+        portions (int): The number of portions of the food, a portion being its stored quantity.
+        quantity (float): The total quantity of the food.
+        calories (float): The calories of the portions.
+        proteins (float): The proteins of the portions.
+        fats (float): The fats of the portions.
+        carbohydrates (float): The carbohydrates of the portions.
+        price (float | None): The price of the portions, when the food has a price.
+    """
+    food_id: str
+    name: str
+    portions: int
+    quantity: float
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
+    price: float | None = None
+
+
+class DietPlanResponse(BaseSchema):
+    """
+    DietPlanResponse is a Pydantic model that represents a generated daily diet plan.
+
+    Attributes:
+        goal (str): The DietGoal the targets were computed for.
+        targets (NutrientTotalsResponse): The daily nutrient targets.
+        totals (NutrientTotalsResponse): The nutrients of the plan.
+        daily_budget (float | None): The daily share of the monthly budget, when the user has one.
+        cost (float | None): The price of the plan, when the user has a budget.
+        exclusions (list[str]): The normalized allergies and exclusions no food of the plan contains.
+        solver (str): "milp" for the integer program, "greedy" for the fallback heuristic.
+        items (list[DietPlanItemResponse]): The foods of the plan.
+    """
+    goal: str
+    targets: NutrientTotalsResponse
+    totals: NutrientTotalsResponse
+    daily_budget: float | None = None
+    cost: float | None = None
+    exclusions: list[str]
+    solver: str
+    items: list[DietPlanItemResponse]
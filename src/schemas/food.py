@@ -0,0 +1,24 @@
+from src.core import BaseSchema
+
+
+class FoodSearchResponse(BaseSchema):
+    """
+    FoodSearchResponse is a schema for returning a food found by the food search.
+
+    Attributes:
+        id (str): The unique identifier of the food.
+        name (str): The name of the food.
+        quantity (float): The quantity the nutrients refer to.
+        calories (float): The calories of the quantity.
+        proteins (float): The proteins of the quantity.
+        fats (float): The fats of the quantity.
+        carbohydrates (float): The carbohydrates of the quantity.
+    """
+
+    id: str
+    name: str
+    quantity: float
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
@@ -0,0 +1,73 @@
+from src.core import BaseSchema
+
+
+class CacheStatsResponse(BaseSchema):
+    """
+    CacheStatsResponse is a schema for returning the counters of an in-process cache.
+
+    Attributes:
+        hits (int): The number of lookups that found a value.
+        misses (int): The number of lookups that did not find a value.
+        hit_ratio (float): The fraction of lookups that found a value.
+        size (int): The number of keys currently cached.
+    """
+
+    hits: int
+    misses: int
+    hit_ratio: float
+    size: int
+
+
+class DatabasePoolStatsResponse(BaseSchema):
+    """
+    DatabasePoolStatsResponse is a schema for returning the database connection pool statistics.
+
+    Attributes:
+        pool_class (str): The name of the SQLAlchemy pool class in use.
+        size (int): The number of connections kept open in the pool.
+        checked_in (int): The number of idle connections in the pool.
+        checked_out (int): The number of connections currently in use.
+        overflow (int): The number of connections opened above the pool size.
+        wait_count (int): The number of connection checkouts.
+        wait_time_total (float): The total seconds spent waiting for connections.
+        wait_time_max (float): The longest wait for a connection, in seconds.
+    """
+
+    pool_class: str
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    wait_count: int
+    wait_time_total: float
+    wait_time_max: float
+
+
+class StartupStatsResponse(BaseSchema):
+    """
+    StartupStatsResponse is a schema for returning how long the application startup took.
+
+    Attributes:
+        phases (dict[str, float]): The duration of each startup phase, in seconds.
+        total (float): The total startup duration, in seconds.
+    """
+
+    phases: dict[str, float]
+    total: float
+
+
+class QueryStatsResponse(BaseSchema):
+    """
+    QueryStatsResponse is a schema for returning the statistics of one SQL statement fingerprint.
+
+    Attributes:
+        fingerprint (str): The statement with its literals and parameter lists normalized.
+        count (int): The number of executions.
+        total (float): The total duration of the executions, in seconds.
+        max (float): The longest execution, in seconds.
+    """
+
+    fingerprint: str
+    count: int
+    total: float
+    max: float
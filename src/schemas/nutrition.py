@@ -0,0 +1,41 @@
+from datetime import date
+
+from src.core import BaseSchema
+
+
+class DailyNutrientsResponse(BaseSchema):
+    """
+    DailyNutrientsResponse is a schema for returning the nutrients a user consumed in a day.
+
+    Attributes:
+        day (date): The day.
+        calories (float): The calories of the completed meals of the day.
+        proteins (float): The proteins of the completed meals of the day.
+        fats (float): The fats of the completed meals of the day.
+        carbohydrates (float): The carbohydrates of the completed meals of the day.
+    """
+
+    day: date
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
+
+
+class WeeklyNutrientsResponse(BaseSchema):
+    """
+    WeeklyNutrientsResponse is a schema for returning the nutrients a user consumed in a week.
+
+    Attributes:
+        week_start (date): The Monday of the week.
+        calories (float): The calories of the completed meals of the week.
+        proteins (float): The proteins of the completed meals of the week.
+        fats (float): The fats of the completed meals of the week.
+        carbohydrates (float): The carbohydrates of the completed meals of the week.
+    """
+
+    week_start: date
+    calories: float
+    proteins: float
+    fats: float
+    carbohydrates: float
@@ -117,3 +117,15 @@ class TokenResponse(BaseSchema):
     access_token: str
     token_type: str = "bearer"
     user: UserResponse
+
+
+class UserPage(BaseSchema):
+    """
+    UserPage is a Pydantic model that represents a page of users.
+
+    Attributes:
+        items (list[UserResponse]): The users of the page.
+        next_cursor (str | None): The cursor of the next page, or None if this is the last page.
+    """
+    items: list[UserResponse]
+    next_cursor: str | None = None
@@ -0,0 +1,69 @@
+import importlib.util
+import os
+
+import uvicorn
+
+from src.core import settings
+
+
+def worker_count() -> int:
+    """
+    Returns the number of server worker processes to start.
+
+    Returns:
+        int: settings.SERVER_WORKERS, or the number of CPUs available to this process when it is zero.
+    """
+    return settings.SERVER_WORKERS or os.process_cpu_count() or 1
+
+
+def event_loop() -> str:
+    """
+    Returns the event loop implementation, uvloop when it is installed.
+
+    Returns:
+        str: The uvicorn loop setting.
+    """
+    if settings.SERVER_LOOP != "auto":
+        return settings.SERVER_LOOP
+
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def http_parser() -> str:
+    """
+    Returns the HTTP parser implementation, httptools when it is installed.
+
+    Returns:
+        str: The uvicorn http setting.
+    """
+    if settings.SERVER_HTTP != "auto":
+        return settings.SERVER_HTTP
+
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def run() -> None:
+    """
+    Starts the API server.
+
+    The application is passed as an import string and never imported by this process, so every
+    worker builds its own settings, database engine and connection pool after being spawned.
+
+    Returns:
+        None
+    """
+    workers = worker_count()
+
+    uvicorn.run(
+        "src.api:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        loop=event_loop(),
+        http=http_parser(),
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE,
+        backlog=settings.SERVER_BACKLOG,
+        # Without a supervisor a single worker would exit for good instead of being recycled.
+        limit_max_requests=(settings.SERVER_MAX_REQUESTS or None) if workers > 1 else None,
+        log_level="info",
+    )
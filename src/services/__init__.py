@@ -1,6 +1,19 @@
+from .consumption import ConsumptionService
+from .diet import DietService
+from .diet_plan import DietPlanService
+from .food_search import FoodSearchService
+from .nutrition import NutritionService
 from .user import UserService
+from .user_import import IMPORT_FORMATS, UserImportService
 
 
 __all__ = [
+    "ConsumptionService",
+    "DietService",
+    "DietPlanService",
+    "FoodSearchService",
+    "IMPORT_FORMATS",
+    "NutritionService",
+    "UserImportService",
     "UserService"
 ]
\ No newline at end of file
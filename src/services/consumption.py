@@ -0,0 +1,134 @@
+from datetime import date, datetime, time, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import messages
+from src.core.catalog import FoodCatalog
+from src.db import food_catalog
+from src.db.repositories import CatalogRepository
+from src.schemas import (
+    CatalogFoodResponse,
+    ConsumptionCreate,
+    ConsumptionResponse,
+    ConsumptionTotalsResponse
+)
+from src.services.nutrition import resolve_range
+
+
+class ConsumptionService:
+    """
+    ConsumptionService serves the reference food catalog and the consumption log of a user.
+
+    Catalog reads and nutrient totals use the in-memory snapshot loaded at startup. A food missing
+    from the snapshot but present in the database (added after startup) reloads the snapshot; a
+    food missing from both (removed from the catalog) does not.
+
+    The catalog backs the consumption log only. Diets, meals and diet plans still read the per
+    portion nutrients of FoodModel; docs/catalogo-de-alimentos.md describes how meals move to the
+    catalog.
+
+    Methods:
+        get_catalog_food: Retrieves a food of the catalog.
+        add_consumption: Logs a quantity of a catalog food eaten by the user.
+        get_totals: Sums the nutrients the user logged in a date range.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.repository = CatalogRepository(db)
+
+    async def get_catalog_food(self, food_id: str) -> CatalogFoodResponse:
+        """
+        Retrieves a food of the catalog, without querying the database.
+
+        Args:
+            food_id (str): The ID of the food.
+
+        Returns:
+            CatalogFoodResponse: The food and its nutrients per 100 g.
+
+        Raises:
+            HTTPException: If the food is not in the catalog (404).
+        """
+        catalog = await self._catalog_with(food_id)
+        return CatalogFoodResponse.model_construct(**catalog.get(food_id)._asdict())
+
+    async def add_consumption(self, user_id: str, request: ConsumptionCreate) -> ConsumptionResponse:
+        """
+        Logs a quantity of a catalog food eaten by the user.
+
+        Args:
+            user_id (str): The ID of the user.
+            request (ConsumptionCreate): The consumption entry.
+
+        Returns:
+            ConsumptionResponse: The logged entry.
+
+        Raises:
+            HTTPException: If the food is not in the catalog (404).
+        """
+        await self._catalog_with(request.catalog_food_id)
+        row = await self.repository.add_consumption(user_id, request)
+        return self.repository.map_row_to_consumption(row)
+
+    async def get_totals(
+        self,
+        user_id: str,
+        start: date | None = None,
+        end: date | None = None
+    ) -> ConsumptionTotalsResponse:
+        """
+        Sums the nutrients the user logged in a date range, multiplying the logged quantities
+        against the per 100 g vectors of the catalog.
+
+        Args:
+            user_id (str): The ID of the user.
+            start (date | None): The first day, defaults to settings.NUTRIENT_ROLLUP_DEFAULT_DAYS before the end.
+            end (date | None): The last day, defaults to today.
+
+        Returns:
+            ConsumptionTotalsResponse: The number of entries and the nutrient totals, leaving out entries of
+                foods no longer in the catalog.
+        """
+        start, end = resolve_range(start, end)
+        food_ids, grams = await self.repository.get_consumed_quantities(
+            user_id,
+            datetime.combine(start, time.min),
+            datetime.combine(end + timedelta(days=1), time.min)
+        )
+
+        catalog = food_catalog.catalog
+        missing = {food_id for food_id in food_ids if food_id not in catalog}
+
+        if missing:
+            # Only foods added since the snapshot was loaded reload it; removed foods do not.
+            for food_id in missing:
+                if await self.repository.catalog_food_exists(food_id):
+                    catalog = await self._reload()
+                    break
+
+            # Entries of foods removed from the catalog since they were logged are left out.
+            entries = [(food_id, quantity) for food_id, quantity in zip(food_ids, grams) if food_id in catalog]
+            food_ids, grams = [food_id for food_id, _ in entries], [quantity for _, quantity in entries]
+
+        totals = catalog.totals(food_ids, grams)
+
+        return ConsumptionTotalsResponse(start=start, end=end, entries=len(food_ids), **totals)
+
+    async def _catalog_with(self, food_id: str) -> FoodCatalog:
+        catalog = food_catalog.catalog
+
+        if food_id in catalog:
+            return catalog
+
+        if await self.repository.catalog_food_exists(food_id):
+            return await self._reload()
+
+        raise HTTPException(
+            status_code=404,
+            detail=messages.FOOD_NOT_FOUND
+        )
+
+    async def _reload(self) -> FoodCatalog:
+        catalog = await self.repository.load_catalog()
+        food_catalog.replace(catalog)
+        return catalog
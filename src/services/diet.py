@@ -0,0 +1,283 @@
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import messages
+from src.core.nutrition import ENERGY_NUTRIENTS, NutritionEngine, nutrition_engine
+from src.db.repositories import DietRepository, NutritionalDataRepository
+from src.db.repositories.nutrient_rollup import NUTRIENTS
+from src.schemas import (
+    DietCreate,
+    DietResponse,
+    DietSummaryResponse,
+    MealCreate,
+    MealResponse,
+    MessageResponse
+)
+from src.services.nutrition import resolve_range
+
+
+def summarize_diets(
+    diets: list[Row],
+    meals: list[Row],
+    measurements: list[Row] | None = None,
+    engine: NutritionEngine = nutrition_engine
+) -> list[DietSummaryResponse]:
+    """
+    Computes the planned and completed totals, the energy distribution, the breakdown per type
+    of meal and the body mass index of many diets at once.
+
+    The meals of every diet form one batch: each total is a single grouped sum over it, by diet
+    or by diet and type of meal, with a leading column of ones counting the meals. The body mass
+    index of every evaluation is computed in one call, and each diet takes the one of the latest
+    evaluation up to its date.
+
+    Args:
+        diets (list[Row]): The id and date of each diet.
+        meals (list[Row]): The diet_id, type, is_completed and nutrients of each meal of the diets.
+        measurements (list[Row] | None): The evaluation_date, weight and height of the evaluations of
+            the user, ordered by date.
+        engine (NutritionEngine): The engine computing the sums.
+
+    Returns:
+        list[DietSummaryResponse]: The summary of each diet, in the order of the diets.
+    """
+    positions = {diet.id: position for position, diet in enumerate(diets)}
+    breakdowns: dict[tuple[int, str], int] = {}
+
+    diet_groups = [positions[meal.diet_id] for meal in meals]
+    meal_groups = [breakdowns.setdefault((positions[meal.diet_id], meal.type), len(breakdowns)) for meal in meals]
+
+    _, _, completed, *nutrients = list(zip(*meals)) or [()] * (3 + len(NUTRIENTS))
+    columns = [[1.0] * len(meals), *nutrients]
+    factors = [1.0 if is_completed else 0.0 for is_completed in completed]
+
+    diets_planned = engine.group_totals(diet_groups, columns, len(diets))
+    diets_completed = engine.group_totals(diet_groups, columns, len(diets), factors)
+    meals_planned = engine.group_totals(meal_groups, columns, len(breakdowns))
+    meals_completed = engine.group_totals(meal_groups, columns, len(breakdowns), factors)
+    distribution = engine.energy_distribution(*(
+        [totals[1 + NUTRIENTS.index(nutrient)] for totals in diets_planned] for nutrient in ENERGY_NUTRIENTS
+    ))
+
+    measurements = measurements or []
+    evaluation_dates = [measurement.evaluation_date.date() for measurement in measurements]
+    indexes = engine.body_mass_index(
+        [measurement.weight for measurement in measurements],
+        [measurement.height for measurement in measurements]
+    )
+
+    def latest_index(diet: Row) -> float | None:
+        position = bisect_right(evaluation_dates, diet.date.date())
+        return indexes[position - 1] if position else None
+
+    def to_totals(totals: list[float]) -> dict:
+        return dict(zip(NUTRIENTS, totals[1:]))
+
+    diet_meals: list[list[dict]] = [[] for _ in diets]
+
+    for (position, meal_type), group in breakdowns.items():
+        diet_meals[position].append({
+            "type": meal_type,
+            "meals": int(meals_planned[group][0]),
+            "completed_meals": int(meals_completed[group][0]),
+            "planned": to_totals(meals_planned[group]),
+            "completed": to_totals(meals_completed[group]),
+        })
+
+    return DietSummaryResponse.from_dicts([
+        {
+            "id": diet.id,
+            "date": diet.date,
+            "planned": to_totals(diets_planned[position]),
+            "completed": to_totals(diets_completed[position]),
+            "energy_distribution": dict(zip(ENERGY_NUTRIENTS, distribution[position])),
+            "meals": diet_meals[position],
+            "body_mass_index": latest_index(diet),
+        }
+        for position, diet in enumerate(diets)
+    ])
+
+class DietService:
+    """
+    DietService is responsible for handling the diets of a user and their meals.
+
+    The diet totals only count completed meals and are updated by the repository with every meal change.
+
+    Methods:
+        add_diet: Adds a new diet.
+        get_diet: Retrieves a diet of the user.
+        get_summary: Summarizes the planned and eaten nutrients of a diet of the user.
+        get_summaries: Summarizes the diets of the user in a date range.
+        add_meal: Adds a meal to a diet of the user.
+        set_meal_completed: Marks a meal as completed or not.
+        delete_meal: Deletes a meal.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.repository = DietRepository(db)
+        self.nutritional_data_repository = NutritionalDataRepository(db)
+
+    async def add_diet(self, user_id: str, request: DietCreate) -> DietResponse:
+        """
+        Adds a new diet.
+
+        Args:
+            user_id (str): The ID of the user the diet belongs to.
+            request (DietCreate): The diet creation request data.
+
+        Returns:
+            DietResponse: The created diet response.
+        """
+        row = await self.repository.add_diet(user_id, request)
+        return self.repository.map_row_to_diet(row)
+
+    async def get_diet(self, user_id: str, diet_id: str) -> DietResponse:
+        """
+        Retrieves a diet of the user.
+
+        Args:
+            user_id (str): The ID of the user.
+            diet_id (str): The ID of the diet.
+
+        Returns:
+            DietResponse: The diet response, with the totals of its completed meals.
+
+        Raises:
+            HTTPException: If the user has no such diet (404).
+        """
+        row = await self.repository.get_diet_row(diet_id, user_id)
+
+        if row is None:
+            raise HTTPException(
+                status_code=404,
+                detail=messages.DIET_NOT_FOUND
+            )
+
+        return self.repository.map_row_to_diet(row)
+
+    async def get_summary(self, user_id: str, diet_id: str) -> DietSummaryResponse:
+        """
+        Summarizes the planned and eaten nutrients of a diet of the user.
+
+        Args:
+            user_id (str): The ID of the user.
+            diet_id (str): The ID of the diet.
+
+        Returns:
+            DietSummaryResponse: The summary of the diet.
+
+        Raises:
+            HTTPException: If the user has no such diet (404).
+        """
+        diets, meals = await self.repository.get_diets_with_meals(user_id, diet_id=diet_id)
+
+        if not diets:
+            raise HTTPException(
+                status_code=404,
+                detail=messages.DIET_NOT_FOUND
+            )
+
+        return (await self._summarize(user_id, diets, meals))[0]
+
+    async def get_summaries(
+        self,
+        user_id: str,
+        start: date | None = None,
+        end: date | None = None
+    ) -> list[DietSummaryResponse]:
+        """
+        Summarizes the diets of the user in a date range, computed in one batch.
+
+        Args:
+            user_id (str): The ID of the user.
+            start (date | None): The first day, defaults to settings.NUTRIENT_ROLLUP_DEFAULT_DAYS before the end.
+            end (date | None): The last day, defaults to today.
+
+        Returns:
+            list[DietSummaryResponse]: The summary of each diet, ordered by date.
+        """
+        start, end = resolve_range(start, end)
+        diets, meals = await self.repository.get_diets_with_meals(
+            user_id,
+            datetime.combine(start, time.min),
+            datetime.combine(end + timedelta(days=1), time.min)
+        )
+        return await self._summarize(user_id, diets, meals)
+
+    async def _summarize(self, user_id: str, diets: list[Row], meals: list[Row]) -> list[DietSummaryResponse]:
+        if not diets:
+            return []
+
+        measurements = await self.nutritional_data_repository.get_measurements(
+            user_id,
+            datetime.combine(diets[0].date.date(), time.min),
+            datetime.combine(diets[-1].date.date() + timedelta(days=1), time.min)
+        )
+        return summarize_diets(diets, meals, measurements)
+
+    async def add_meal(self, user_id: str, diet_id: str, request: MealCreate) -> MealResponse:
+        """
+        Adds a meal to a diet of the user.
+
+        Args:
+            user_id (str): The ID of the user.
+            diet_id (str): The ID of the diet.
+            request (MealCreate): The meal creation request data.
+
+        Returns:
+            MealResponse: The created meal response.
+
+        Raises:
+            HTTPException: If the user has no such diet or the food does not exist (404).
+        """
+        await self.get_diet(user_id, diet_id)
+        row = await self.repository.add_meal(diet_id, request)
+        return self.repository.map_row_to_meal(row)
+
+    async def set_meal_completed(
+        self,
+        user_id: str,
+        diet_id: str,
+        meal_id: str,
+        is_completed: bool
+    ) -> MealResponse:
+        """
+        Marks a meal of a diet of the user as completed or not.
+
+        Args:
+            user_id (str): The ID of the user.
+            diet_id (str): The ID of the diet.
+            meal_id (str): The ID of the meal.
+            is_completed (bool): The new completion state.
+
+        Returns:
+            MealResponse: The updated meal response.
+
+        Raises:
+            HTTPException: If the user has no such diet or the diet has no such meal (404).
+        """
+        await self.get_diet(user_id, diet_id)
+        row = await self.repository.set_meal_completed(diet_id, meal_id, is_completed)
+        return self.repository.map_row_to_meal(row)
+
+    async def delete_meal(self, user_id: str, diet_id: str, meal_id: str) -> MessageResponse:
+        """
+        Deletes a meal of a diet of the user.
+
+        Args:
+            user_id (str): The ID of the user.
+            diet_id (str): The ID of the diet.
+            meal_id (str): The ID of the meal.
+
+        Returns:
+            MessageResponse: The success message.
+
+        Raises:
+            HTTPException: If the user has no such diet or the diet has no such meal (404).
+        """
+        await self.get_diet(user_id, diet_id)
+        await self.repository.delete_meal(diet_id, meal_id)
+        return MessageResponse(detail=messages.SUCCESS_DELETE_MEAL)
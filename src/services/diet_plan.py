@@ -0,0 +1,204 @@
+import asyncio
+from datetime import date
+from math import ceil, floor
+
+from fastapi import HTTPException
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import messages, settings
+from src.core.planner import (
+    PLAN_NUTRIENTS,
+    PlanProblem,
+    PlanSolution,
+    PlanTargets,
+    compute_targets,
+    is_excluded,
+    parse_exclusions,
+    parse_goal,
+    plan_pool,
+    solve_plan
+)
+from src.db import diet_plan_cache
+from src.db.repositories import FoodRepository, NutritionalDataRepository
+from src.schemas import DietPlanResponse
+
+# The monthly budget is split evenly over this many days.
+DAYS_PER_MONTH = 30
+
+# The plans being solved per cache key, so concurrent requests for the same profile share one solve.
+_solving: dict[str, asyncio.Future] = {}
+
+
+def get_age(birth_date: date | None, today: date) -> int | None:
+    """
+    Computes an age in whole years.
+
+    Args:
+        birth_date (date | None): The birth date.
+        today (date): The reference date.
+
+    Returns:
+        int | None: The age, or None if the birth date is unknown.
+    """
+    if birth_date is None:
+        return None
+
+    return today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+
+
+class DietPlanService:
+    """
+    DietPlanService generates daily diet plans from the latest nutritional evaluation of a user.
+
+    The targets follow the user's weight, height, age, gender and goal; foods matching the
+    allergies or the requested exclusions are left out and, when the user has a monthly budget,
+    the plan costs at most its daily share. Plans are solved on a process pool and cached per
+    target profile (targets, budget and exclusions), so users with similar profiles share them;
+    concurrent requests for a profile that is not cached yet wait for a single solve.
+
+    Methods:
+        generate: Generates a plan for the user.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.food_repository = FoodRepository(db)
+        self.nutritional_data_repository = NutritionalDataRepository(db)
+
+    async def generate(self, user_id: str, exclude: list[str] | None = None) -> DietPlanResponse:
+        """
+        Generates a daily diet plan for the user.
+
+        Args:
+            user_id (str): The ID of the user.
+            exclude (list[str] | None): Foods to leave out besides the allergies of the user.
+
+        Returns:
+            DietPlanResponse: The plan.
+
+        Raises:
+            HTTPException: If the user has no nutritional evaluation (404), no food fits the
+                exclusions and budget (422) or the plan pool is saturated (503).
+        """
+        profile = await self.nutritional_data_repository.get_latest_profile(user_id)
+
+        if profile is None:
+            raise HTTPException(
+                status_code=404,
+                detail=messages.NUTRITIONAL_DATA_NOT_FOUND
+            )
+
+        goal = parse_goal(profile.goal)
+        birth_date = profile.birth_date.date() if profile.birth_date is not None else None
+        targets = compute_targets(
+            profile.weight, profile.height, get_age(birth_date, date.today()), profile.gender, goal
+        )
+        exclusions = parse_exclusions(profile.allergies, *(exclude or ()))
+        daily_budget = (
+            floor(profile.monthly_budget / DAYS_PER_MONTH * 2) / 2
+            if profile.monthly_budget is not None else None
+        )
+
+        key = f"{goal.value}:{':'.join(map(str, targets))}:{daily_budget}:{','.join(exclusions)}"
+
+        while True:
+            plan = await diet_plan_cache.get(key)
+
+            if plan is not None:
+                return plan
+
+            solving = _solving.get(key)
+
+            if solving is None:
+                break
+
+            try:
+                return await asyncio.shield(solving)
+            except asyncio.CancelledError:
+                # The request solving the plan was cancelled, not this one: solve it here instead.
+                if not solving.cancelled():
+                    raise
+
+        solving = asyncio.get_running_loop().create_future()
+        _solving[key] = solving
+
+        try:
+            plan = await self._solve(goal.value, targets, daily_budget, exclusions)
+            await diet_plan_cache.set(key, plan)
+        except asyncio.CancelledError:
+            solving.cancel()
+            raise
+        except Exception as error:
+            solving.set_exception(error)
+            # Marks the error as retrieved, it is already raised to this request.
+            solving.exception()
+            raise
+        else:
+            solving.set_result(plan)
+            return plan
+        finally:
+            del _solving[key]
+
+    async def _solve(
+        self,
+        goal: str,
+        targets: PlanTargets,
+        daily_budget: float | None,
+        exclusions: tuple[str, ...]
+    ) -> DietPlanResponse:
+        foods = [
+            food for food in await self.food_repository.get_plan_candidates(priced=daily_budget is not None)
+            if not is_excluded(food.name, exclusions)
+        ]
+
+        if not foods:
+            raise HTTPException(
+                status_code=422,
+                detail=messages.DIET_PLAN_NO_FOODS
+            )
+
+        # Evenly spaced over the names, so the candidates are not all from the start of the alphabet.
+        foods = foods[::ceil(len(foods) / settings.DIET_PLAN_CANDIDATES)]
+
+        problem = PlanProblem(
+            targets=targets,
+            foods=tuple(tuple(getattr(food, nutrient) for nutrient in PLAN_NUTRIENTS) for food in foods),
+            prices=tuple(food.price or 0.0 for food in foods),
+            budget=daily_budget,
+            max_portions=settings.DIET_PLAN_MAX_PORTIONS,
+            max_foods=settings.DIET_PLAN_MAX_FOODS,
+            time_limit=settings.DIET_PLAN_TIME_LIMIT,
+        )
+        solution = await plan_pool.run(solve_plan, problem)
+        return self._build_plan(goal, problem, solution, foods, exclusions)
+
+    @staticmethod
+    def _build_plan(
+        goal: str,
+        problem: PlanProblem,
+        solution: PlanSolution,
+        foods: list[Row],
+        exclusions: tuple[str, ...]
+    ) -> DietPlanResponse:
+        items = [
+            {
+                "food_id": food.id,
+                "name": food.name,
+                "portions": portions,
+                "quantity": round(portions * food.quantity, 2),
+                **{nutrient: round(portions * getattr(food, nutrient), 2) for nutrient in PLAN_NUTRIENTS},
+                "price": round(portions * food.price, 2) if food.price is not None else None,
+            }
+            for food, portions in zip(foods, solution.portions)
+            if portions > 0
+        ]
+
+        return DietPlanResponse.model_validate({
+            "goal": goal,
+            "targets": problem.targets._asdict(),
+            "totals": {nutrient: round(sum(item[nutrient] for item in items), 2) for nutrient in PLAN_NUTRIENTS},
+            "daily_budget": problem.budget,
+            "cost": round(sum(item["price"] for item in items), 2) if problem.budget is not None else None,
+            "exclusions": list(exclusions),
+            "solver": solution.solver,
+            "items": items,
+        })
@@ -0,0 +1,118 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import MemoryCache, settings
+from src.core.text import TrigramIndex, normalize_text
+from src.db import food_search_cache
+from src.db.repositories import FoodRepository
+from src.schemas import FoodSearchResponse
+
+# Words shorter than this are only prefix matched: trigram similarity is noise on them.
+FUZZY_MIN_LENGTH = 3
+
+# The vocabulary of the full-text index, refreshed as often as the search results expire.
+vocabulary_cache = MemoryCache(max_size=1, ttl=settings.FOOD_SEARCH_CACHE_TTL)
+
+
+def build_match(words: list[list[str]], prefix: list[bool]) -> str:
+    """
+    Builds an FTS5 query requiring one alternative of every word.
+
+    Args:
+        words (list[list[str]]): The alternatives of each word, normalized so they need no escaping.
+        prefix (list[bool]): Per word, whether its alternatives are prefix matched.
+
+    Returns:
+        str: The FTS5 query, e.g. '"arroz"* ("integral" OR "integrar")'.
+    """
+    groups = []
+
+    for alternatives, is_prefix in zip(words, prefix):
+        terms = [f'"{term}"*' if is_prefix else f'"{term}"' for term in alternatives]
+        groups.append(terms[0] if len(terms) == 1 else f"({' OR '.join(terms)})")
+
+    return " ".join(groups)
+
+
+class FoodSearchService:
+    """
+    FoodSearchService finds foods by name for autocomplete.
+
+    Searches are accent and case insensitive and every word is prefix matched, so "arr integ"
+    finds "Arroz Integral". When nothing matches, the misspelled words are replaced by the most
+    similar words of the index, by trigram similarity, and the search is retried. Results are
+    cached per normalized query for settings.FOOD_SEARCH_CACHE_TTL seconds.
+
+    Methods:
+        search: Searches foods by name.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.repository = FoodRepository(db)
+
+    async def search(self, query: str, limit: int | None = None) -> list[FoodSearchResponse]:
+        """
+        Searches foods by name, best matches first.
+
+        Args:
+            query (str): The text typed by the user.
+            limit (int | None): The maximum number of foods, capped by settings.FOOD_SEARCH_LIMIT_MAX.
+
+        Returns:
+            list[FoodSearchResponse]: The matching foods.
+        """
+        limit = max(1, min(limit or settings.FOOD_SEARCH_LIMIT, settings.FOOD_SEARCH_LIMIT_MAX))
+        words = normalize_text(query).split()
+
+        if not words:
+            return []
+
+        key = f"{limit}:{' '.join(words)}"
+        foods = await food_search_cache.get(key)
+
+        if foods is None:
+            foods = [self.repository.map_row_to_search_response(row) for row in await self._search(words, limit)]
+            await food_search_cache.set(key, foods)
+
+        return foods
+
+    async def _search(self, words: list[str], limit: int) -> list:
+        if not self.repository.full_text:
+            return await self.repository.search_like(words, limit)
+
+        rows = await self.repository.search(build_match([[word] for word in words], [True] * len(words)), limit)
+
+        if rows:
+            return rows
+
+        vocabulary = await self._vocabulary()
+        alternatives, prefix = [], []
+
+        for word in words:
+            if vocabulary.has_prefix(word):
+                alternatives.append([word])
+                prefix.append(True)
+                continue
+
+            closest = (
+                vocabulary.closest(word, settings.FOOD_SEARCH_FUZZY_THRESHOLD)
+                if len(word) >= FUZZY_MIN_LENGTH else []
+            )
+
+            if not closest:
+                return []
+
+            alternatives.append(closest)
+            prefix.append(False)
+
+        if all(prefix):
+            return []
+
+        return await self.repository.search(build_match(alternatives, prefix), limit)
+
+    async def _vocabulary(self) -> TrigramIndex:
+        vocabulary = await vocabulary_cache.get("vocabulary")
+
+        if vocabulary is None:
+            vocabulary = TrigramIndex(await self.repository.get_vocabulary())
+            await vocabulary_cache.set("vocabulary", vocabulary)
+
+        return vocabulary
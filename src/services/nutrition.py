@@ -0,0 +1,91 @@
+from datetime import date, timedelta
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import messages, settings
+from src.db.repositories import NutrientRollupRepository
+from src.schemas import DailyNutrientsResponse, WeeklyNutrientsResponse
+
+
+def resolve_range(start: date | None, end: date | None) -> tuple[date, date]:
+    """
+    Fills in the defaults of a date range and checks it.
+
+    Args:
+        start (date | None): The first day, or None for settings.NUTRIENT_ROLLUP_DEFAULT_DAYS before the end.
+        end (date | None): The last day, or None for today.
+
+    Returns:
+        tuple[date, date]: The first and last day, inclusive.
+
+    Raises:
+        HTTPException: If the start is after the end or the range is longer than
+            settings.NUTRIENT_ROLLUP_MAX_DAYS (400).
+    """
+    end = end or date.today()
+    start = start or end - timedelta(days=settings.NUTRIENT_ROLLUP_DEFAULT_DAYS - 1)
+
+    if start > end or (end - start).days >= settings.NUTRIENT_ROLLUP_MAX_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=messages.INVALID_DATE_RANGE
+        )
+
+    return start, end
+
+
+class NutritionService:
+    """
+    NutritionService serves the nutrients a user consumed per day and per week from the rollups.
+
+    Days and weeks without diets are left out of the results.
+
+    Methods:
+        get_daily: Retrieves the nutrients per day in a date range.
+        get_weekly: Retrieves the nutrients per week in a date range.
+    """
+    def __init__(self, db: AsyncSession) -> None:
+        self.repository = NutrientRollupRepository(db)
+
+    async def get_daily(
+        self,
+        user_id: str,
+        start: date | None = None,
+        end: date | None = None
+    ) -> list[DailyNutrientsResponse]:
+        """
+        Retrieves the nutrients a user consumed per day.
+
+        Args:
+            user_id (str): The ID of the user.
+            start (date | None): The first day, defaults to settings.NUTRIENT_ROLLUP_DEFAULT_DAYS before the end.
+            end (date | None): The last day, defaults to today.
+
+        Returns:
+            list[DailyNutrientsResponse]: The days with diets, in date order.
+        """
+        start, end = resolve_range(start, end)
+        rows = await self.repository.get_daily(user_id, start, end)
+        return [self.repository.map_row_to_daily(row) for row in rows]
+
+    async def get_weekly(
+        self,
+        user_id: str,
+        start: date | None = None,
+        end: date | None = None
+    ) -> list[WeeklyNutrientsResponse]:
+        """
+        Retrieves the nutrients a user consumed per week, for the weeks overlapping a date range.
+
+        Args:
+            user_id (str): The ID of the user.
+            start (date | None): The first day, defaults to settings.NUTRIENT_ROLLUP_DEFAULT_DAYS before the end.
+            end (date | None): The last day, defaults to today.
+
+        Returns:
+            list[WeeklyNutrientsResponse]: The weeks with diets, in date order.
+        """
+        start, end = resolve_range(start, end)
+        rows = await self.repository.get_weekly(user_id, start, end)
+        return [self.repository.map_row_to_weekly(row) for row in rows]
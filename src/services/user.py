@@ -1,8 +1,14 @@
+import base64
+import binascii
+from datetime import datetime
+from typing import AsyncIterator
+
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core import SecurityHandler
+from src.core import SecurityHandler, settings
 from src.core import messages
+from src.core.security import login_email_limiter, login_ip_limiter
 from src.db.repositories import UserRepository
 from src.schemas import (
     TokenData, 
@@ -10,9 +16,48 @@ from src.schemas import (
     MessageResponse, 
     UserCreate, 
     UserLogin, 
+    UserPage,
     UserResponse
 )
 
+
+def encode_cursor(created_at: datetime, user_id: str) -> str:
+    """
+    Encodes the pagination key of a user as an opaque cursor.
+
+    Args:
+        created_at (datetime): The creation timestamp of the user.
+        user_id (str): The ID of the user.
+
+    Returns:
+        str: The URL-safe cursor.
+    """
+    raw = f"{created_at.isoformat()}|{user_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decodes a cursor created by encode_cursor.
+
+    Args:
+        cursor (str): The cursor received from the client.
+
+    Returns:
+        tuple[datetime, str]: The creation timestamp and ID of the last user of the previous page.
+
+    Raises:
+        HTTPException: If the cursor is malformed (400).
+    """
+    try:
+        created_at, user_id = base64.urlsafe_b64decode(cursor).decode("utf-8").split("|", 1)
+        return datetime.fromisoformat(created_at), user_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=400,
+            detail=messages.INVALID_CURSOR
+        )
+
 class UserService:
     """
     UserService is responsible for handling user-related operations,
@@ -35,13 +80,13 @@ class UserService:
             UserResponse: The created user response.
         """
         
-        request.password = SecurityHandler.hash_password(request.password)
+        request.password = await SecurityHandler.hash_password_async(request.password)
 
         model = self.repository.map_request_to_model(request)
 
-        model = await self.repository.add_user(model)
+        row = await self.repository.add_user(model)
 
-        response = self.repository.map_model_to_response(model)
+        response = self.repository.map_row_to_response(row)
 
         return response
     
@@ -56,15 +101,15 @@ class UserService:
         Returns:
             UserResponse | None: The retrieved user response or None if not found.
         """
-        model = await self.repository.get_user(user_id=user_id)
+        user = await self.repository.get_user_response(user_id=user_id)
         
-        if model is None:
+        if user is None:
             raise HTTPException(
                 status_code=404,
                 detail=messages.USER_NOT_FOUND
             )
         
-        return self.repository.map_model_to_response(model)
+        return user
     
 
     async def get_user_by_email(self, email: str) -> UserResponse:
@@ -77,27 +122,54 @@ class UserService:
         Returns:
             UserResponse | None: The retrieved user response or None if not found.
         """
-        model = await self.repository.get_user(email=email)
+        user = await self.repository.get_user_response(email=email)
         
-        if model is None:
+        if user is None:
             raise HTTPException(
                 status_code=404,
                 detail=messages.USER_NOT_FOUND
             )
         
-        return self.repository.map_model_to_response(model)
+        return user
     
 
-    async def get_all_users(self) -> list[UserResponse]:
+    async def list_users(self, limit: int, cursor: str | None = None) -> UserPage:
         """
-        Retrieves all users.
+        Retrieves a page of users, ordered by creation date.
+
+        Args:
+            limit (int): The number of users per page, capped by settings.USER_PAGE_SIZE_MAX.
+            cursor (str | None): The next_cursor of the previous page, or None for the first page.
 
         Returns:
-            list[UserResponse]: A list of all user responses.
+            UserPage: The users of the page and the cursor of the next one.
         """
-        models = await self.repository.get_user(all_results=True)
-        
-        return [self.repository.map_model_to_response(model) for model in models]
+        limit = max(1, min(limit, settings.USER_PAGE_SIZE_MAX))
+        after = decode_cursor(cursor) if cursor else None
+
+        rows = await self.repository.list_users(limit=limit + 1, after=after)
+
+        next_cursor = None
+
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+        return UserPage(
+            items=[self.repository.map_row_to_response(row) for row in rows],
+            next_cursor=next_cursor
+        )
+
+
+    async def export_users(self) -> AsyncIterator[str]:
+        """
+        Exports every user as newline delimited JSON, streaming rows from the database.
+
+        Yields:
+            str: One JSON encoded UserResponse per line.
+        """
+        async for row in self.repository.stream_users(settings.USER_EXPORT_BATCH_SIZE):
+            yield self.repository.map_row_to_response(row).model_dump_json() + "\n"
     
 
     async def delete_user(self, user_id: str) -> MessageResponse:
@@ -121,34 +193,52 @@ class UserService:
         return MessageResponse(detail=messages.SUCCESS_DELETE_USER)
     
 
-    async def login(self, request: UserLogin) -> TokenResponse:
+    async def login(self, request: UserLogin, client_ip: str | None = None) -> TokenResponse:
         """
         Logs in a user by validating credentials.
 
+        Attempts are rate limited per client address and per email before the database or bcrypt
+        are touched. Unknown emails are verified against a dummy hash, so they take as long as a
+        wrong password.
+
         Args:
             request (UserLogin): The user login request data.
+            client_ip (str | None): The address of the client, if known.
 
         Returns:
             UserResponse: The logged-in user response.
 
         Raises:
-            HTTPException: If the user is not found or password is incorrect.
+            HTTPException: If there were too many attempts (429), the user is not found or password is incorrect.
         """
-        model = await self.repository.get_user(email=request.email)
+        email = request.email.lower()
+
+        if client_ip is not None:
+            await login_ip_limiter.check(client_ip)
+        await login_email_limiter.check(email)
+
+        row = await self.repository.get_user_credentials(email=request.email)
         
-        if model is None:
+        if row is None:
+            await SecurityHandler.verify_dummy_password(request.password)
             raise HTTPException(
                 status_code=404,
                 detail=messages.USER_NOT_FOUND
             )
         
-        if not SecurityHandler.verify_password(request.password, model.password):
+        if not await SecurityHandler.verify_password_async(request.password, row.password):
             raise HTTPException(
                 status_code=401,
                 detail=messages.WRONG_USER_PASSWORD
             )
+
+        await login_email_limiter.reset(email)
+
+        if SecurityHandler.password_needs_rehash(row.password):
+            password = await SecurityHandler.hash_password_async(request.password)
+            row = await self.repository.update(row.id, {"password": password}) or row
         
-        user = self.repository.map_model_to_response(model)
+        user = self.repository.map_row_to_response(row)
 
         token_data = TokenData(sub=user.id,)
 
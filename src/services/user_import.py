@@ -0,0 +1,209 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core import SecurityHandler, id_generator, messages, settings
+from src.db.repositories import UserRepository
+from src.schemas import UserCreate
+
+IMPORT_FORMATS = {
+    "text/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+async def iter_lines(chunks: AsyncIterator[bytes], max_line_length: int) -> AsyncIterator[str | None]:
+    """
+    Splits a stream of UTF-8 bytes into lines, holding at most one line in memory. A leading byte
+    order mark, as written by spreadsheet exports, is dropped.
+
+    Args:
+        chunks (AsyncIterator[bytes]): The raw body chunks.
+        max_line_length (int): The maximum length of a line; longer lines are skipped.
+
+    Yields:
+        str | None: Each non-empty line without its line break, or None for a line that was too long.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    skipping = False
+
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+
+        for line in lines:
+            if skipping:
+                skipping = False
+                yield None
+            elif len(line) > max_line_length:
+                yield None
+            elif line.strip():
+                yield line.rstrip("\r")
+
+        if len(buffer) > max_line_length:
+            buffer = ""
+            skipping = True
+
+    buffer += decoder.decode(b"", final=True)
+
+    if skipping or len(buffer) > max_line_length:
+        yield None
+    elif buffer.strip():
+        yield buffer.rstrip("\r")
+
+
+async def iter_records(lines: AsyncIterator[str | None], import_format: str) -> AsyncIterator[dict | None]:
+    """
+    Parses CSV (with a header row) or NDJSON lines into records.
+
+    CSV fields may be quoted, but a quoted field cannot span more than one line.
+
+    Args:
+        lines (AsyncIterator[str | None]): The lines, as yielded by iter_lines.
+        import_format (str): "csv" or "ndjson".
+
+    Yields:
+        dict | None: Each record, or None for a line that could not be parsed.
+    """
+    header = None
+
+    async for line in lines:
+        if line is None:
+            yield None
+            continue
+
+        if import_format == "ndjson":
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield record if isinstance(record, dict) else None
+            continue
+
+        values = next(csv.reader([line]))
+
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            continue
+
+        yield dict(zip(header, values)) if len(values) == len(header) else None
+
+
+class UserImportService:
+    """
+    UserImportService creates users in bulk from a CSV or NDJSON stream.
+
+    Rows are processed in batches of settings.USER_IMPORT_BATCH_SIZE: each batch is validated,
+    checked for registered emails with one query, hashed in parallel on the password worker pool
+    and inserted with one executemany INSERT. The outcome of every row is reported as it is known.
+
+    Methods:
+        import_users: Imports a stream of users and yields the report.
+    """
+    def __init__(self, db_session: AsyncSession) -> None:
+        self.repository = UserRepository(db_session)
+
+    async def import_users(self, chunks: AsyncIterator[bytes], import_format: str) -> AsyncIterator[str]:
+        """
+        Imports a stream of users.
+
+        Args:
+            chunks (AsyncIterator[bytes]): The raw body chunks.
+            import_format (str): "csv" or "ndjson".
+
+        Yields:
+            str: One JSON line per row, with its "row" number and a "status" of "created", "conflict"
+                or "invalid", followed by a final "summary" line with the count of each status.
+        """
+        totals = {"created": 0, "conflict": 0, "invalid": 0}
+        batch: list[tuple[int, UserCreate]] = []
+        row_number = 0
+
+        lines = iter_lines(chunks, settings.USER_IMPORT_MAX_LINE_LENGTH)
+
+        async for record in iter_records(lines, import_format):
+            row_number += 1
+            result = self._validate(row_number, record)
+
+            if isinstance(result, UserCreate):
+                batch.append((row_number, result))
+            else:
+                totals["invalid"] += 1
+                yield self._line(result)
+
+            if len(batch) >= settings.USER_IMPORT_BATCH_SIZE:
+                for report in await self._import_batch(batch):
+                    totals[report["status"]] += 1
+                    yield self._line(report)
+                batch = []
+
+        for report in await self._import_batch(batch):
+            totals[report["status"]] += 1
+            yield self._line(report)
+
+        yield self._line({"status": "summary", **totals})
+
+    @staticmethod
+    def _line(report: dict) -> str:
+        return json.dumps(report, ensure_ascii=False) + "\n"
+
+    @staticmethod
+    def _validate(row_number: int, record: dict | None) -> UserCreate | dict:
+        if record is None:
+            return {"row": row_number, "status": "invalid", "errors": [messages.INVALID_IMPORT_ROW]}
+
+        try:
+            return UserCreate.model_validate(record)
+        except ValidationError as error:
+            # Only the field names and messages: the input values may hold passwords.
+            errors = [
+                f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+                for detail in error.errors(include_url=False, include_input=False)
+            ]
+            return {"row": row_number, "status": "invalid", "errors": errors}
+
+    async def _import_batch(self, batch: list[tuple[int, UserCreate]]) -> list[dict]:
+        reports = []
+        pending: dict[str, tuple[int, UserCreate]] = {}
+
+        for row_number, request in batch:
+            if request.email in pending:
+                reports.append(self._conflict(row_number, request.email))
+            else:
+                pending[request.email] = (row_number, request)
+
+        for email in await self.repository.get_existing_emails(list(pending)):
+            row_number, _ = pending.pop(email)
+            reports.append(self._conflict(row_number, email))
+
+        requests = [request for _, request in pending.values()]
+        passwords = await SecurityHandler.hash_passwords_async([request.password for request in requests])
+
+        values = [
+            {**row, "id": id_generator(), "password": password}
+            for row, password in zip(UserCreate.to_dicts(requests, exclude=("password",)), passwords)
+        ]
+        conflicts = {row["email"] for row in await self.repository.add_users(values)}
+
+        for (row_number, _), row in zip(pending.values(), values):
+            if row["email"] in conflicts:
+                reports.append(self._conflict(row_number, row["email"]))
+            else:
+                reports.append({"row": row_number, "status": "created", "id": row["id"], "email": row["email"]})
+
+        return sorted(reports, key=lambda report: report["row"])
+
+    @staticmethod
+    def _conflict(row_number: int, email: str) -> dict:
+        return {
+            "row": row_number,
+            "status": "conflict",
+            "email": email,
+            "detail": messages.USER_EMAIL_ALREADY_EXISTS,
+        }
@@ -0,0 +1,51 @@
+from time import perf_counter
+
+
+class StartupTimer:
+    """
+    StartupTimer measures how long each phase of the application startup takes.
+
+    Created when this module is first imported, which src.api does before any other import,
+    so the first phase covers the cost of importing the application.
+
+    Attributes:
+        phases (dict[str, float]): The duration of each finished phase, in seconds.
+
+    Methods:
+        mark: Ends the current phase.
+        report: Returns the phase durations and the total.
+    """
+    def __init__(self) -> None:
+        self.started_at = perf_counter()
+        self.phases: dict[str, float] = {}
+        self._last = self.started_at
+
+    def mark(self, phase: str) -> None:
+        """
+        Ends the current phase, recording the time elapsed since the previous mark.
+
+        Args:
+            phase (str): The name of the phase that just finished.
+
+        Returns:
+            None
+        """
+        now = perf_counter()
+        self.phases[phase] = now - self._last
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        return self._last - self.started_at
+
+    def report(self) -> dict:
+        """
+        Returns the phase durations and the total.
+
+        Returns:
+            dict: The "phases" durations and the "total", in seconds.
+        """
+        return {"phases": dict(self.phases), "total": self.total}
+
+
+startup_timer = StartupTimer()
@@ -0,0 +1,151 @@
+"""
+Shared fixtures: the test settings, a migrated SQLite database and an API client.
+
+The environment is set before anything from src is imported, since the settings and the
+database handler are created at import time.
+"""
+import asyncio
+import os
+import tempfile
+from datetime import datetime
+from uuid import uuid4
+
+DB_DIRECTORY = tempfile.TemporaryDirectory(prefix="nutrissas-tests-")
+ADMIN_EMAIL = "admin@example.com"
+
+os.environ.update({
+    "ALGORITHM": "HS256",
+    "SECRET_KEY": "test-secret",
+    "DB_URL": f"sqlite+aiosqlite:///{DB_DIRECTORY.name}/test.db",
+    "BCRYPT_ROUNDS": "4",
+    "ADMIN_EMAILS": f'["{ADMIN_EMAIL}"]',
+    "LOGIN_RATE_LIMIT_PER_IP": "0",
+    "LOGIN_RATE_LIMIT_PER_EMAIL": "0",
+})
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from src.core import id_generator  # noqa: E402
+from src.db import db  # noqa: E402
+from src.db.migrations import MIGRATIONS, Migrator  # noqa: E402
+from src.db.models import FoodModel, NutritionalDataModel  # noqa: E402
+
+
+def run(coroutine):
+    """
+    Runs a coroutine on a new event loop, disposing the database pool before the loop closes.
+    """
+    async def wrapper():
+        try:
+            return await coroutine
+        finally:
+            await db.close()
+
+    return asyncio.run(wrapper())
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    run(Migrator(db, MIGRATIONS).upgrade())
+    return db
+
+
+@pytest.fixture
+def client():
+    from src.api import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def signup(client):
+    """
+    Creates a user and logs it in.
+
+    Returns:
+        Callable[[str | None], tuple[dict, dict]]: Takes an optional email and returns the created user
+            and the Authorization headers of its token.
+    """
+    def create(email: str | None = None, **fields) -> tuple[dict, dict]:
+        email = email or f"{uuid4().hex}@example.com"
+        user = client.post("/user/", json={"name": "Test", "email": email, "password": "secret", **fields})
+        assert user.status_code == 200, user.text
+        token = client.post("/user/login", json={"email": email, "password": "secret"}).json()["access_token"]
+        return user.json(), {"Authorization": f"Bearer {token}"}
+
+    return create
+
+
+@pytest.fixture
+def admin_headers(client):
+    """
+    The Authorization headers of the administrator of settings.ADMIN_EMAILS, created on first use.
+    """
+    client.post("/user/", json={"name": "Admin", "email": ADMIN_EMAIL, "password": "secret"})
+    token = client.post("/user/login", json={"email": ADMIN_EMAIL, "password": "secret"}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def add_food(client):
+    """
+    Inserts foods directly, there is no endpoint creating them. The insert runs on the event loop of
+    the client, which owns the database connections while the application is running.
+
+    Returns:
+        Callable[..., str]: Takes the food name and optional column values and returns the food id.
+    """
+    def create(name: str, **fields) -> str:
+        values = {
+            "id": id_generator(),
+            "name": name,
+            "quantity": 100,
+            "calories": 100,
+            "proteins": 10,
+            "fats": 5,
+            "carbohydrates": 10,
+            "consumption_date": datetime.now(),
+            "type": "lunch",
+            **fields,
+        }
+
+        async def insert_food():
+            async with db.engine.begin() as conn:
+                await conn.execute(insert(FoodModel).values(**values))
+
+        client.portal.call(insert_food)
+        return values["id"]
+
+    return create
+
+
+@pytest.fixture
+def add_evaluation(client):
+    """
+    Inserts nutritional evaluations directly, there is no endpoint creating them.
+
+    Returns:
+        Callable[..., str]: Takes the user id and optional column values and returns the evaluation id.
+    """
+    def create(user_id: str, **fields) -> str:
+        values = {
+            "id": id_generator(),
+            "user_id": user_id,
+            "weight": 70,
+            "height": 175,
+            "cmi": 22.86,
+            "evaluation_date": datetime.now(),
+            **fields,
+        }
+
+        async def insert_evaluation():
+            async with db.engine.begin() as conn:
+                await conn.execute(insert(NutritionalDataModel).values(**values))
+
+        client.portal.call(insert_evaluation)
+        return values["id"]
+
+    return create
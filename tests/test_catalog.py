@@ -0,0 +1,114 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import delete, insert
+
+from src.core import id_generator
+from src.core.catalog import FoodCatalog
+from src.db import db
+from src.db.models import CatalogFoodModel
+from src.db.repositories import CatalogRepository
+
+
+@pytest.fixture
+def add_catalog_food(client):
+    def create(calories: float, proteins: float, fats: float, carbohydrates: float) -> str:
+        food_id = id_generator()
+
+        async def insert_food():
+            async with db.engine.begin() as conn:
+                await conn.execute(insert(CatalogFoodModel).values(
+                    id=food_id,
+                    name=f"Alimento {uuid4().hex}",
+                    calories=calories,
+                    proteins=proteins,
+                    fats=fats,
+                    carbohydrates=carbohydrates,
+                ))
+
+        client.portal.call(insert_food)
+        return food_id
+
+    return create
+
+
+def test_catalog_totals_multiply_the_quantities_per_100_grams():
+    catalog = FoodCatalog([("rice", "Arroz", 130, 2.5, 0.3, 28), ("beans", "Feijão", 76, 4.8, 0.5, 13.6)])
+
+    assert len(catalog) == 2 and "rice" in catalog and "bread" not in catalog
+    assert catalog.get("beans").name == "Feijão"
+    assert catalog.get("bread") is None
+    assert catalog.totals(["rice", "beans", "rice"], [150, 100, 50]) == pytest.approx(
+        {"calories": 336, "proteins": 9.8, "fats": 1.1, "carbohydrates": 69.6}
+    )
+
+    with pytest.raises(KeyError):
+        catalog.totals(["bread"], [100])
+
+
+def test_foods_added_after_startup_are_served_from_a_reloaded_catalog(client, signup, add_catalog_food):
+    _, headers = signup()
+    food_id = add_catalog_food(52, 0.3, 0.2, 14)
+
+    response = client.get(f"/catalog/foods/{food_id}", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["calories"] == 52
+    assert client.get("/catalog/foods/missing", headers=headers).status_code == 404
+
+
+def test_totals_sum_the_logged_quantities(client, signup, add_catalog_food):
+    _, headers = signup()
+    apple = add_catalog_food(52, 0.3, 0.2, 14)
+    oats = add_catalog_food(389, 16.9, 6.9, 66.3)
+
+    for food_id, grams, day in ((apple, 150, "2025-04-01"), (oats, 40, "2025-04-02"), (apple, 100, "2025-05-01")):
+        entry = {"catalog_food_id": food_id, "grams": grams, "consumed_at": f"{day}T08:00:00"}
+        assert client.post("/consumption/", json=entry, headers=headers).status_code == 200
+
+    response = client.post(
+        "/consumption/", json={"catalog_food_id": "missing", "grams": 10, "consumed_at": "2025-04-01T08:00:00"},
+        headers=headers
+    )
+    assert response.status_code == 404
+
+    totals = client.get("/consumption/totals", params={"start": "2025-04-01", "end": "2025-04-30"}, headers=headers).json()
+
+    assert totals["entries"] == 2
+    assert totals["calories"] == pytest.approx(52 * 1.5 + 389 * 0.4)
+    assert totals["proteins"] == pytest.approx(0.3 * 1.5 + 16.9 * 0.4)
+
+
+def test_totals_leave_out_foods_removed_from_the_catalog(client, signup, add_catalog_food, monkeypatch):
+    _, headers = signup()
+    kept = add_catalog_food(100, 10, 1, 1)
+    removed = add_catalog_food(200, 20, 2, 2)
+
+    for food_id in (kept, removed):
+        entry = {"catalog_food_id": food_id, "grams": 100, "consumed_at": "2025-06-01T08:00:00"}
+        client.post("/consumption/", json=entry, headers=headers)
+
+    async def remove():
+        async with db.engine.begin() as conn:
+            await conn.execute(delete(CatalogFoodModel).where(CatalogFoodModel.id == removed))
+
+    client.portal.call(remove)
+    # Serving a food added since the last load reloads the snapshot, which drops the removed food.
+    assert client.get(f"/catalog/foods/{add_catalog_food(1, 1, 1, 1)}", headers=headers).status_code == 200
+    totals = client.get("/consumption/totals", params={"start": "2025-06-01", "end": "2025-06-01"}, headers=headers).json()
+
+    assert totals["entries"] == 1
+    assert totals["calories"] == pytest.approx(100)
+
+    reloads = []
+    load_catalog = CatalogRepository.load_catalog
+
+    async def counted_load_catalog(self):
+        reloads.append(1)
+        return await load_catalog(self)
+
+    monkeypatch.setattr(CatalogRepository, "load_catalog", counted_load_catalog)
+    totals = client.get("/consumption/totals", params={"start": "2025-06-01", "end": "2025-06-01"}, headers=headers).json()
+
+    # The removed food is missing from the snapshot and the database, so it does not reload the catalog.
+    assert totals["entries"] == 1 and reloads == []
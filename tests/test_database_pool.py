@@ -0,0 +1,78 @@
+import asyncio
+
+from sqlalchemy import text
+
+from src.core import DatabaseHandler
+
+
+def test_file_databases_use_the_monitored_queue_pool(tmp_path):
+    handler = DatabaseHandler(f"sqlite+aiosqlite:///{tmp_path}/pool.db", pool_size=3, max_overflow=1)
+
+    async def scenario():
+        await handler.connect(warm_connections=2)
+        idle = handler.pool_stats()
+
+        async with handler.engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            busy = handler.pool_stats()
+
+        await handler.close()
+        return idle, busy
+
+    idle, busy = asyncio.run(scenario())
+
+    assert idle["pool_class"] == "MonitoredQueuePool"
+    assert (idle["size"], idle["checked_in"], idle["checked_out"]) == (3, 2, 0)
+    assert busy["checked_out"] == 1
+    assert busy["wait_count"] >= 3
+
+
+def test_in_memory_databases_keep_a_single_connection():
+    handler = DatabaseHandler("sqlite+aiosqlite:///:memory:", pool_size=3)
+
+    async def scenario():
+        async with handler.engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+
+        async with handler.engine.connect() as conn:
+            result = await conn.execute(text("SELECT count(*) FROM t"))
+            count = result.scalar()
+
+        stats = handler.pool_stats()
+        await handler.close()
+        return count, stats
+
+    count, stats = asyncio.run(scenario())
+
+    assert count == 0
+    assert stats["pool_class"] == "StaticPool"
+
+
+def test_close_waits_for_checked_out_connections(tmp_path):
+    handler = DatabaseHandler(f"sqlite+aiosqlite:///{tmp_path}/drain.db")
+    events = []
+
+    async def scenario():
+        conn = await handler.engine.connect()
+
+        async def release():
+            await asyncio.sleep(0.1)
+            await conn.close()
+            events.append("released")
+
+        task = asyncio.create_task(release())
+        await handler.close(drain_timeout=2)
+        events.append("disposed")
+        await task
+
+    asyncio.run(scenario())
+
+    assert events == ["released", "disposed"]
+
+
+def test_database_health_endpoint(client, admin_headers):
+    stats = client.get("/health/database", headers=admin_headers).json()
+
+    assert stats["pool_class"] == "MonitoredQueuePool"
+    # At most the connection of the request's own session, used to look up the administrator.
+    assert stats["checked_out"] <= 1
@@ -0,0 +1,129 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from src.core.enums import DietGoal
+from src.core.planner import (
+    PlanProblem,
+    PlanTargets,
+    compute_targets,
+    is_excluded,
+    parse_exclusions,
+    parse_goal,
+    plan_pool,
+    solve_plan
+)
+from src.db import db, diet_plan_cache
+from src.services.diet_plan import DietPlanService, get_age
+
+
+def problem(foods, prices=None, budget=None, max_portions=3, max_foods=8) -> PlanProblem:
+    return PlanProblem(
+        targets=PlanTargets(400, 40, 10, 40),
+        foods=tuple(foods),
+        prices=tuple(prices or [0.0] * len(foods)),
+        budget=budget,
+        max_portions=max_portions,
+        max_foods=max_foods,
+        time_limit=1,
+    )
+
+
+def test_goals_and_exclusions_are_read_from_free_text():
+    assert parse_goal("Perder peso") == DietGoal.LOSE
+    assert parse_goal("ganho de MASSA muscular") == DietGoal.GAIN
+    assert parse_goal("saúde") == DietGoal.MAINTAIN
+    assert parse_goal(None) == DietGoal.MAINTAIN
+    assert parse_exclusions("Leite, amendoim e Camarão", None, "leite") == ("amendoim", "camarao", "leite")
+    assert is_excluded("Pasta de Amendoim", ("amendoim",))
+    assert is_excluded("Leite Integral", ("lei",))
+    assert not is_excluded("Feijoada", ("leite",))
+
+
+def test_targets_follow_the_profile_and_goal():
+    assert compute_targets(70, 175, 30, "M", DietGoal.MAINTAIN) == PlanTargets(2300, 110, 65, 320)
+    assert compute_targets(70, 175, None, "M", DietGoal.MAINTAIN) == compute_targets(70, 175, 30, "M", DietGoal.MAINTAIN)
+    assert compute_targets(70, 175, 30, "M", DietGoal.LOSE).calories < compute_targets(70, 175, 30, "F", DietGoal.MAINTAIN).calories
+    assert get_age(date(2000, 6, 15), date(2025, 6, 14)) == 24
+    assert get_age(None, date(2025, 6, 14)) is None
+
+
+def test_greedy_solver_meets_reachable_targets():
+    solution = solve_plan(problem([(200, 20, 5, 20), (900, 0, 100, 0)]), use_milp=False)
+
+    assert solution == ((2, 0), "greedy")
+
+
+def test_greedy_solver_respects_the_limits():
+    foods = [(100, 10, 2.5, 10), (100, 10, 2.5, 10), (100, 10, 2.5, 10)]
+
+    assert sum(solve_plan(problem(foods, max_portions=1), use_milp=False).portions) == 3
+    assert sum(solve_plan(problem(foods, max_portions=2, max_foods=1), use_milp=False).portions) == 2
+    assert solve_plan(problem(foods, prices=[5, 5, 5], budget=12), use_milp=False).portions.count(0) >= 1
+    assert solve_plan(problem([]), use_milp=False).portions == ()
+
+
+def test_integer_program_finds_the_exact_plan():
+    pytest.importorskip("scipy")
+    foods = [(200, 20, 5, 20), (150, 5, 8, 15), (90, 1, 0, 22)]
+    milp, greedy = solve_plan(problem(foods), use_milp=True), solve_plan(problem(foods), use_milp=False)
+
+    assert milp.solver == "milp"
+    assert milp.portions == (2, 0, 0) == greedy.portions
+
+
+def test_plan_endpoint_leaves_out_allergies_and_stays_within_budget(client, signup, add_food, add_evaluation):
+    user, headers = signup()
+    add_evaluation(user["id"], weight=64, height=163, goal="perder peso", allergies="Amendoim", monthly_budget=450)
+    add_food("Pasta de Amendoim", quantity=30, calories=180, proteins=8, fats=15, carbohydrates=6, price=1)
+    add_food("Peito de Frango", quantity=100, calories=165, proteins=31, fats=3.6, carbohydrates=0, price=4)
+    add_food("Arroz Branco", quantity=100, calories=130, proteins=2.7, fats=0.3, carbohydrates=28, price=0.5)
+    add_food("Azeite", quantity=10, calories=90, proteins=0, fats=10, carbohydrates=0, price=0.8)
+
+    plan = client.get("/diet/plan", params={"exclude": ["azeite"]}, headers=headers).json()
+
+    assert plan["goal"] == DietGoal.LOSE.value
+    assert plan["daily_budget"] == 15.0
+    assert plan["exclusions"] == ["amendoim", "azeite"]
+    assert {item["name"] for item in plan["items"]} <= {"Peito de Frango", "Arroz Branco"}
+    assert plan["items"] and plan["cost"] <= plan["daily_budget"]
+    assert plan["totals"]["calories"] == pytest.approx(sum(item["calories"] for item in plan["items"]))
+
+
+def test_plan_endpoint_requires_an_evaluation(client, signup):
+    _, headers = signup()
+
+    assert client.get("/diet/plan", headers=headers).status_code == 404
+
+
+def test_concurrent_requests_for_one_profile_share_a_solve(client, signup, add_food, add_evaluation, monkeypatch):
+    users = [signup()[0] for _ in range(3)]
+    add_food("Cuscuz", quantity=100, calories=112, proteins=3.8, fats=0.2, carbohydrates=23)
+
+    for user in users:
+        add_evaluation(user["id"], weight=123, height=201, goal="manter", allergies="cuscuz e quiabo")
+
+    solves = []
+
+    async def run(func, *args):
+        solves.append(args)
+        await asyncio.sleep(0.05)
+        return func(*args)
+
+    monkeypatch.setattr(plan_pool, "run", run)
+
+    async def generate_all():
+        await diet_plan_cache.clear()
+
+        async def generate(user_id):
+            async with db.async_session() as session:
+                return await DietPlanService(session).generate(user_id)
+
+        return await asyncio.gather(*(generate(user["id"]) for user in users))
+
+    plans = client.portal.call(generate_all)
+
+    assert len(solves) == 1
+    assert plans[0] == plans[1] == plans[2]
+    assert "Cuscuz" not in {item.name for item in plans[0].items}
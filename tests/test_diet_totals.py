@@ -0,0 +1,73 @@
+from sqlalchemy import update
+
+from src.db import db
+from src.db.models import DietModel
+from src.db.repositories import DietRepository
+
+
+def totals(client, headers, diet_id: str) -> tuple[float, ...]:
+    diet = client.get(f"/diet/{diet_id}", headers=headers).json()
+    return tuple(diet[f"total_{nutrient}"] for nutrient in ("calories", "proteins", "fats", "carbohydrates"))
+
+
+def test_totals_follow_the_completed_meals(client, signup, add_food):
+    _, headers = signup()
+    rice = add_food("Arroz", calories=130, proteins=2.5, fats=0.3, carbohydrates=28)
+    beans = add_food("Feijão", calories=76, proteins=4.8, fats=0.5, carbohydrates=13.6)
+    diet = client.post("/diet/", json={"date": "2025-03-10T12:00:00"}, headers=headers).json()
+    meals = f"/diet/{diet['id']}/meals"
+
+    assert diet["total_calories"] == 0
+
+    eaten = client.post(meals, json={"food_id": rice, "type": "lunch", "is_completed": True}, headers=headers).json()
+    planned = client.post(meals, json={"food_id": beans, "type": "lunch"}, headers=headers).json()
+    assert totals(client, headers, diet["id"]) == (130, 2.5, 0.3, 28)
+
+    client.patch(f"{meals}/{planned['id']}", json={"is_completed": True}, headers=headers)
+    client.patch(f"{meals}/{planned['id']}", json={"is_completed": True}, headers=headers)
+    assert totals(client, headers, diet["id"]) == (206, 7.3, 0.8, 41.6)
+
+    client.delete(f"{meals}/{eaten['id']}", headers=headers)
+    client.patch(f"{meals}/{planned['id']}", json={"is_completed": False}, headers=headers)
+    assert totals(client, headers, diet["id"]) == (0, 0, 0, 0)
+
+
+def test_meals_of_unknown_foods_or_diets_are_rejected(client, signup, add_food):
+    _, headers = signup()
+    _, other_headers = signup()
+    food = add_food("Maçã")
+    diet = client.post("/diet/", json={"date": "2025-03-10T12:00:00"}, headers=headers).json()
+
+    response = client.post(f"/diet/{diet['id']}/meals", json={"food_id": "missing", "type": "lunch"}, headers=headers)
+    assert response.status_code == 404
+
+    response = client.post(f"/diet/{diet['id']}/meals", json={"food_id": food, "type": "lunch"}, headers=other_headers)
+    assert response.status_code == 404
+
+
+def test_drifted_totals_are_found_and_rebuilt(client, signup, add_food):
+    _, headers = signup()
+    food = add_food("Pão", calories=265, proteins=9, fats=3.2, carbohydrates=49)
+    diet = client.post("/diet/", json={"date": "2025-03-11T08:00:00"}, headers=headers).json()
+    client.post(f"/diet/{diet['id']}/meals", json={"food_id": food, "type": "breakfast", "is_completed": True}, headers=headers)
+
+    async def scenario():
+        async with db.async_session() as session:
+            repository = DietRepository(session)
+            before = [row.id for row in await repository.find_drifted()]
+
+            await session.execute(update(DietModel).where(DietModel.id == diet["id"]).values(total_calories=1))
+            await session.commit()
+            drifted = [row for row in await repository.find_drifted() if row.id == diet["id"]]
+
+            rebuilt = await repository.rebuild_totals([diet["id"]])
+            after = [row.id for row in await repository.find_drifted()]
+            return before, drifted, rebuilt, after
+
+    before, drifted, rebuilt, after = client.portal.call(scenario)
+
+    assert diet["id"] not in before
+    assert [(row.total_calories, row.calories) for row in drifted] == [(1, 265)]
+    assert rebuilt == 1
+    assert diet["id"] not in after
+    assert totals(client, headers, diet["id"]) == (265, 9, 3.2, 49)
@@ -0,0 +1,90 @@
+import pytest
+from sqlalchemy import delete, update
+
+from src.core.text import TrigramIndex, normalize_text
+from src.db import db, food_search_cache
+from src.db.models import FoodModel
+from src.services.food_search import build_match, vocabulary_cache
+
+
+@pytest.fixture
+def search(client, signup):
+    _, headers = signup()
+
+    def names(query: str, **params) -> list[str]:
+        response = client.get("/food/search", params={"q": query, **params}, headers=headers)
+        assert response.status_code == 200, response.text
+        return [food["name"] for food in response.json()]
+
+    return names
+
+
+@pytest.fixture
+def clear_caches(client):
+    async def clear():
+        await food_search_cache.clear()
+        await vocabulary_cache.clear()
+
+    return lambda: client.portal.call(clear)
+
+
+def test_text_is_normalized_like_the_index():
+    assert normalize_text("Pão de Açúcar!") == "pao de acucar"
+    assert normalize_text("  FEIJÃO-preto ") == "feijao preto"
+
+
+def test_match_expressions():
+    assert build_match([["arroz"], ["integ"]], [True, True]) == '"arroz"* "integ"*'
+    assert build_match([["arroz"], ["integral", "integrar"]], [True, False]) == '"arroz"* ("integral" OR "integrar")'
+
+
+def test_trigram_index_finds_close_terms():
+    index = TrigramIndex(["abacate", "abacaxi", "banana"])
+
+    assert index.has_prefix("abac")
+    assert not index.has_prefix("bao")
+    assert index.closest("abacatte", threshold=0.4)[0] == "abacate"
+    assert index.closest("xyz", threshold=0.4) == []
+
+
+def test_words_are_prefix_matched_ignoring_accents(search, add_food, clear_caches):
+    add_food("Quibebe de Abóbora")
+    add_food("Quibebe de Abóbora com Carne Seca")
+    add_food("Abóbora Cozida")
+    clear_caches()
+
+    assert search("quib abob") == ["Quibebe de Abóbora", "Quibebe de Abóbora com Carne Seca"]
+    assert search("QUIBEBE ABÓB", limit=1) == ["Quibebe de Abóbora"]
+    assert search("!!!") == []
+
+
+def test_misspelled_words_fall_back_to_similar_terms(search, add_food, clear_caches):
+    add_food("Tucupi Temperado")
+    clear_caches()
+
+    assert search("tucupy") == ["Tucupi Temperado"]
+    assert search("tucupy temper") == ["Tucupi Temperado"]
+    assert search("zzzzzz") == []
+
+
+def test_index_follows_renamed_and_deleted_foods(client, search, add_food, clear_caches):
+    food_id = add_food("Jambu Refogado")
+    clear_caches()
+    assert search("jambu") == ["Jambu Refogado"]
+
+    async def rename():
+        async with db.engine.begin() as conn:
+            await conn.execute(update(FoodModel).where(FoodModel.id == food_id).values(name="Maniçoba"))
+
+    client.portal.call(rename)
+    clear_caches()
+    assert search("jambu") == []
+    assert search("manicoba") == ["Maniçoba"]
+
+    async def remove():
+        async with db.engine.begin() as conn:
+            await conn.execute(delete(FoodModel).where(FoodModel.id == food_id))
+
+    client.portal.call(remove)
+    clear_caches()
+    assert search("manicoba") == []
@@ -0,0 +1,56 @@
+import httpx
+import pytest
+
+from benchmarks.load import Traffic, compare, parse_mix, percentile, replay
+from src.api import app
+from tests.conftest import ADMIN_EMAIL, run
+
+
+def test_percentile_picks_the_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.50) == 51.0
+    assert percentile(values, 0.95) == 95.0
+    assert percentile(values, 1.0) == 100.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_mix_is_parsed_and_validated():
+    assert parse_mix("me=60, list=40") == {"me": 60.0, "list": 40.0}
+
+    with pytest.raises(SystemExit):
+        parse_mix("unknown=1")
+
+
+def test_compare_flags_latency_and_throughput_regressions():
+    baseline = {"me": {"p95_ms": 10.0, "throughput": 100.0}, "list": {"p95_ms": 10.0, "throughput": 100.0}}
+    results = {
+        "me": {"p95_ms": 12.0, "throughput": 90.0},
+        "list": {"p95_ms": 20.0, "throughput": 50.0},
+        "signup": {"p95_ms": 99.0, "throughput": 1.0},
+    }
+
+    regressions = compare(results, baseline, tolerance=0.25)
+
+    assert len(regressions) == 2
+    assert all(regression.startswith("list:") for regression in regressions)
+
+
+def test_replay_reports_every_scenario_without_errors():
+    async def scenario():
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                await client.post("/user/", json={"name": "Admin", "email": ADMIN_EMAIL, "password": "secret"})
+                login = await client.post("/user/login", json={"email": ADMIN_EMAIL, "password": "secret"})
+
+            traffic = Traffic([login.json()["user"]])
+            return await replay(traffic, {"me": 1, "list": 1}, requests=20, concurrency=4)
+
+    results = run(scenario())
+
+    assert results["total"]["count"] == 20
+    assert results["total"]["errors"] == 0
+    assert results["me"]["count"] + results["list"]["count"] == 20
+    assert results["total"]["p50_ms"] <= results["total"]["p95_ms"] <= results["total"]["p99_ms"]
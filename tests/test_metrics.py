@@ -0,0 +1,73 @@
+import pytest
+
+from src.core.metrics import Counter, Histogram, MetricsRegistry, RequestTimings, record_phase, request_timings
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = Histogram("latency", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value, "/a")
+
+    assert histogram.render().splitlines()[2:] == [
+        'latency_bucket{route="/a",le="0.1"} 1',
+        'latency_bucket{route="/a",le="1.0"} 3',
+        'latency_bucket{route="/a",le="+Inf"} 4',
+        'latency_sum{route="/a"} 6.05',
+        'latency_count{route="/a"} 4',
+    ]
+
+
+def test_label_values_are_escaped():
+    counter = Counter("total", "Total.", ("path",))
+    counter.inc('a"b\\c')
+
+    assert 'total{path="a\\"b\\\\c"} 1' in counter.render()
+
+
+def test_phases_are_recorded_only_inside_a_request():
+    record_phase("database", 1.0)
+    timings = RequestTimings()
+    token = request_timings.set(timings)
+
+    try:
+        record_phase("database", 0.25)
+        record_phase("database", 0.25)
+    finally:
+        request_timings.reset(token)
+
+    assert timings.phases == {"database": 0.5}
+
+
+def test_registry_records_requests_and_phases():
+    registry = MetricsRegistry()
+    timings = RequestTimings()
+    timings.phases["password_hash"] = 0.2
+    registry.observe_request("POST", "/user/login", 200, 0.3, timings)
+    rendered = registry.render()
+
+    assert 'http_requests_total{method="POST",route="/user/login",status="200"} 1' in rendered
+    assert 'http_request_duration_seconds_count{method="POST",route="/user/login"} 1' in rendered
+    assert 'http_request_phase_duration_seconds_count{method="POST",route="/user/login",phase="password_hash"} 1' in rendered
+
+
+def test_metrics_endpoint_labels_requests_by_route_template(client, signup, admin_headers):
+    _, headers = signup()
+    client.get("/diet/missing-diet", headers=headers)
+    client.get("/does-not-exist")
+    response = client.get("/metrics", headers=admin_headers)
+
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'route="/diet/{diet_id}",status="404"' in response.text
+    assert "missing-diet" not in response.text
+    assert 'route="unmatched",status="404"' in response.text
+    assert "http_requests_in_flight" in response.text
+    assert 'phase="password_hash"' in response.text
+
+
+@pytest.mark.parametrize("path", ["/metrics", "/health/cache", "/health/database", "/health/startup", "/health/queries"])
+def test_diagnostics_are_restricted_to_administrators(client, signup, path):
+    _, headers = signup()
+
+    assert client.get(path).status_code == 401
+    assert client.get(path, headers=headers).status_code == 403
@@ -0,0 +1,124 @@
+import pytest
+from sqlalchemy import inspect, text
+
+from src.core import DatabaseHandler
+from src.core.database import BaseModel
+from src.db.migrations import MIGRATIONS, Migrator, SchemaVersionError
+from tests.conftest import run
+
+DIETS = [
+    # user, date, calories, proteins
+    ("u1", "2026-09-06 20:00:00", 100, 10),  # Sunday
+    ("u1", "2026-09-07 08:00:00", 200, 20),  # Monday
+    ("u1", "2026-09-07 19:00:00", 50, 5),
+    ("u2", "2026-09-08 12:00:00", 70, 7),
+]
+
+
+def test_upgrade_applies_pending_migrations_once(tmp_path):
+    handler = DatabaseHandler(f"sqlite+aiosqlite:///{tmp_path}/migrations.db")
+    migrator = Migrator(handler, MIGRATIONS)
+
+    async def scenario():
+        partial = await migrator.upgrade(target=2)
+
+        with pytest.raises(SchemaVersionError):
+            await migrator.check()
+
+        rest = await migrator.upgrade()
+        await migrator.check()
+        again = await migrator.upgrade()
+        version = await migrator.current_version()
+        await handler.close()
+        return partial, rest, again, version
+
+    partial, rest, again, version = run(scenario())
+
+    assert [migration.version for migration in partial] == [1, 2]
+    assert [migration.version for migration in rest] == [migration.version for migration in MIGRATIONS[2:]]
+    assert again == []
+    assert version == MIGRATIONS[-1].version
+
+
+def test_migrations_build_the_schema_the_models_declare(tmp_path):
+    handler = DatabaseHandler(f"sqlite+aiosqlite:///{tmp_path}/schema.db")
+
+    def read_schema(sync_conn):
+        inspector = inspect(sync_conn)
+        return {
+            table: (
+                {column["name"] for column in inspector.get_columns(table)},
+                {index["name"] for index in inspector.get_indexes(table)},
+            )
+            for table in inspector.get_table_names()
+        }
+
+    async def scenario():
+        await Migrator(handler, MIGRATIONS).upgrade()
+
+        async with handler.engine.connect() as conn:
+            schema = await conn.run_sync(read_schema)
+
+        await handler.close()
+        return schema
+
+    schema = run(scenario())
+
+    for table in BaseModel.metadata.sorted_tables:
+        columns, indexes = schema[table.name]
+
+        assert columns == {column.name for column in table.columns}, table.name
+        assert {index.name for index in table.indexes} <= indexes, table.name
+
+
+def test_rollup_migration_backfills_days_and_weeks_in_sql(tmp_path, monkeypatch):
+    # One user per transaction, so each of the two users is summed in a batch of its own.
+    monkeypatch.setattr("src.db.migrations.m0003_nutrient_rollups.BACKFILL_BATCH_SIZE", 1)
+    handler = DatabaseHandler(f"sqlite+aiosqlite:///{tmp_path}/backfill.db")
+    migrator = Migrator(handler, MIGRATIONS)
+
+    async def scenario():
+        await migrator.upgrade(target=2)
+
+        async with handler.engine.begin() as conn:
+            for user_id in ("u1", "u2"):
+                await conn.execute(
+                    text("INSERT INTO users (id, name, email, password) VALUES (:id, 'User', :id, 'x')"),
+                    {"id": user_id}
+                )
+
+            for index, (user_id, date, calories, proteins) in enumerate(DIETS):
+                await conn.execute(
+                    text(
+                        "INSERT INTO diets (id, user_id, date, duration, total_calories, total_proteins, "
+                        "total_fats, total_carbohydrates, total_water) "
+                        "VALUES (:id, :user_id, :date, 1, :calories, :proteins, 0, 0, 0)"
+                    ),
+                    {"id": str(index), "user_id": user_id, "date": date, "calories": calories, "proteins": proteins}
+                )
+
+        await migrator.upgrade(target=3)
+
+        async with handler.engine.connect() as conn:
+            daily = (await conn.execute(text(
+                "SELECT user_id, day, calories, proteins FROM nutrient_daily_rollups ORDER BY user_id, day"
+            ))).all()
+            weekly = (await conn.execute(text(
+                "SELECT user_id, week_start, calories, proteins FROM nutrient_weekly_rollups ORDER BY user_id, week_start"
+            ))).all()
+
+        await handler.close()
+        return daily, weekly
+
+    daily, weekly = run(scenario())
+
+    assert [tuple(row) for row in daily] == [
+        ("u1", "2026-09-06", 100, 10),
+        ("u1", "2026-09-07", 250, 25),
+        ("u2", "2026-09-08", 70, 7),
+    ]
+    assert [tuple(row) for row in weekly] == [
+        ("u1", "2026-08-31", 100, 10),
+        ("u1", "2026-09-07", 250, 25),
+        ("u2", "2026-09-07", 70, 7),
+    ]
@@ -0,0 +1,94 @@
+from collections import namedtuple
+from datetime import datetime
+
+import pytest
+
+from src.core.nutrition import NutritionEngine
+from src.db import db
+from src.db.repositories import NutritionalDataRepository
+from src.services.diet import summarize_diets
+from tests.conftest import run
+
+Diet = namedtuple("Diet", "id date")
+Meal = namedtuple("Meal", "diet_id type is_completed calories proteins fats carbohydrates")
+Measurement = namedtuple("Measurement", "evaluation_date weight height")
+
+GROUPS = [0, 1, 0, 2, 0]
+COLUMNS = [[100.0, 200.0, 50.0, 10.0, 25.0], [10.0, 5.0, 2.5, 1.0, 0.5]]
+FACTORS = [1.0, 0.0, 2.0, 1.0, 1.0]
+
+
+def test_float_engine():
+    engine = NutritionEngine(use_numpy=False)
+
+    assert engine.group_totals(GROUPS, COLUMNS, 4) == [[175.0, 13.0], [200.0, 5.0], [10.0, 1.0], [0.0, 0.0]]
+    assert engine.group_totals(GROUPS, COLUMNS, 4, FACTORS) == [[225.0, 15.5], [0.0, 0.0], [10.0, 1.0], [0.0, 0.0]]
+    assert engine.energy_distribution([10, 0], [10, 0], [20, 0]) == [[19.05, 42.86, 38.1], [0.0, 0.0, 0.0]]
+    assert engine.body_mass_index([70, 80], [175, 0]) == [22.86, 0.0]
+
+
+def test_numpy_engine_matches_the_float_engine():
+    pytest.importorskip("numpy")
+    floats, arrays = NutritionEngine(use_numpy=False), NutritionEngine(use_numpy=True)
+
+    assert arrays.group_totals(GROUPS, COLUMNS, 4) == floats.group_totals(GROUPS, COLUMNS, 4)
+    assert arrays.group_totals(GROUPS, COLUMNS, 4, FACTORS) == floats.group_totals(GROUPS, COLUMNS, 4, FACTORS)
+    assert arrays.group_totals([], [[], []], 2) == floats.group_totals([], [[], []], 2)
+    assert arrays.energy_distribution([10, 0], [10, 0], [20, 0]) == floats.energy_distribution([10, 0], [10, 0], [20, 0])
+    assert arrays.body_mass_index([70, 80], [175, 0]) == floats.body_mass_index([70, 80], [175, 0])
+
+
+def test_summaries_group_meals_per_diet_and_type():
+    diets = [Diet("d1", datetime(2025, 3, 1)), Diet("d2", datetime(2025, 3, 5)), Diet("d3", datetime(2025, 3, 9))]
+    meals = [
+        Meal("d1", "lunch", True, 100.0, 10.0, 0.0, 0.0),
+        Meal("d1", "lunch", False, 50.0, 0.0, 0.0, 10.0),
+        Meal("d1", "dinner", True, 90.0, 0.0, 10.0, 0.0),
+        Meal("d3", "lunch", True, 40.0, 0.0, 0.0, 10.0),
+    ]
+    measurements = [
+        Measurement(datetime(2025, 3, 2), 70.0, 175.0),
+        Measurement(datetime(2025, 3, 9, 18), 80.0, 175.0),
+    ]
+
+    first, second, third = summarize_diets(diets, meals, measurements, engine=NutritionEngine(use_numpy=False))
+
+    assert first.planned.calories == 240 and first.completed.calories == 190
+    assert first.energy_distribution.proteins == pytest.approx(23.53)
+    assert [(meal.type, meal.meals, meal.completed_meals) for meal in first.meals] == [("lunch", 2, 1), ("dinner", 1, 1)]
+    assert second.meals == [] and second.planned.calories == 0
+    assert (first.body_mass_index, second.body_mass_index, third.body_mass_index) == (None, 22.86, 26.12)
+
+
+def test_summary_endpoint_reports_the_latest_body_mass_index(client, signup, add_food, add_evaluation):
+    user, headers = signup()
+    add_evaluation(user["id"], weight=90, height=180, evaluation_date=datetime(2025, 2, 1))
+    add_evaluation(user["id"], weight=81, height=180, evaluation_date=datetime(2025, 3, 1))
+    diet = client.post("/diet/", json={"date": "2025-03-15T12:00:00"}, headers=headers).json()
+    meal = {"food_id": add_food("Tapioca", calories=240, proteins=0, fats=0, carbohydrates=60), "type": "breakfast"}
+    client.post(f"/diet/{diet['id']}/meals", json=meal, headers=headers)
+
+    summary = client.get(f"/diet/{diet['id']}/summary", headers=headers).json()
+    summaries = client.get("/diet/summary", params={"start": "2025-03-01", "end": "2025-03-31"}, headers=headers).json()
+
+    assert summary["body_mass_index"] == 25.0
+    assert summary["planned"]["calories"] == 240 and summary["completed"]["calories"] == 0
+    assert summary["energy_distribution"]["carbohydrates"] == 100
+    assert summaries == [summary]
+
+
+def test_measurements_cover_the_period_and_the_evaluation_before_it(signup, add_evaluation):
+    user, _ = signup()
+
+    for month in (1, 2, 3, 4, 5):
+        add_evaluation(user["id"], weight=70 + month, height=175, evaluation_date=datetime(2025, month, 1))
+
+    async def measurements(start, end):
+        async with db.async_session() as session:
+            return await NutritionalDataRepository(session).get_measurements(user["id"], start, end)
+
+    in_period = run(measurements(datetime(2025, 3, 15), datetime(2025, 4, 15)))
+    before_any = run(measurements(datetime(2024, 12, 1), datetime(2025, 1, 15)))
+
+    assert [row.evaluation_date for row in in_period] == [datetime(2025, 3, 1), datetime(2025, 4, 1)]
+    assert [row.weight for row in before_any] == [71]
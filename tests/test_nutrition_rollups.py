@@ -0,0 +1,59 @@
+from datetime import date
+
+from sqlalchemy import delete
+
+from src.db import db
+from src.db.models import NutrientDailyRollupModel, NutrientWeeklyRollupModel
+from src.db.repositories import NutrientRollupRepository
+from src.db.repositories.nutrient_rollup import week_start
+
+
+def eat(client, headers, food_id: str, day: str) -> None:
+    diet = client.post("/diet/", json={"date": f"{day}T12:00:00"}, headers=headers).json()
+    meal = {"food_id": food_id, "type": "lunch", "is_completed": True}
+    assert client.post(f"/diet/{diet['id']}/meals", json=meal, headers=headers).status_code == 200
+
+
+def test_week_start_is_the_monday():
+    assert week_start(date(2025, 3, 10)) == date(2025, 3, 10)
+    assert week_start(date(2025, 3, 16)) == date(2025, 3, 10)
+    assert week_start(date(2025, 3, 17)) == date(2025, 3, 17)
+
+
+def test_rollups_sum_the_completed_meals_per_day_and_week(client, signup, add_food):
+    user, headers = signup()
+    food = add_food("Iogurte", calories=60, proteins=3, fats=3, carbohydrates=5)
+
+    for day in ("2025-03-10", "2025-03-10", "2025-03-12", "2025-03-17"):
+        eat(client, headers, food, day)
+
+    params = {"start": "2025-03-11", "end": "2025-03-17"}
+    daily = client.get("/nutrition/daily", params=params, headers=headers).json()
+    weekly = client.get("/nutrition/weekly", params=params, headers=headers).json()
+
+    assert [(row["day"], row["calories"]) for row in daily] == [("2025-03-12", 60), ("2025-03-17", 60)]
+    assert [(row["week_start"], row["calories"], row["proteins"]) for row in weekly] == [
+        ("2025-03-10", 180, 9),
+        ("2025-03-17", 60, 3),
+    ]
+
+    async def rebuild():
+        async with db.async_session() as session:
+            for model in (NutrientDailyRollupModel, NutrientWeeklyRollupModel):
+                await session.execute(delete(model).where(model.user_id == user["id"]))
+            await session.commit()
+            return await NutrientRollupRepository(session).rebuild([user["id"]])
+
+    assert client.portal.call(rebuild) == 1
+    assert client.get("/nutrition/daily", params=params, headers=headers).json() == daily
+    assert client.get("/nutrition/weekly", params=params, headers=headers).json() == weekly
+
+
+def test_rollups_reject_invalid_ranges(client, signup):
+    _, headers = signup()
+
+    response = client.get("/nutrition/daily", params={"start": "2025-03-12", "end": "2025-03-10"}, headers=headers)
+    assert response.status_code == 400
+
+    response = client.get("/nutrition/weekly", params={"start": "2020-01-01", "end": "2025-01-01"}, headers=headers)
+    assert response.status_code == 400
@@ -0,0 +1,66 @@
+import logging
+
+from src.core.profiler import QueryProfiler, fingerprint, redact_parameters
+
+
+def test_fingerprint_replaces_literals_and_parameter_lists():
+    assert fingerprint("SELECT * FROM users  WHERE name = 'O''Brien' AND age > 30") == (
+        "SELECT * FROM users WHERE name = ? AND age > ?"
+    )
+    assert fingerprint("SELECT * FROM foods WHERE id IN (?, ?, ?)") == fingerprint(
+        "SELECT * FROM foods WHERE id IN (?)"
+    )
+    assert fingerprint("SELECT * FROM t LIMIT :limit_1") == "SELECT * FROM t LIMIT :limit_1"
+
+
+def test_parameters_are_redacted_to_type_names():
+    assert redact_parameters(("secret@example.com", 3)) == ("str", "int")
+    assert redact_parameters({"email": "secret@example.com"}) == {"email": "str"}
+    assert redact_parameters([("a",), ("b",)]) == "<2 parameter sets>"
+
+
+def test_slow_queries_are_logged_without_values(caplog):
+    profiler = QueryProfiler(slow_threshold=0.1, repeat_threshold=0)
+
+    with caplog.at_level(logging.WARNING, logger="src.core.profiler"):
+        profiler.observe("SELECT * FROM users WHERE email = ?", ("secret@example.com",), 0.05)
+        profiler.observe("SELECT * FROM users WHERE email = ?", ("secret@example.com",), 0.5)
+
+    assert len(caplog.records) == 1
+    assert "Slow query" in caplog.text
+    assert "secret@example.com" not in caplog.text
+
+
+def test_repeated_statements_in_a_request_are_flagged(caplog):
+    profiler = QueryProfiler(slow_threshold=0, repeat_threshold=3)
+    token = profiler.start_request()
+
+    for meal_id in range(5):
+        profiler.observe(f"SELECT * FROM meals WHERE id = {meal_id}", (), 0.001)
+    profiler.observe("SELECT * FROM diets", (), 0.001)
+
+    with caplog.at_level(logging.WARNING, logger="src.core.profiler"):
+        queries = profiler.finish_request(token, "GET /diet/{diet_id}")
+
+    assert queries["SELECT * FROM meals WHERE id = ?"].count == 5
+    assert len(caplog.records) == 1
+    assert "Possible N+1 on GET /diet/{diet_id}" in caplog.text
+
+
+def test_totals_are_ranked_and_bounded():
+    profiler = QueryProfiler(slow_threshold=0, repeat_threshold=0, max_fingerprints=2)
+    profiler.observe("SELECT 1 FROM a", (), 0.1)
+    profiler.observe("SELECT 1 FROM b", (), 0.3)
+    profiler.observe("SELECT 1 FROM c", (), 0.5)
+
+    assert [stats["fingerprint"] for stats in profiler.top()] == ["SELECT ? FROM b", "SELECT ? FROM a"]
+    assert profiler.top(limit=1)[0]["count"] == 1
+
+
+def test_query_stats_endpoint_reports_the_application_statements(client, signup, admin_headers):
+    signup()
+    stats = client.get("/health/queries", params={"limit": 5}, headers=admin_headers).json()
+
+    assert 0 < len(stats) <= 5
+    assert {"fingerprint", "count", "total", "max"} <= set(stats[0])
+    assert stats == sorted(stats, key=lambda item: item["total"], reverse=True)
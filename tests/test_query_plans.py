@@ -0,0 +1,45 @@
+import re
+
+import pytest
+
+from benchmarks.query_plans import FULL_SCAN, HOT_QUERIES
+from src.db import db
+from tests.conftest import run
+
+# The index each hot query must search with, on the schema built by the migrations.
+EXPECTED_INDEXES = {
+    "users page": "ix_users_created_at_id",
+    "user diets in range": "ix_diets_user_id_date",
+    "user trains in range": "ix_trains_user_id_date",
+    "exercise trains": "ix_trains_exercise_id",
+    "diet meals": "ix_meals_diet_id",
+    "food meals": "ix_meals_food_id",
+    "latest nutritional data": "ix_nutritional_data_user_id_evaluation_date",
+    "user medical history": "ix_medical_history_user_id",
+    "foods in range": "ix_foods_consumption_date",
+}
+
+
+def explain(query) -> list[str]:
+    async def plan():
+        async with db.engine.connect() as conn:
+            compiled = query.compile(dialect=conn.dialect)
+            params = tuple(None for _ in compiled.positiontup)
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled.string}", params)
+            return [row[-1] for row in result]
+
+    return run(plan())
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_queries_never_scan_a_whole_table(name):
+    details = explain(HOT_QUERIES[name])
+
+    assert not [detail for detail in details if FULL_SCAN.match(detail)], details
+
+
+@pytest.mark.parametrize("name, index", EXPECTED_INDEXES.items())
+def test_hot_queries_use_the_new_indexes(name, index):
+    details = explain(HOT_QUERIES[name])
+
+    assert any(re.search(rf"USING (COVERING )?INDEX {index}\b", detail) for detail in details), details
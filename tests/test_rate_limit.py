@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from src.core import security
+from src.core.rate_limit import MemoryRateLimitStore, RateLimiter
+
+
+def test_store_allows_limit_attempts_per_window():
+    async def scenario():
+        store = MemoryRateLimitStore(max_keys=10)
+        allowed = [await store.hit("key", limit=3, window=60) for _ in range(4)]
+        other = await store.hit("other", limit=3, window=60)
+        return allowed, other
+
+    allowed, other = asyncio.run(scenario())
+
+    assert allowed[:3] == [0.0, 0.0, 0.0]
+    assert 0 < allowed[3] <= 60
+    assert other == 0.0
+
+
+def test_store_forgets_attempts_outside_the_window():
+    async def scenario():
+        store = MemoryRateLimitStore(max_keys=10)
+        await store.hit("key", limit=1, window=0.05)
+        blocked = await store.hit("key", limit=1, window=0.05)
+        await asyncio.sleep(0.06)
+        return blocked, await store.hit("key", limit=1, window=0.05)
+
+    blocked, allowed = asyncio.run(scenario())
+
+    assert blocked > 0
+    assert allowed == 0.0
+
+
+def test_store_drops_the_least_recently_used_keys():
+    async def scenario():
+        store = MemoryRateLimitStore(max_keys=2)
+        await store.hit("a", limit=1, window=60)
+        await store.hit("b", limit=1, window=60)
+        await store.hit("a", limit=1, window=60)
+        await store.hit("c", limit=1, window=60)
+        return list(store._data)
+
+    assert asyncio.run(scenario()) == ["a", "c"]
+
+
+def test_limiter_raises_429_with_retry_after():
+    async def scenario():
+        limiter = RateLimiter(MemoryRateLimitStore(max_keys=10), name="test", limit=1, window=60)
+        await limiter.check("client")
+
+        with pytest.raises(HTTPException) as error:
+            await limiter.check("client")
+
+        await limiter.reset("client")
+        await limiter.check("client")
+        return error.value
+
+    error = asyncio.run(scenario())
+
+    assert error.status_code == 429
+    assert 0 < int(error.headers["Retry-After"]) <= 60
+
+
+def test_limiter_with_zero_limit_is_disabled():
+    async def scenario():
+        limiter = RateLimiter(MemoryRateLimitStore(max_keys=10), name="test", limit=0, window=60)
+
+        for _ in range(5):
+            await limiter.check("client")
+
+    asyncio.run(scenario())
+
+
+def test_login_is_limited_per_email(client, signup, monkeypatch):
+    user, _ = signup()
+    monkeypatch.setattr(security.login_email_limiter, "limit", 2)
+    wrong = {"email": user["email"], "password": "wrong"}
+
+    statuses = [client.post("/user/login", json=wrong).status_code for _ in range(3)]
+
+    assert statuses == [401, 401, 429]
+    assert "Retry-After" in client.post("/user/login", json=wrong).headers
+
+
+def test_successful_login_resets_the_email_limit(client, signup, monkeypatch):
+    user, _ = signup()
+    monkeypatch.setattr(security.login_email_limiter, "limit", 2)
+
+    assert client.post("/user/login", json={"email": user["email"], "password": "wrong"}).status_code == 401
+    assert client.post("/user/login", json={"email": user["email"], "password": "secret"}).status_code == 200
+    assert client.post("/user/login", json={"email": user["email"], "password": "wrong"}).status_code == 401
+    assert client.post("/user/login", json={"email": user["email"], "password": "wrong"}).status_code == 401
+
+
+def test_unknown_emails_are_verified_against_a_dummy_hash(client, monkeypatch):
+    verified = []
+    verify = security.SecurityHandler.verify_password_async
+
+    async def spy(password, hashed):
+        verified.append(hashed)
+        return await verify(password, hashed)
+
+    monkeypatch.setattr(security.SecurityHandler, "verify_password_async", spy)
+    response = client.post("/user/login", json={"email": "nobody@example.com", "password": "secret"})
+
+    assert response.status_code == 404
+    assert verified == [security._dummy_password_hash]
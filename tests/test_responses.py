@@ -0,0 +1,44 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from src.api.responses import PydanticJSONResponse, StandardJSONResponse, get_response_class
+from src.schemas import UserPage, UserResponse
+
+USER = UserResponse(
+    id="id",
+    name="Ana",
+    email="ana@example.com",
+    created_at=datetime(2025, 1, 1),
+    updated_at=datetime(2025, 1, 2),
+)
+
+
+@pytest.mark.parametrize("response_class", [StandardJSONResponse, PydanticJSONResponse])
+def test_validated_schemas_render_like_fastapi(response_class):
+    page = UserPage(items=[USER], next_cursor="next")
+    body = json.loads(response_class(page).body)
+
+    assert body == page.model_dump(mode="json")
+    assert json.loads(response_class([USER]).body) == [USER.model_dump(mode="json")]
+
+
+def test_orjson_and_pydantic_encoders_match():
+    pytest.importorskip("orjson")
+    page = UserPage(items=[USER], next_cursor=None)
+
+    assert json.loads(get_response_class("orjson")(page).body) == json.loads(PydanticJSONResponse(page).body)
+
+
+def test_unknown_response_classes_are_rejected():
+    with pytest.raises(ValueError):
+        get_response_class("yaml")
+
+
+def test_routes_use_the_selected_response_class(client, signup):
+    user, headers = signup()
+    response = client.get("/user/", headers=headers)
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == user
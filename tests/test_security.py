@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from src.core import SecurityHandler, settings
+from src.core.workers import WorkerPool
+
+
+def test_hash_and_verify_run_on_the_pool():
+    async def scenario():
+        hashed = await SecurityHandler.hash_password_async("secret")
+        return (
+            hashed,
+            await SecurityHandler.verify_password_async("secret", hashed),
+            await SecurityHandler.verify_password_async("wrong", hashed),
+        )
+
+    hashed, valid, invalid = asyncio.run(scenario())
+
+    assert valid and not invalid
+    assert not SecurityHandler.password_needs_rehash(hashed)
+
+
+def test_password_needs_rehash_on_other_work_factors():
+    stronger = SecurityHandler.hash_password("secret", rounds=settings.BCRYPT_ROUNDS + 1)
+
+    assert SecurityHandler.password_needs_rehash(stronger)
+    assert SecurityHandler.password_needs_rehash("not-a-bcrypt-hash")
+
+
+def test_worker_pool_rejects_when_saturated():
+    pool = WorkerPool(max_workers=1, max_pending=1)
+
+    async def scenario():
+        running = asyncio.ensure_future(pool.run(time.sleep, 0.2))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(HTTPException) as error:
+            await pool.run(time.sleep, 0)
+
+        await running
+        return error.value.status_code
+
+    try:
+        assert asyncio.run(scenario()) == 503
+        assert pool.pending == 0
+    finally:
+        pool.shutdown()
+
+
+def test_worker_pool_map_keeps_order():
+    pool = WorkerPool(max_workers=2, max_pending=1)
+
+    try:
+        assert asyncio.run(pool.map(abs, [-3, 2, -1, 0, -5])) == [3, 2, 1, 0, 5]
+    finally:
+        pool.shutdown()
@@ -0,0 +1,43 @@
+import pytest
+
+from src import server
+from src.core import settings
+
+
+@pytest.fixture
+def uvicorn_options(monkeypatch):
+    options = {}
+    monkeypatch.setattr(server.uvicorn, "run", lambda app, **kwargs: options.update(app=app, **kwargs))
+    return options
+
+
+@pytest.mark.parametrize("workers, max_requests, expected", [(4, 1000, 1000), (1, 1000, None), (4, 0, None)])
+def test_max_requests_only_applies_under_a_supervisor(monkeypatch, uvicorn_options, workers, max_requests, expected):
+    monkeypatch.setattr(settings, "SERVER_WORKERS", workers)
+    monkeypatch.setattr(settings, "SERVER_MAX_REQUESTS", max_requests)
+
+    server.run()
+
+    assert uvicorn_options["app"] == "src.api:app"
+    assert uvicorn_options["workers"] == workers
+    assert uvicorn_options["limit_max_requests"] == expected
+
+
+def test_worker_count_defaults_to_the_available_cpus(monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_WORKERS", 0)
+    monkeypatch.setattr(server.os, "process_cpu_count", lambda: 6)
+
+    assert server.worker_count() == 6
+
+
+def test_auto_loop_and_parser_follow_the_installed_packages(monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_LOOP", "auto")
+    monkeypatch.setattr(settings, "SERVER_HTTP", "auto")
+    monkeypatch.setattr(server.importlib.util, "find_spec", lambda name: None)
+
+    assert (server.event_loop(), server.http_parser()) == ("asyncio", "h11")
+
+    monkeypatch.setattr(server.importlib.util, "find_spec", lambda name: object())
+
+    assert (server.event_loop(), server.http_parser()) == ("uvloop", "httptools")
+
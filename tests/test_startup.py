@@ -0,0 +1,28 @@
+import pytest
+
+from src.core import DatabaseHandler
+from src.startup import StartupTimer
+
+
+def test_engine_is_created_on_first_use(tmp_path):
+    handler = DatabaseHandler(f"sqlite+aiosqlite:///{tmp_path}/lazy.db")
+
+    assert handler._engine is None
+    assert handler.engine is handler.engine
+
+
+def test_startup_timer_records_consecutive_phases():
+    timer = StartupTimer()
+    timer.mark("imports")
+    timer.mark("database pool")
+    report = timer.report()
+
+    assert list(report["phases"]) == ["imports", "database pool"]
+    assert report["total"] == pytest.approx(sum(report["phases"].values()))
+
+
+def test_lifespan_reports_every_startup_phase(client, admin_headers):
+    report = client.get("/health/startup", headers=admin_headers).json()
+
+    assert {"imports", "database pool", "schema check", "statement cache", "food catalog"} <= set(report["phases"])
+    assert report["total"] >= 0
@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from src.db.models import UserModel
+from src.schemas import NutrientTotalsResponse, UserResponse
+
+USER = UserResponse(
+    id="id",
+    name="Ana",
+    email="ana@example.com",
+    created_at=datetime(2025, 1, 1),
+    updated_at=datetime(2025, 1, 2),
+)
+
+
+def test_schema_to_dict_skips_excluded_and_empty_fields():
+    data = USER.to_dict(exclude=["email"], include={"extra": 1})
+
+    assert "email" not in data and "gender" not in data
+    assert data["name"] == "Ana" and data["extra"] == 1
+
+
+def test_schema_to_dicts_matches_to_dict():
+    users = [USER, USER.model_copy(update={"id": "other", "city": "Recife"})]
+
+    assert UserResponse.to_dicts(users, exclude=["email"]) == [user.to_dict(exclude=["email"]) for user in users]
+
+
+def test_schema_from_dicts_validates_every_item():
+    totals = NutrientTotalsResponse.from_dicts([{"calories": 1, "proteins": 2, "fats": 3, "carbohydrates": 4}])
+
+    assert totals == [NutrientTotalsResponse(calories=1, proteins=2, fats=3, carbohydrates=4)]
+
+
+def test_model_column_keys_are_computed_once():
+    keys = UserModel.column_keys()
+
+    assert keys is UserModel.column_keys()
+    assert keys[0] == "id" and "password" in keys
+
+
+def test_model_to_dict_and_to_dicts_agree():
+    model = UserModel(id="id", name="Ana", email="ana@example.com", password="hash")
+
+    data = model.to_dict(exclude=["password"], exclude_none=True)
+
+    assert data == {"id": "id", "name": "Ana", "email": "ana@example.com"}
+    assert UserModel.to_dicts([model], exclude=["password"], exclude_none=True) == [data]
+    assert set(model.to_dict()) == set(UserModel.column_keys())
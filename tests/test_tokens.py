@@ -0,0 +1,71 @@
+from time import time
+
+import pytest
+from fastapi import HTTPException
+
+from src.core import SecurityHandler
+from src.core.security import token_cache
+from src.core.tokens import HmacTokenCodec, InvalidTokenError, JoseTokenCodec, TokenCache, get_token_codec
+
+SECRET = "test-secret"
+
+
+def test_hmac_and_jose_tokens_are_interchangeable():
+    hmac_codec, jose_codec = HmacTokenCodec(SECRET, "HS256"), JoseTokenCodec(SECRET, "HS256")
+    claims = {"sub": "user", "exp": int(time()) + 60}
+
+    assert jose_codec.decode(hmac_codec.encode(claims)) == claims
+    assert hmac_codec.decode(jose_codec.encode(claims)) == claims
+
+
+@pytest.mark.parametrize("codec", [HmacTokenCodec(SECRET, "HS256"), JoseTokenCodec(SECRET, "HS256")])
+def test_codecs_reject_bad_tokens(codec):
+    token = codec.encode({"sub": "user", "exp": int(time()) + 60})
+    expired = codec.encode({"sub": "user", "exp": int(time()) - 1})
+    header, payload, signature = token.split(".")
+    forged = HmacTokenCodec("other-secret", "HS256").encode({"sub": "user"})
+
+    for bad in (expired, f"{header}.{payload}.{signature[::-1]}", forged, "not-a-token"):
+        with pytest.raises(InvalidTokenError):
+            codec.decode(bad)
+
+
+def test_hmac_codec_rejects_other_algorithms():
+    token = HmacTokenCodec(SECRET, "HS512").encode({"sub": "user"})
+
+    with pytest.raises(InvalidTokenError):
+        HmacTokenCodec(SECRET, "HS256").decode(token)
+
+    with pytest.raises(ValueError):
+        get_token_codec("hmac", SECRET, "RS256")
+
+
+def test_token_cache_expires_with_the_token_and_is_bounded():
+    cache = TokenCache(max_size=2)
+    cache.set("expired", {"exp": time() - 1})
+    cache.set("a", {"sub": "a"})
+    cache.set("b", {"sub": "b"})
+
+    assert cache.get("expired") is None
+    assert cache.get("a") == {"sub": "a"}
+
+    cache.set("c", {"sub": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("c") == {"sub": "c"}
+
+
+def test_decode_reuses_verified_claims():
+    token_cache.clear()
+    token = SecurityHandler.create_jwt_token({"sub": "user"})
+
+    claims = SecurityHandler.decode_jwt_token(token)
+    claims["sub"] = "changed"
+
+    assert token_cache.get(token)["sub"] == "user"
+    assert SecurityHandler.decode_jwt_token(token)["sub"] == "user"
+
+    with pytest.raises(HTTPException) as error:
+        SecurityHandler.decode_jwt_token(token + "x")
+
+    assert error.value.status_code == 401
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from src.api.dependencies import get_current_user
+from src.core import CacheBackend, MemoryCache
+from src.db import db, user_cache
+from src.db.repositories import UserRepository
+from src.services import UserService
+from tests.conftest import run
+
+
+def test_memory_cache_expires_and_evicts_least_recently_used(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("src.core.cache.monotonic", lambda: clock[0])
+    cache = MemoryCache(max_size=2, ttl=5)
+
+    async def scenario():
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+        evicted = await cache.get("b")
+        clock[0] += 5
+        return evicted, await cache.get("a")
+
+    assert asyncio.run(scenario()) == (None, None)
+    assert cache.stats()["hits"] == 1
+
+
+def test_cache_backends_must_implement_the_storage_methods():
+    class ReadOnlyCache(CacheBackend):
+        async def _get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        ReadOnlyCache()
+
+
+def test_current_user_is_served_from_the_cache(client, signup):
+    user, headers = signup()
+    asyncio.run(user_cache.clear())
+
+    assert client.get("/user/", headers=headers).status_code == 200
+    hits = user_cache.hits
+
+    assert client.get("/user/", headers=headers).json() == user
+    assert user_cache.hits == hits + 1
+
+
+def test_updates_evict_the_cached_user(client, signup):
+    user, headers = signup()
+    client.get("/user/", headers=headers)
+
+    async def rename():
+        async with db.async_session() as session:
+            await UserRepository(session).update(user["id"], {"name": "Renamed"})
+
+    run(rename())
+
+    assert client.get("/user/", headers=headers).json()["name"] == "Renamed"
+
+
+def test_user_read_during_an_eviction_is_not_cached(client, signup, monkeypatch):
+    user, headers = signup()
+    token = headers["Authorization"].removeprefix("Bearer ")
+    get_user_by_id = UserService.get_user_by_id
+
+    async def get_user_while_updated(self, user_id):
+        found = await get_user_by_id(self, user_id)
+        await user_cache.delete(user_id)
+        return found
+
+    monkeypatch.setattr(UserService, "get_user_by_id", get_user_while_updated)
+
+    async def authenticate():
+        await user_cache.clear()
+
+        async with db.async_session() as session:
+            await get_current_user(token, session)
+
+        return await user_cache.get(user["id"])
+
+    assert run(authenticate()) is None
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    yield
+    asyncio.run(user_cache.clear())
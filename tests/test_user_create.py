@@ -0,0 +1,33 @@
+from uuid import uuid4
+
+from src.db import db
+
+
+def test_creating_a_user_runs_a_single_insert(client):
+    statements = []
+    observer = lambda statement, parameters, seconds: statements.append(statement)  # noqa: E731
+    db.add_statement_observer(observer)
+
+    try:
+        response = client.post("/user/", json={"name": "New", "email": f"{uuid4().hex}@example.com", "password": "pw"})
+    finally:
+        db.statement_observers.remove(observer)
+
+    user = response.json()
+    writes = [statement for statement in statements if not statement.lstrip().upper().startswith("SELECT")]
+
+    assert response.status_code == 200
+    assert user["id"] and user["created_at"] and "password" not in user
+    assert len(writes) == 1 and writes[0].lstrip().upper().startswith("INSERT INTO USERS")
+
+
+def test_duplicated_emails_are_rejected_by_the_unique_constraint(client):
+    email = f"{uuid4().hex}@example.com"
+    body = {"name": "New", "email": email, "password": "pw"}
+
+    assert client.post("/user/", json=body).status_code == 200
+
+    duplicate = client.post("/user/", json=body)
+
+    assert duplicate.status_code == 409
+    assert client.post("/user/login", json={"email": email, "password": "pw"}).status_code == 200
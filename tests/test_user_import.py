@@ -0,0 +1,96 @@
+import asyncio
+import codecs
+import json
+from uuid import uuid4
+
+from src.services.user_import import iter_lines, iter_records
+
+
+async def chunked(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+def test_lines_are_split_across_chunks():
+    lines = asyncio.run(collect(iter_lines(chunked(b"a,b\r\nc", "ã,d\n\n".encode()[:2], "ã,d\n\n".encode()[2:], b"e"), 10)))
+
+    assert lines == ["a,b", "cã,d", "e"]
+
+
+def test_a_byte_order_mark_split_across_chunks_is_dropped():
+    lines = asyncio.run(collect(iter_lines(chunked(codecs.BOM_UTF8[:2], codecs.BOM_UTF8[2:] + b"name,email\n"), 20)))
+
+    assert lines == ["name,email"]
+
+
+def test_long_lines_are_skipped_whether_or_not_they_fit_a_chunk():
+    lines = asyncio.run(collect(iter_lines(chunked(b"ok\n", b"x" * 8, b"x" * 8, b"\nok\n", b"y" * 12 + b"\n", b"z" * 12), 10)))
+
+    assert lines == ["ok", None, "ok", None, None]
+
+
+def test_records_are_parsed_from_csv_and_ndjson():
+    async def records(lines, import_format):
+        async def iterate():
+            for line in lines:
+                yield line
+
+        return await collect(iter_records(iterate(), import_format))
+
+    csv_records = asyncio.run(records(['Name,Email', '"Silva, Ana",ana@example.com', "missing", None], "csv"))
+    ndjson_records = asyncio.run(records(['{"name": "Ana"}', "[1]", "{", None], "ndjson"))
+
+    assert csv_records == [{"name": "Silva, Ana", "email": "ana@example.com"}, None, None]
+    assert ndjson_records == [{"name": "Ana"}, None, None, None]
+
+
+def test_csv_import_reports_every_row(client, admin_headers):
+    taken = f"{uuid4().hex}@example.com"
+    client.post("/user/", json={"name": "Taken", "email": taken, "password": "secret"})
+    fresh = f"{uuid4().hex}@example.com"
+    body = "\n".join([
+        "name,email,password",
+        f"Ana,{fresh},secret",
+        f"Ana,{fresh},secret",
+        f"Bia,{taken},secret",
+        "Caio,not-an-email,secret",
+    ])
+
+    response = client.post("/user/import", content=body, headers={**admin_headers, "Content-Type": "text/csv"})
+    reports = [json.loads(line) for line in response.text.splitlines()]
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    # Invalid rows are reported as they are read, the others once their batch is inserted.
+    assert {report["row"]: report["status"] for report in reports[:-1]} == {
+        1: "created", 2: "conflict", 3: "conflict", 4: "invalid"
+    }
+    assert reports[-1] == {"status": "summary", "created": 1, "conflict": 2, "invalid": 1}
+    assert "secret" not in response.text
+    assert client.post("/user/login", json={"email": fresh, "password": "secret"}).status_code == 200
+
+
+def test_ndjson_import_creates_users(client, admin_headers):
+    emails = [f"{uuid4().hex}@example.com" for _ in range(3)]
+    body = "".join(json.dumps({"name": "Bulk", "email": email, "password": "secret"}) + "\n" for email in emails)
+
+    response = client.post(
+        "/user/import", content=body, headers={**admin_headers, "Content-Type": "application/x-ndjson"}
+    )
+    reports = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [report["email"] for report in reports[:-1]] == emails
+    assert reports[-1]["created"] == 3
+
+
+def test_import_rejects_other_content_types_and_non_administrators(client, signup, admin_headers):
+    _, headers = signup()
+
+    response = client.post("/user/import", content="{}", headers={**admin_headers, "Content-Type": "application/json"})
+    assert response.status_code == 415
+
+    response = client.post("/user/import", content="name,email,password\n", headers={**headers, "Content-Type": "text/csv"})
+    assert response.status_code == 403
@@ -0,0 +1,45 @@
+from src.db import db
+from src.db.models import UserModel
+from src.db.repositories import UserRepository
+from src.db.repositories.user import USER_RESPONSE_COLUMNS, user_row_query
+from src.schemas import UserResponse
+from tests.conftest import run
+
+
+def test_user_queries_are_built_once_per_projection():
+    assert user_row_query(USER_RESPONSE_COLUMNS, "id") is user_row_query(USER_RESPONSE_COLUMNS, "id")
+    assert user_row_query(USER_RESPONSE_COLUMNS, "id") is not user_row_query(USER_RESPONSE_COLUMNS, "email")
+
+
+def test_user_responses_select_only_their_columns(signup):
+    user, _ = signup()
+    statements = []
+    observer = lambda statement, parameters, seconds: statements.append(statement)  # noqa: E731
+
+    async def lookup():
+        async with db.async_session() as session:
+            repository = UserRepository(session)
+            return (
+                await repository.get_user_response(user_id=user["id"]),
+                await repository.get_user_row(UserModel.id, UserModel.password, email=user["email"]),
+            )
+
+    db.add_statement_observer(observer)
+
+    try:
+        response, credentials = run(lookup())
+    finally:
+        db.statement_observers.remove(observer)
+
+    assert isinstance(response, UserResponse)
+    assert response.model_dump(mode="json") == user
+    assert "password" not in statements[0]
+    assert credentials.id == user["id"] and credentials.password.startswith("$2")
+
+
+def test_unknown_users_are_none():
+    async def lookup():
+        async with db.async_session() as session:
+            return await UserRepository(session).get_user_response(user_id="missing")
+
+    assert run(lookup()) is None
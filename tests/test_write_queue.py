@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from src.core import DatabaseHandler
+from src.core.write_queue import WriteQueue
+
+PRAGMAS = {"journal_mode": "WAL", "synchronous": "NORMAL", "busy_timeout": 5000}
+
+
+def insert(value: int):
+    async def job(session):
+        if value < 0:
+            raise ValueError(value)
+
+        await session.execute(text("INSERT INTO t (x) VALUES (:x)"), {"x": value})
+        return value
+
+    return job
+
+
+async def with_handler(path, scenario):
+    handler = DatabaseHandler(f"sqlite+aiosqlite:///{path}/queue.db", sqlite_pragmas=PRAGMAS, write_queue=True)
+
+    async with handler.engine.begin() as conn:
+        await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+
+    try:
+        return await scenario(handler)
+    finally:
+        await handler.close()
+
+
+async def stored(handler) -> list[int]:
+    async with handler.engine.connect() as conn:
+        return sorted((await conn.execute(text("SELECT x FROM t"))).scalars())
+
+
+def test_concurrent_writes_are_committed_in_batches(tmp_path):
+    async def scenario(handler):
+        async with handler.async_session() as session:
+            results = await asyncio.gather(*(handler.run_write(insert(value), session) for value in range(20)))
+
+        async with handler.engine.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+
+        return results, await stored(handler), handler.write_queue, journal_mode
+
+    results, rows, queue, journal_mode = asyncio.run(with_handler(tmp_path, scenario))
+
+    assert results == rows == list(range(20))
+    assert queue.jobs == 20 and queue.batches < 20
+    assert journal_mode == "wal"
+
+
+def test_a_failing_job_does_not_fail_its_batch(tmp_path):
+    async def scenario(handler):
+        async with handler.async_session() as session:
+            results = await asyncio.gather(
+                *(handler.run_write(insert(value), session) for value in (1, -1, 2)),
+                return_exceptions=True
+            )
+
+        return results, await stored(handler)
+
+    results, rows = asyncio.run(with_handler(tmp_path, scenario))
+
+    assert results[0] == 1 and results[2] == 2
+    assert isinstance(results[1], ValueError)
+    assert rows == [1, 2]
+
+
+class BrokenSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    async def commit(self):
+        raise RuntimeError("commit failed")
+
+    async def rollback(self):
+        raise RuntimeError("rollback failed")
+
+    def expunge_all(self):
+        pass
+
+
+def test_pending_writes_fail_when_the_worker_dies():
+    queue = WriteQueue(BrokenSession)
+
+    async def job(session):
+        return "ok"
+
+    async def scenario():
+        results = await asyncio.wait_for(
+            asyncio.gather(*(queue.submit(job) for _ in range(5)), return_exceptions=True),
+            timeout=5
+        )
+        await queue.close()
+        return results
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_a_cancelled_job_cancels_its_batch_and_the_queue_recovers(tmp_path):
+    async def cancelled(session):
+        raise asyncio.CancelledError
+
+    async def scenario(handler):
+        queue = handler.write_queue
+        first = await asyncio.wait_for(
+            asyncio.gather(queue.submit(cancelled), queue.submit(insert(1)), return_exceptions=True),
+            timeout=5
+        )
+        second = await queue.submit(insert(2))
+        return first, second, await stored(handler)
+
+    first, second, rows = asyncio.run(with_handler(tmp_path, scenario))
+
+    assert all(isinstance(result, asyncio.CancelledError) for result in first)
+    assert second == 2
+    assert rows == [2]
+
+
+@pytest.mark.parametrize("batch_size", [1, 3])
+def test_batches_respect_the_maximum_size(tmp_path, batch_size):
+    async def scenario(handler):
+        handler.write_queue.max_batch_size = batch_size
+
+        async with handler.async_session() as session:
+            await asyncio.gather(*(handler.run_write(insert(value), session) for value in range(6)))
+
+        return handler.write_queue.batches
+
+    assert asyncio.run(with_handler(tmp_path, scenario)) >= 6 // batch_size